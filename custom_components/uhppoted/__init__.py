@@ -1,3 +1,4 @@
+import datetime
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -5,7 +6,9 @@ _LOGGER = logging.getLogger(__name__)
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import async_track_time_interval
 
 from .const import DOMAIN
 from .const import CONF_BIND_ADDR
@@ -34,9 +37,47 @@ from .const import CONF_CACHE_EXPIRY_STATUS
 from .const import CONF_CACHE_EXPIRY_INTERLOCK
 from .const import CONF_CACHE_EXPIRY_ANTIPASSBACK
 from .const import CONF_CACHE_EXPIRY_EVENT
+from .const import CONF_CACHE_BUDGET_CONTROLLER
+from .const import CONF_CACHE_BUDGET_LISTENER
+from .const import CONF_CACHE_BUDGET_DATETIME
+from .const import CONF_CACHE_BUDGET_DOOR
+from .const import CONF_CACHE_BUDGET_CARD
+from .const import CONF_CACHE_BUDGET_STATUS
+from .const import CONF_CACHE_BUDGET_INTERLOCK
+from .const import CONF_CACHE_BUDGET_ANTIPASSBACK
+from .const import CONF_CACHE_BUDGET_EVENT
+from .const import CONF_CACHE_ADAPTIVE_ENABLED
+from .const import CONF_CACHE_ADAPTIVE_MIN
+from .const import CONF_CACHE_ADAPTIVE_MAX
+from .const import CONF_CACHE_SNAPSHOT_ENABLED
+from .const import CONF_CACHE_SNAPSHOT_INTERVAL
+
+from .const import CONF_QUEUE_WORKERS
+from .const import CONF_QUEUE_MAX_WORKERS
+from .const import CONF_CARDS_WINDOW
+from .const import CONF_CARDS_MIRROR_ENABLED
+from .const import CONF_CARDS_MIRROR_INTERVAL
+from .const import CONF_CARDS_MIRROR_SAMPLES
+from .const import CONF_CARDS_ROTATION_SLICE
+from .const import CONF_CARDS_ROTATION_MAX_AGE
+from .const import CONF_PACING_ENABLED
+from .const import CONF_PACING_CONTROLLER_RATE
+from .const import CONF_PACING_CONTROLLER_BURST
+from .const import CONF_PACING_NETWORK_RATE
+from .const import CONF_PACING_NETWORK_BURST
+from .const import CONF_ADAPTIVE_TIMEOUT_ENABLED
+from .const import CONF_ADAPTIVE_TIMEOUT_MIN
+from .const import CONF_ADAPTIVE_TIMEOUT_MAX
+from .const import CONF_BREAKER_ENABLED
+from .const import CONF_BREAKER_THRESHOLD
+from .const import CONF_BREAKER_PROBE_INTERVAL
+from .const import CONF_BREAKER_MAX_PROBE_INTERVAL
 
 from .const import CONF_EVENTS_LISTENER_ENABLED
 from .const import CONF_EVENTS_LISTENER_MAX_BACKOFF
+from .const import CONF_EVENTS_CATCHUP_WINDOW
+from .const import CONF_EVENTS_CATCHUP_BATCH
+from .const import CONF_PUBLISH_WINDOW
 from .const import CONF_EVENTS_CARDS_ENABLED
 from .const import CONF_EVENTS_DOORS_ENABLED
 from .const import CONF_EVENTS_CONTROLLERS_ENABLED
@@ -65,9 +106,47 @@ from .const import DEFAULT_CACHE_EXPIRY_STATUS
 from .const import DEFAULT_CACHE_EXPIRY_INTERLOCK
 from .const import DEFAULT_CACHE_EXPIRY_ANTIPASSBACK
 from .const import DEFAULT_CACHE_EXPIRY_EVENT
+from .const import DEFAULT_CACHE_BUDGET_CONTROLLER
+from .const import DEFAULT_CACHE_BUDGET_LISTENER
+from .const import DEFAULT_CACHE_BUDGET_DATETIME
+from .const import DEFAULT_CACHE_BUDGET_DOOR
+from .const import DEFAULT_CACHE_BUDGET_CARD
+from .const import DEFAULT_CACHE_BUDGET_STATUS
+from .const import DEFAULT_CACHE_BUDGET_INTERLOCK
+from .const import DEFAULT_CACHE_BUDGET_ANTIPASSBACK
+from .const import DEFAULT_CACHE_BUDGET_EVENT
+from .const import DEFAULT_CACHE_ADAPTIVE_ENABLED
+from .const import DEFAULT_CACHE_ADAPTIVE_MIN
+from .const import DEFAULT_CACHE_ADAPTIVE_MAX
+from .const import DEFAULT_CACHE_SNAPSHOT_ENABLED
+from .const import DEFAULT_CACHE_SNAPSHOT_INTERVAL
+
+from .const import DEFAULT_QUEUE_WORKERS
+from .const import DEFAULT_QUEUE_MAX_WORKERS
+from .const import DEFAULT_CARDS_WINDOW
+from .const import DEFAULT_CARDS_MIRROR_ENABLED
+from .const import DEFAULT_CARDS_MIRROR_INTERVAL
+from .const import DEFAULT_CARDS_MIRROR_SAMPLES
+from .const import DEFAULT_CARDS_ROTATION_SLICE
+from .const import DEFAULT_CARDS_ROTATION_MAX_AGE
+from .const import DEFAULT_PACING_ENABLED
+from .const import DEFAULT_PACING_CONTROLLER_RATE
+from .const import DEFAULT_PACING_CONTROLLER_BURST
+from .const import DEFAULT_PACING_NETWORK_RATE
+from .const import DEFAULT_PACING_NETWORK_BURST
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_ENABLED
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_MIN
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_MAX
+from .const import DEFAULT_BREAKER_ENABLED
+from .const import DEFAULT_BREAKER_THRESHOLD
+from .const import DEFAULT_BREAKER_PROBE_INTERVAL
+from .const import DEFAULT_BREAKER_MAX_PROBE_INTERVAL
 
 from .const import DEFAULT_EVENTS_LISTENER_ENABLED
 from .const import DEFAULT_EVENTS_LISTENER_MAX_BACKOFF
+from .const import DEFAULT_EVENTS_CATCHUP_WINDOW
+from .const import DEFAULT_EVENTS_CATCHUP_BATCH
+from .const import DEFAULT_PUBLISH_WINDOW
 from .const import DEFAULT_EVENTS_CARDS_ENABLED
 from .const import DEFAULT_EVENTS_DOORS_ENABLED
 from .const import DEFAULT_EVENTS_CONTROLLERS_ENABLED
@@ -76,6 +155,8 @@ from .const import DEFAULT_PERSISTED_ENTITIES
 
 from .const import STORAGE_VERSION
 from .const import STORAGE_KEY_INTERLOCK
+from .const import STORAGE_KEY_CACHE
+from .const import STORAGE_KEY_EVENTS
 
 from .coordinators.coordinators import Coordinators
 from .services.services import Services
@@ -123,11 +204,62 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         CONF_CACHE_EXPIRY_INTERLOCK: DEFAULT_CACHE_EXPIRY_INTERLOCK,
         CONF_CACHE_EXPIRY_ANTIPASSBACK: DEFAULT_CACHE_EXPIRY_ANTIPASSBACK,
         CONF_CACHE_EXPIRY_EVENT: DEFAULT_CACHE_EXPIRY_EVENT,
+        CONF_CACHE_BUDGET_CONTROLLER: DEFAULT_CACHE_BUDGET_CONTROLLER,
+        CONF_CACHE_BUDGET_LISTENER: DEFAULT_CACHE_BUDGET_LISTENER,
+        CONF_CACHE_BUDGET_DATETIME: DEFAULT_CACHE_BUDGET_DATETIME,
+        CONF_CACHE_BUDGET_DOOR: DEFAULT_CACHE_BUDGET_DOOR,
+        CONF_CACHE_BUDGET_CARD: DEFAULT_CACHE_BUDGET_CARD,
+        CONF_CACHE_BUDGET_STATUS: DEFAULT_CACHE_BUDGET_STATUS,
+        CONF_CACHE_BUDGET_INTERLOCK: DEFAULT_CACHE_BUDGET_INTERLOCK,
+        CONF_CACHE_BUDGET_ANTIPASSBACK: DEFAULT_CACHE_BUDGET_ANTIPASSBACK,
+        CONF_CACHE_BUDGET_EVENT: DEFAULT_CACHE_BUDGET_EVENT,
+        CONF_CACHE_ADAPTIVE_ENABLED: DEFAULT_CACHE_ADAPTIVE_ENABLED,
+        CONF_CACHE_ADAPTIVE_MIN: DEFAULT_CACHE_ADAPTIVE_MIN,
+        CONF_CACHE_ADAPTIVE_MAX: DEFAULT_CACHE_ADAPTIVE_MAX,
+        CONF_CACHE_SNAPSHOT_ENABLED: DEFAULT_CACHE_SNAPSHOT_ENABLED,
+        CONF_CACHE_SNAPSHOT_INTERVAL: DEFAULT_CACHE_SNAPSHOT_INTERVAL,
+
+        # background task queue
+        CONF_QUEUE_WORKERS: DEFAULT_QUEUE_WORKERS,
+        CONF_QUEUE_MAX_WORKERS: DEFAULT_QUEUE_MAX_WORKERS,
+
+        # bulk card requests
+        CONF_CARDS_WINDOW: DEFAULT_CARDS_WINDOW,
+        CONF_CARDS_MIRROR_ENABLED: DEFAULT_CARDS_MIRROR_ENABLED,
+        CONF_CARDS_MIRROR_INTERVAL: DEFAULT_CARDS_MIRROR_INTERVAL,
+        CONF_CARDS_MIRROR_SAMPLES: DEFAULT_CARDS_MIRROR_SAMPLES,
+        CONF_CARDS_ROTATION_SLICE: DEFAULT_CARDS_ROTATION_SLICE,
+        CONF_CARDS_ROTATION_MAX_AGE: DEFAULT_CARDS_ROTATION_MAX_AGE,
+
+        # request pacing
+        CONF_PACING_ENABLED: DEFAULT_PACING_ENABLED,
+        CONF_PACING_CONTROLLER_RATE: DEFAULT_PACING_CONTROLLER_RATE,
+        CONF_PACING_CONTROLLER_BURST: DEFAULT_PACING_CONTROLLER_BURST,
+        CONF_PACING_NETWORK_RATE: DEFAULT_PACING_NETWORK_RATE,
+        CONF_PACING_NETWORK_BURST: DEFAULT_PACING_NETWORK_BURST,
+
+        # adaptive request timeouts
+        CONF_ADAPTIVE_TIMEOUT_ENABLED: DEFAULT_ADAPTIVE_TIMEOUT_ENABLED,
+        CONF_ADAPTIVE_TIMEOUT_MIN: DEFAULT_ADAPTIVE_TIMEOUT_MIN,
+        CONF_ADAPTIVE_TIMEOUT_MAX: DEFAULT_ADAPTIVE_TIMEOUT_MAX,
+
+        # circuit breaker
+        CONF_BREAKER_ENABLED: DEFAULT_BREAKER_ENABLED,
+        CONF_BREAKER_THRESHOLD: DEFAULT_BREAKER_THRESHOLD,
+        CONF_BREAKER_PROBE_INTERVAL: DEFAULT_BREAKER_PROBE_INTERVAL,
+        CONF_BREAKER_MAX_PROBE_INTERVAL: DEFAULT_BREAKER_MAX_PROBE_INTERVAL,
 
         # event listener
         CONF_EVENTS_LISTENER_ENABLED: DEFAULT_EVENTS_LISTENER_ENABLED,
         CONF_EVENTS_LISTENER_MAX_BACKOFF: DEFAULT_EVENTS_LISTENER_MAX_BACKOFF,
 
+        # event backlog
+        CONF_EVENTS_CATCHUP_WINDOW: DEFAULT_EVENTS_CATCHUP_WINDOW,
+        CONF_EVENTS_CATCHUP_BATCH: DEFAULT_EVENTS_CATCHUP_BATCH,
+
+        # entity updates
+        CONF_PUBLISH_WINDOW: DEFAULT_PUBLISH_WINDOW,
+
         # events opt-out
         CONF_EVENTS_CARDS_ENABLED: DEFAULT_EVENTS_CARDS_ENABLED,
         CONF_EVENTS_DOORS_ENABLED: DEFAULT_EVENTS_DOORS_ENABLED,
@@ -174,6 +306,63 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 defaults[CONF_CACHE_EXPIRY_INTERLOCK] = expiry.get('interlock', DEFAULT_CACHE_EXPIRY_INTERLOCK)
                 defaults[CONF_CACHE_EXPIRY_ANTIPASSBACK] = expiry.get('antipassback', DEFAULT_CACHE_EXPIRY_ANTIPASSBACK)
                 defaults[CONF_CACHE_EXPIRY_EVENT] = expiry.get('event', DEFAULT_CACHE_EXPIRY_EVENT)
+            if budget := caching.get('budget'):
+                defaults[CONF_CACHE_BUDGET_CONTROLLER] = budget.get('controller', DEFAULT_CACHE_BUDGET_CONTROLLER)
+                defaults[CONF_CACHE_BUDGET_LISTENER] = budget.get('listener', DEFAULT_CACHE_BUDGET_LISTENER)
+                defaults[CONF_CACHE_BUDGET_DATETIME] = budget.get('datetime', DEFAULT_CACHE_BUDGET_DATETIME)
+                defaults[CONF_CACHE_BUDGET_DOOR] = budget.get('door', DEFAULT_CACHE_BUDGET_DOOR)
+                defaults[CONF_CACHE_BUDGET_CARD] = budget.get('card', DEFAULT_CACHE_BUDGET_CARD)
+                defaults[CONF_CACHE_BUDGET_STATUS] = budget.get('status', DEFAULT_CACHE_BUDGET_STATUS)
+                defaults[CONF_CACHE_BUDGET_INTERLOCK] = budget.get('interlock', DEFAULT_CACHE_BUDGET_INTERLOCK)
+                defaults[CONF_CACHE_BUDGET_ANTIPASSBACK] = budget.get('antipassback', DEFAULT_CACHE_BUDGET_ANTIPASSBACK)
+                defaults[CONF_CACHE_BUDGET_EVENT] = budget.get('event', DEFAULT_CACHE_BUDGET_EVENT)
+            if adaptive := caching.get('adaptive'):
+                defaults[CONF_CACHE_ADAPTIVE_ENABLED] = adaptive.get('enabled', DEFAULT_CACHE_ADAPTIVE_ENABLED)
+                defaults[CONF_CACHE_ADAPTIVE_MIN] = adaptive.get('min', DEFAULT_CACHE_ADAPTIVE_MIN)
+                defaults[CONF_CACHE_ADAPTIVE_MAX] = adaptive.get('max', DEFAULT_CACHE_ADAPTIVE_MAX)
+            if snapshot := caching.get('snapshot'):
+                defaults[CONF_CACHE_SNAPSHOT_ENABLED] = snapshot.get('enabled', DEFAULT_CACHE_SNAPSHOT_ENABLED)
+                defaults[CONF_CACHE_SNAPSHOT_INTERVAL] = snapshot.get('interval', DEFAULT_CACHE_SNAPSHOT_INTERVAL)
+
+        # background task queue
+        if queue := c.get('queue'):
+            defaults[CONF_QUEUE_WORKERS] = queue.get('workers', DEFAULT_QUEUE_WORKERS)
+            defaults[CONF_QUEUE_MAX_WORKERS] = queue.get('max_workers', DEFAULT_QUEUE_MAX_WORKERS)
+
+        # bulk card requests
+        if cards := c.get('cards'):
+            defaults[CONF_CARDS_WINDOW] = cards.get('window', DEFAULT_CARDS_WINDOW)
+            if mirror := cards.get('mirror'):
+                defaults[CONF_CARDS_MIRROR_ENABLED] = mirror.get('enabled', DEFAULT_CARDS_MIRROR_ENABLED)
+                defaults[CONF_CARDS_MIRROR_INTERVAL] = mirror.get('interval', DEFAULT_CARDS_MIRROR_INTERVAL)
+                defaults[CONF_CARDS_MIRROR_SAMPLES] = mirror.get('samples', DEFAULT_CARDS_MIRROR_SAMPLES)
+            if rotation := cards.get('rotation'):
+                defaults[CONF_CARDS_ROTATION_SLICE] = rotation.get('slice', DEFAULT_CARDS_ROTATION_SLICE)
+                defaults[CONF_CARDS_ROTATION_MAX_AGE] = rotation.get('max_age', DEFAULT_CARDS_ROTATION_MAX_AGE)
+
+        # request pacing
+        if pacing := c.get('pacing'):
+            defaults[CONF_PACING_ENABLED] = pacing.get('enabled', DEFAULT_PACING_ENABLED)
+            if controller := pacing.get('controller'):
+                defaults[CONF_PACING_CONTROLLER_RATE] = controller.get('rate', DEFAULT_PACING_CONTROLLER_RATE)
+                defaults[CONF_PACING_CONTROLLER_BURST] = controller.get('burst', DEFAULT_PACING_CONTROLLER_BURST)
+            if network := pacing.get('network'):
+                defaults[CONF_PACING_NETWORK_RATE] = network.get('rate', DEFAULT_PACING_NETWORK_RATE)
+                defaults[CONF_PACING_NETWORK_BURST] = network.get('burst', DEFAULT_PACING_NETWORK_BURST)
+
+        # adaptive request timeouts
+        if adaptive := c.get('adaptive_timeout'):
+            defaults[CONF_ADAPTIVE_TIMEOUT_ENABLED] = adaptive.get('enabled', DEFAULT_ADAPTIVE_TIMEOUT_ENABLED)
+            defaults[CONF_ADAPTIVE_TIMEOUT_MIN] = adaptive.get('min', DEFAULT_ADAPTIVE_TIMEOUT_MIN)
+            defaults[CONF_ADAPTIVE_TIMEOUT_MAX] = adaptive.get('max', DEFAULT_ADAPTIVE_TIMEOUT_MAX)
+
+        # circuit breaker
+        if breaker := c.get('breaker'):
+            defaults[CONF_BREAKER_ENABLED] = breaker.get('enabled', DEFAULT_BREAKER_ENABLED)
+            defaults[CONF_BREAKER_THRESHOLD] = breaker.get('threshold', DEFAULT_BREAKER_THRESHOLD)
+            defaults[CONF_BREAKER_PROBE_INTERVAL] = breaker.get('probe_interval', DEFAULT_BREAKER_PROBE_INTERVAL)
+            defaults[CONF_BREAKER_MAX_PROBE_INTERVAL] = breaker.get('max_probe_interval',
+                                                                    DEFAULT_BREAKER_MAX_PROBE_INTERVAL)
 
         # event listener
         if events := c.get('events'):
@@ -181,6 +370,14 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 defaults[CONF_EVENTS_LISTENER_ENABLED] = listener.get('enabled', DEFAULT_EVENTS_LISTENER_ENABLED)
                 defaults[CONF_EVENTS_LISTENER_MAX_BACKOFF] = listener.get('max_backoff',
                                                                           DEFAULT_EVENTS_LISTENER_MAX_BACKOFF)
+            if catchup := events.get('catchup'):
+                defaults[CONF_EVENTS_CATCHUP_WINDOW] = catchup.get('window', DEFAULT_EVENTS_CATCHUP_WINDOW)
+                defaults[CONF_EVENTS_CATCHUP_BATCH] = catchup.get('batch', DEFAULT_EVENTS_CATCHUP_BATCH)
+
+        # entity updates
+        if publish := c.get('publish'):
+            defaults[CONF_PUBLISH_WINDOW] = publish.get('window', DEFAULT_PUBLISH_WINDOW)
+
         # events opt-out
         if events := c.get('events'):
             if cards := events.get('cards'):
@@ -222,10 +419,59 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     _LOGGER.info(f'cache.expiry - interlock:     {defaults[CONF_CACHE_EXPIRY_INTERLOCK]}')
     _LOGGER.info(f'cache.expiry - antipassback:  {defaults[CONF_CACHE_EXPIRY_ANTIPASSBACK]}')
     _LOGGER.info(f'cache.expiry - event:         {defaults[CONF_CACHE_EXPIRY_EVENT]}')
+    _LOGGER.info(f'cache.budget - controller:    {defaults[CONF_CACHE_BUDGET_CONTROLLER]}')
+    _LOGGER.info(f'cache.budget - listener:      {defaults[CONF_CACHE_BUDGET_LISTENER]}')
+    _LOGGER.info(f'cache.budget - date/time:     {defaults[CONF_CACHE_BUDGET_DATETIME]}')
+    _LOGGER.info(f'cache.budget - door:          {defaults[CONF_CACHE_BUDGET_DOOR]}')
+    _LOGGER.info(f'cache.budget - card:          {defaults[CONF_CACHE_BUDGET_CARD]}')
+    _LOGGER.info(f'cache.budget - status:        {defaults[CONF_CACHE_BUDGET_STATUS]}')
+    _LOGGER.info(f'cache.budget - interlock:     {defaults[CONF_CACHE_BUDGET_INTERLOCK]}')
+    _LOGGER.info(f'cache.budget - antipassback:  {defaults[CONF_CACHE_BUDGET_ANTIPASSBACK]}')
+    _LOGGER.info(f'cache.budget - event:         {defaults[CONF_CACHE_BUDGET_EVENT]}')
+    _LOGGER.info(f'cache.adaptive.enabled:       {defaults[CONF_CACHE_ADAPTIVE_ENABLED]}')
+    _LOGGER.info(f'cache.adaptive.min:           {defaults[CONF_CACHE_ADAPTIVE_MIN]}')
+    _LOGGER.info(f'cache.adaptive.max:           {defaults[CONF_CACHE_ADAPTIVE_MAX]}')
+    _LOGGER.info(f'cache.snapshot.enabled:       {defaults[CONF_CACHE_SNAPSHOT_ENABLED]}')
+    _LOGGER.info(f'cache.snapshot.interval:      {defaults[CONF_CACHE_SNAPSHOT_INTERVAL]}s')
+
+    # background task queue
+    _LOGGER.info(f'queue.workers:                {defaults[CONF_QUEUE_WORKERS]}')
+    _LOGGER.info(f'queue.max_workers:            {defaults[CONF_QUEUE_MAX_WORKERS]}')
+
+    # bulk card requests
+    _LOGGER.info(f'cards.window:                 {defaults[CONF_CARDS_WINDOW]}')
+    _LOGGER.info(f'cards.mirror.enabled:         {defaults[CONF_CARDS_MIRROR_ENABLED]}')
+    _LOGGER.info(f'cards.mirror.interval:        {defaults[CONF_CARDS_MIRROR_INTERVAL]}')
+    _LOGGER.info(f'cards.mirror.samples:         {defaults[CONF_CARDS_MIRROR_SAMPLES]}')
+    _LOGGER.info(f'cards.rotation.slice:         {defaults[CONF_CARDS_ROTATION_SLICE]}')
+    _LOGGER.info(f'cards.rotation.max_age:       {defaults[CONF_CARDS_ROTATION_MAX_AGE]}s')
+
+    # request pacing
+    _LOGGER.info(f'pacing.enabled:               {defaults[CONF_PACING_ENABLED]}')
+    _LOGGER.info(f'pacing.controller - rate:     {defaults[CONF_PACING_CONTROLLER_RATE]}')
+    _LOGGER.info(f'pacing.controller - burst:    {defaults[CONF_PACING_CONTROLLER_BURST]}')
+    _LOGGER.info(f'pacing.network - rate:        {defaults[CONF_PACING_NETWORK_RATE]}')
+    _LOGGER.info(f'pacing.network - burst:       {defaults[CONF_PACING_NETWORK_BURST]}')
+
+    # adaptive request timeouts
+    _LOGGER.info(f'adaptive_timeout.enabled:     {defaults[CONF_ADAPTIVE_TIMEOUT_ENABLED]}')
+    _LOGGER.info(f'adaptive_timeout.min:         {defaults[CONF_ADAPTIVE_TIMEOUT_MIN]}s')
+    _LOGGER.info(f'adaptive_timeout.max:         {defaults[CONF_ADAPTIVE_TIMEOUT_MAX]}s')
+
+    # circuit breaker
+    _LOGGER.info(f'breaker.enabled:              {defaults[CONF_BREAKER_ENABLED]}')
+    _LOGGER.info(f'breaker.threshold:            {defaults[CONF_BREAKER_THRESHOLD]}')
+    _LOGGER.info(f'breaker.probe_interval:       {defaults[CONF_BREAKER_PROBE_INTERVAL]}s')
+    _LOGGER.info(f'breaker.max_probe_interval:   {defaults[CONF_BREAKER_MAX_PROBE_INTERVAL]}s')
 
     # event listener
     _LOGGER.info(f'events.listener.enabled:      {defaults[CONF_EVENTS_LISTENER_ENABLED]}')
     _LOGGER.info(f'events.listener.max-backoff:  {defaults[CONF_EVENTS_LISTENER_MAX_BACKOFF]}')
+    _LOGGER.info(f'events.catchup.window:        {defaults[CONF_EVENTS_CATCHUP_WINDOW]}')
+    _LOGGER.info(f'events.catchup.batch:         {defaults[CONF_EVENTS_CATCHUP_BATCH]}')
+
+    # entity updates
+    _LOGGER.info(f'publish.window:               {defaults[CONF_PUBLISH_WINDOW]}s')
 
     # events opt-out
     _LOGGER.info(f'events.cards.enabled:         {defaults[CONF_EVENTS_CARDS_ENABLED]}')
@@ -258,6 +504,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     Coordinators.initialise(hass, entry.entry_id, entry.options)
     Services.initialise(hass, entry.entry_id, entry.options)
 
+    # ... warm start driver cache
+    await _restore_cache(hass, entry)
+
+    # ... restore last retrieved events
+    await _restore_events(hass, entry)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
@@ -281,11 +533,77 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # ... unload
     ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
+    # ... save driver cache snapshot
+    await _save_cache(hass, entry)
+
     # ... post-unload: shut down data-coordinators
     Coordinators.unload(hass, entry.entry_id)
 
     return ok
 
 
+# NTS: removes the persisted driver cache snapshot and event index for a deleted config entry
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    try:
+        await Store(hass, STORAGE_VERSION, f'{STORAGE_KEY_CACHE}.{entry.entry_id}').async_remove()
+    except Exception as err:
+        _LOGGER.warning(f'error removing cache snapshot ({err})')
+
+    try:
+        await Store(hass, STORAGE_VERSION, f'{STORAGE_KEY_EVENTS}.{entry.entry_id}').async_remove()
+    except Exception as err:
+        _LOGGER.warning(f'error removing event index ({err})')
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+# NTS: the driver cache is snapshotted periodically, on shutdown and on unload and restored on startup so that
+#      entities are available immediately (with the restored values) while the refresh is spread out over the
+#      background task queue
+async def _restore_cache(hass: HomeAssistant, entry: ConfigEntry):
+    defaults = hass.data[DOMAIN]
+    driver = Coordinators.driver(entry.entry_id)
+
+    if driver and driver.cache_enabled and defaults.get(CONF_CACHE_SNAPSHOT_ENABLED, DEFAULT_CACHE_SNAPSHOT_ENABLED):
+        store = Store(hass, STORAGE_VERSION, f'{STORAGE_KEY_CACHE}.{entry.entry_id}')
+        interval = datetime.timedelta(
+            seconds=defaults.get(CONF_CACHE_SNAPSHOT_INTERVAL, DEFAULT_CACHE_SNAPSHOT_INTERVAL))
+
+        hass.data[DOMAIN][entry.entry_id]['store']['cache'] = store
+
+        try:
+            driver.restore(await store.async_load())
+        except Exception as err:
+            _LOGGER.warning(f'error restoring cache snapshot ({err})')
+
+        async def save(*args):
+            await _save_cache(hass, entry)
+
+        entry.async_on_unload(async_track_time_interval(hass, save, interval))
+        entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, save))
+
+
+# NTS: the events coordinator schedules a (delayed) save whenever the event index for a controller changes
+async def _restore_events(hass: HomeAssistant, entry: ConfigEntry):
+    coordinator = Coordinators.events(entry.entry_id)
+
+    if coordinator:
+        store = Store(hass, STORAGE_VERSION, f'{STORAGE_KEY_EVENTS}.{entry.entry_id}')
+
+        try:
+            coordinator.restore(store, await store.async_load())
+        except Exception as err:
+            _LOGGER.warning(f'error restoring event index ({err})')
+
+
+async def _save_cache(hass: HomeAssistant, entry: ConfigEntry):
+    driver = Coordinators.driver(entry.entry_id)
+    store = hass.data[DOMAIN].get(entry.entry_id, {}).get('store', {}).get('cache')
+
+    if driver and store:
+        try:
+            await store.async_save(driver.snapshot())
+        except Exception as err:
+            _LOGGER.warning(f'error saving cache snapshot ({err})')
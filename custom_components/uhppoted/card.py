@@ -137,6 +137,7 @@ class CardInfo(CoordinatorEntity, SensorEntity):
 class CardHolder(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:card-account-details'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, card, name):
         super().__init__(coordinator, context=int(f'{card}'))
@@ -176,8 +177,10 @@ class CardHolder(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self.card)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -190,6 +193,7 @@ class CardHolder(CoordinatorEntity, SensorEntity):
 class CardStartDate(CoordinatorEntity, DateEntity):
     _attr_icon = 'mdi:card-account-details'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, card, name):
         super().__init__(coordinator, context=int(f'{card}'))
@@ -220,6 +224,8 @@ class CardStartDate(CoordinatorEntity, DateEntity):
         return self._date
 
     async def async_set_value(self, v: datetime.date) -> None:
+        self._revision = None
+
         try:
             if await self.coordinator.set_card_start_date(self.card, v):
                 _LOGGER.info(f'card {self.card} start date updated')
@@ -235,8 +241,10 @@ class CardStartDate(CoordinatorEntity, DateEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self.card)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -263,6 +271,7 @@ class CardStartDate(CoordinatorEntity, DateEntity):
 class CardEndDate(CoordinatorEntity, DateEntity):
     _attr_icon = 'mdi:card-account-details'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, card, name):
         super().__init__(coordinator, context=int(f'{card}'))
@@ -293,6 +302,8 @@ class CardEndDate(CoordinatorEntity, DateEntity):
         return self._date
 
     async def async_set_value(self, v: datetime.date) -> None:
+        self._revision = None
+
         try:
             if await self.coordinator.set_card_end_date(self.card, v):
                 _LOGGER.info(f'card {self.card} end date updated')
@@ -308,8 +319,10 @@ class CardEndDate(CoordinatorEntity, DateEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self.card)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -337,6 +350,7 @@ class CardEndDate(CoordinatorEntity, DateEntity):
 class CardPermission(CoordinatorEntity, SwitchEntity):
     _attr_icon = 'mdi:card-account-details'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, card, name, door):
         super().__init__(coordinator, context=int(f'{card}'))
@@ -379,6 +393,8 @@ class CardPermission(CoordinatorEntity, SwitchEntity):
         }
 
     async def async_turn_on(self, **kwargs):
+        self._revision = None
+
         _LOGGER.debug(f'card:{self.card} enable access for door {self.door[CONF_DOOR_ID]}')
         try:
             await self.coordinator.set_card_permission(self.card, self.door, True)
@@ -392,6 +408,8 @@ class CardPermission(CoordinatorEntity, SwitchEntity):
         await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
+        self._revision = None
+
         _LOGGER.debug(f'card:{self.card} remove access for door {self.door[CONF_DOOR_ID]}')
         try:
             await self.coordinator.set_card_permission(self.card, self.door, False)
@@ -406,8 +424,10 @@ class CardPermission(CoordinatorEntity, SwitchEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self.card)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -438,6 +458,7 @@ class CardPermission(CoordinatorEntity, SwitchEntity):
 class CardPIN(CoordinatorEntity, TextEntity):
     _attr_icon = 'mdi:card-account-details'
     _attr_has_entity_name: True
+    _revision = None
 
     _attr_mode = 'normal'
     _attr_pattern = '[0-9]{0,6}'
@@ -477,6 +498,8 @@ class CardPIN(CoordinatorEntity, TextEntity):
             return ''
 
     async def async_set_value(self, value):
+        self._revision = None
+
         try:
             PIN = 0 if not f'{value}'.isdigit() else int(f'{value}')
 
@@ -494,8 +517,10 @@ class CardPIN(CoordinatorEntity, TextEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self.card)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -53,6 +53,38 @@ from .const import CONF_CACHE_EXPIRY_STATUS
 from .const import CONF_CACHE_EXPIRY_INTERLOCK
 from .const import CONF_CACHE_EXPIRY_ANTIPASSBACK
 from .const import CONF_CACHE_EXPIRY_EVENT
+from .const import CONF_CACHE_BUDGET_CONTROLLER
+from .const import CONF_CACHE_BUDGET_LISTENER
+from .const import CONF_CACHE_BUDGET_DATETIME
+from .const import CONF_CACHE_BUDGET_DOOR
+from .const import CONF_CACHE_BUDGET_CARD
+from .const import CONF_CACHE_BUDGET_STATUS
+from .const import CONF_CACHE_BUDGET_INTERLOCK
+from .const import CONF_CACHE_BUDGET_ANTIPASSBACK
+from .const import CONF_CACHE_BUDGET_EVENT
+from .const import CONF_CACHE_ADAPTIVE_ENABLED
+from .const import CONF_CACHE_ADAPTIVE_MIN
+from .const import CONF_CACHE_ADAPTIVE_MAX
+
+from .const import CONF_QUEUE_WORKERS
+from .const import CONF_QUEUE_MAX_WORKERS
+from .const import CONF_CARDS_WINDOW
+from .const import CONF_EVENTS_CATCHUP_WINDOW
+from .const import CONF_CARDS_MIRROR_ENABLED
+from .const import CONF_CARDS_MIRROR_INTERVAL
+from .const import CONF_CARDS_MIRROR_SAMPLES
+from .const import CONF_PACING_ENABLED
+from .const import CONF_PACING_CONTROLLER_RATE
+from .const import CONF_PACING_CONTROLLER_BURST
+from .const import CONF_PACING_NETWORK_RATE
+from .const import CONF_PACING_NETWORK_BURST
+from .const import CONF_ADAPTIVE_TIMEOUT_ENABLED
+from .const import CONF_ADAPTIVE_TIMEOUT_MIN
+from .const import CONF_ADAPTIVE_TIMEOUT_MAX
+from .const import CONF_BREAKER_ENABLED
+from .const import CONF_BREAKER_THRESHOLD
+from .const import CONF_BREAKER_PROBE_INTERVAL
+from .const import CONF_BREAKER_MAX_PROBE_INTERVAL
 
 from .const import DEFAULT_TIMEOUT
 from .const import DEFAULT_MAX_CARDS
@@ -70,6 +102,38 @@ from .const import DEFAULT_CACHE_EXPIRY_STATUS
 from .const import DEFAULT_CACHE_EXPIRY_INTERLOCK
 from .const import DEFAULT_CACHE_EXPIRY_ANTIPASSBACK
 from .const import DEFAULT_CACHE_EXPIRY_EVENT
+from .const import DEFAULT_CACHE_BUDGET_CONTROLLER
+from .const import DEFAULT_CACHE_BUDGET_LISTENER
+from .const import DEFAULT_CACHE_BUDGET_DATETIME
+from .const import DEFAULT_CACHE_BUDGET_DOOR
+from .const import DEFAULT_CACHE_BUDGET_CARD
+from .const import DEFAULT_CACHE_BUDGET_STATUS
+from .const import DEFAULT_CACHE_BUDGET_INTERLOCK
+from .const import DEFAULT_CACHE_BUDGET_ANTIPASSBACK
+from .const import DEFAULT_CACHE_BUDGET_EVENT
+from .const import DEFAULT_CACHE_ADAPTIVE_ENABLED
+from .const import DEFAULT_CACHE_ADAPTIVE_MIN
+from .const import DEFAULT_CACHE_ADAPTIVE_MAX
+
+from .const import DEFAULT_QUEUE_WORKERS
+from .const import DEFAULT_QUEUE_MAX_WORKERS
+from .const import DEFAULT_CARDS_WINDOW
+from .const import DEFAULT_EVENTS_CATCHUP_WINDOW
+from .const import DEFAULT_CARDS_MIRROR_ENABLED
+from .const import DEFAULT_CARDS_MIRROR_INTERVAL
+from .const import DEFAULT_CARDS_MIRROR_SAMPLES
+from .const import DEFAULT_PACING_ENABLED
+from .const import DEFAULT_PACING_CONTROLLER_RATE
+from .const import DEFAULT_PACING_CONTROLLER_BURST
+from .const import DEFAULT_PACING_NETWORK_RATE
+from .const import DEFAULT_PACING_NETWORK_BURST
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_ENABLED
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_MIN
+from .const import DEFAULT_ADAPTIVE_TIMEOUT_MAX
+from .const import DEFAULT_BREAKER_ENABLED
+from .const import DEFAULT_BREAKER_THRESHOLD
+from .const import DEFAULT_BREAKER_PROBE_INTERVAL
+from .const import DEFAULT_BREAKER_MAX_PROBE_INTERVAL
 
 from .const import ERR_INVALID_CONTROLLER_ID
 from .const import ERR_DUPLICATE_CONTROLLER_ID
@@ -228,7 +292,7 @@ def get_IPv4_addresses():
     return addresses
 
 
-def get_all_controllers(predefined, options):
+async def get_all_controllers(predefined, options):
     controllers = dict()
 
     for v in predefined:
@@ -260,15 +324,15 @@ def get_all_controllers(predefined, options):
                 'protocol': protocol,
             }
 
+    # NTS: discovered controllers are merged as the replies are received, without blocking the event loop. The
+    #      list is only returned once the broadcast timeout (the configured timeout, as set in the flow options) has
+    #      expired, since there's no way of knowing whether all the controllers have replied.
     try:
         bind = options[CONF_BIND_ADDR]
         broadcast = options[CONF_BROADCAST_ADDR]
-        listen = options[CONF_LISTEN_ADDR]
-        debug = options[CONF_DEBUG]
+        timeout = options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
 
-        response = uhppoted.get_all_controllers(bind, broadcast, listen, debug)
-
-        for v in response:
+        async for v in uhppoted.get_all_controllers(bind, broadcast, timeout):
             protocol = 'UDP'
             if v.controller in controllers:
                 protocol = controllers[v.controller].get('protocol', protocol)
@@ -500,6 +564,56 @@ def configure_driver(options, defaults={}):
         CONF_CACHE_EXPIRY_ANTIPASSBACK: defaults.get(CONF_CACHE_EXPIRY_ANTIPASSBACK, DEFAULT_CACHE_EXPIRY_ANTIPASSBACK),
         CONF_CACHE_EXPIRY_EVENT: defaults.get(CONF_CACHE_EXPIRY_EVENT, DEFAULT_CACHE_EXPIRY_EVENT),
     }
+    driver.cache_budget = {
+        CONF_CACHE_EXPIRY_CONTROLLER: defaults.get(CONF_CACHE_BUDGET_CONTROLLER, DEFAULT_CACHE_BUDGET_CONTROLLER),
+        CONF_CACHE_EXPIRY_LISTENER: defaults.get(CONF_CACHE_BUDGET_LISTENER, DEFAULT_CACHE_BUDGET_LISTENER),
+        CONF_CACHE_EXPIRY_DATETIME: defaults.get(CONF_CACHE_BUDGET_DATETIME, DEFAULT_CACHE_BUDGET_DATETIME),
+        CONF_CACHE_EXPIRY_DOOR: defaults.get(CONF_CACHE_BUDGET_DOOR, DEFAULT_CACHE_BUDGET_DOOR),
+        CONF_CACHE_EXPIRY_CARD: defaults.get(CONF_CACHE_BUDGET_CARD, DEFAULT_CACHE_BUDGET_CARD),
+        CONF_CACHE_EXPIRY_STATUS: defaults.get(CONF_CACHE_BUDGET_STATUS, DEFAULT_CACHE_BUDGET_STATUS),
+        CONF_CACHE_EXPIRY_INTERLOCK: defaults.get(CONF_CACHE_BUDGET_INTERLOCK, DEFAULT_CACHE_BUDGET_INTERLOCK),
+        CONF_CACHE_EXPIRY_ANTIPASSBACK: defaults.get(CONF_CACHE_BUDGET_ANTIPASSBACK, DEFAULT_CACHE_BUDGET_ANTIPASSBACK),
+        CONF_CACHE_EXPIRY_EVENT: defaults.get(CONF_CACHE_BUDGET_EVENT, DEFAULT_CACHE_BUDGET_EVENT),
+    }
+
+    driver.cache_adaptive = defaults.get(CONF_CACHE_ADAPTIVE_ENABLED, DEFAULT_CACHE_ADAPTIVE_ENABLED)
+    driver.cache_adaptive_bounds = (
+        defaults.get(CONF_CACHE_ADAPTIVE_MIN, DEFAULT_CACHE_ADAPTIVE_MIN),
+        defaults.get(CONF_CACHE_ADAPTIVE_MAX, DEFAULT_CACHE_ADAPTIVE_MAX),
+    )
+
+    driver.queue_workers = defaults.get(CONF_QUEUE_WORKERS, DEFAULT_QUEUE_WORKERS)
+    driver.queue_max_workers = defaults.get(CONF_QUEUE_MAX_WORKERS, DEFAULT_QUEUE_MAX_WORKERS)
+
+    driver.card_window = defaults.get(CONF_CARDS_WINDOW, DEFAULT_CARDS_WINDOW)
+    driver.card_mirror = defaults.get(CONF_CARDS_MIRROR_ENABLED, DEFAULT_CARDS_MIRROR_ENABLED)
+    driver.card_mirror_interval = defaults.get(CONF_CARDS_MIRROR_INTERVAL, DEFAULT_CARDS_MIRROR_INTERVAL)
+    driver.card_mirror_samples = defaults.get(CONF_CARDS_MIRROR_SAMPLES, DEFAULT_CARDS_MIRROR_SAMPLES)
+
+    driver.event_window = defaults.get(CONF_EVENTS_CATCHUP_WINDOW, DEFAULT_EVENTS_CATCHUP_WINDOW)
+
+    driver.pacing_enabled = defaults.get(CONF_PACING_ENABLED, DEFAULT_PACING_ENABLED)
+    driver.pacing_controller = (
+        defaults.get(CONF_PACING_CONTROLLER_RATE, DEFAULT_PACING_CONTROLLER_RATE),
+        defaults.get(CONF_PACING_CONTROLLER_BURST, DEFAULT_PACING_CONTROLLER_BURST),
+    )
+    driver.pacing_network = (
+        defaults.get(CONF_PACING_NETWORK_RATE, DEFAULT_PACING_NETWORK_RATE),
+        defaults.get(CONF_PACING_NETWORK_BURST, DEFAULT_PACING_NETWORK_BURST),
+    )
+
+    driver.adaptive_timeout = defaults.get(CONF_ADAPTIVE_TIMEOUT_ENABLED, DEFAULT_ADAPTIVE_TIMEOUT_ENABLED)
+    driver.adaptive_timeout_bounds = (
+        defaults.get(CONF_ADAPTIVE_TIMEOUT_MIN, DEFAULT_ADAPTIVE_TIMEOUT_MIN),
+        defaults.get(CONF_ADAPTIVE_TIMEOUT_MAX, DEFAULT_ADAPTIVE_TIMEOUT_MAX),
+    )
+
+    driver.breaker_enabled = defaults.get(CONF_BREAKER_ENABLED, DEFAULT_BREAKER_ENABLED)
+    driver.breaker_threshold = defaults.get(CONF_BREAKER_THRESHOLD, DEFAULT_BREAKER_THRESHOLD)
+    driver.breaker_probe_intervals = (
+        defaults.get(CONF_BREAKER_PROBE_INTERVAL, DEFAULT_BREAKER_PROBE_INTERVAL),
+        defaults.get(CONF_BREAKER_MAX_PROBE_INTERVAL, DEFAULT_BREAKER_MAX_PROBE_INTERVAL),
+    )
 
     return driver
 
@@ -206,7 +206,7 @@ class UhppotedConfigFlow(UhppotedFlow, ConfigFlow, domain=DOMAIN):
         return self.async_show_form(step_id="events", data_schema=schema, errors=errors)
 
     async def async_step_controllers(self, user_input: Optional[Dict[str, Any]] = None):
-        controllers = self._get_all_controllers(self.options)
+        controllers = await self._get_all_controllers(self.options)
 
         self.cache['controllers'] = controllers
 
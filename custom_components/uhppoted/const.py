@@ -61,10 +61,57 @@ CONF_CACHE_EXPIRY_STATUS = 'cache.expiry.status'
 CONF_CACHE_EXPIRY_INTERLOCK = 'cache.expiry.interlock'
 CONF_CACHE_EXPIRY_ANTIPASSBACK = 'cache.expiry.antipassback'
 CONF_CACHE_EXPIRY_EVENT = 'cache.expiry.event'
+CONF_CACHE_BUDGET_CONTROLLER = 'cache.budget.controller'
+CONF_CACHE_BUDGET_LISTENER = 'cache.budget.listener'
+CONF_CACHE_BUDGET_DATETIME = 'cache.budget.datetime'
+CONF_CACHE_BUDGET_DOOR = 'cache.budget.door'
+CONF_CACHE_BUDGET_CARD = 'cache.budget.card'
+CONF_CACHE_BUDGET_STATUS = 'cache.budget.status'
+CONF_CACHE_BUDGET_INTERLOCK = 'cache.budget.interlock'
+CONF_CACHE_BUDGET_ANTIPASSBACK = 'cache.budget.antipassback'
+CONF_CACHE_BUDGET_EVENT = 'cache.budget.event'
+CONF_CACHE_ADAPTIVE_ENABLED = 'cache.adaptive.enabled'
+CONF_CACHE_ADAPTIVE_MIN = 'cache.adaptive.min'
+CONF_CACHE_ADAPTIVE_MAX = 'cache.adaptive.max'
+CONF_CACHE_SNAPSHOT_ENABLED = 'cache.snapshot.enabled'
+CONF_CACHE_SNAPSHOT_INTERVAL = 'cache.snapshot.interval'
+
+# background task queue
+CONF_QUEUE_WORKERS = 'queue.workers'
+CONF_QUEUE_MAX_WORKERS = 'queue.max_workers'
+
+# bulk card requests
+CONF_CARDS_WINDOW = 'cards.window'
+CONF_CARDS_MIRROR_ENABLED = 'cards.mirror.enabled'
+CONF_CARDS_MIRROR_INTERVAL = 'cards.mirror.interval'
+CONF_CARDS_MIRROR_SAMPLES = 'cards.mirror.samples'
+CONF_CARDS_ROTATION_SLICE = 'cards.rotation.slice'
+CONF_CARDS_ROTATION_MAX_AGE = 'cards.rotation.max_age'
+
+# request pacing
+CONF_PACING_ENABLED = 'pacing.enabled'
+CONF_PACING_CONTROLLER_RATE = 'pacing.controller.rate'
+CONF_PACING_CONTROLLER_BURST = 'pacing.controller.burst'
+CONF_PACING_NETWORK_RATE = 'pacing.network.rate'
+CONF_PACING_NETWORK_BURST = 'pacing.network.burst'
+
+CONF_ADAPTIVE_TIMEOUT_ENABLED = 'adaptive_timeout.enabled'
+CONF_ADAPTIVE_TIMEOUT_MIN = 'adaptive_timeout.min'
+CONF_ADAPTIVE_TIMEOUT_MAX = 'adaptive_timeout.max'
+
+CONF_BREAKER_ENABLED = 'breaker.enabled'
+CONF_BREAKER_THRESHOLD = 'breaker.threshold'
+CONF_BREAKER_PROBE_INTERVAL = 'breaker.probe_interval'
+CONF_BREAKER_MAX_PROBE_INTERVAL = 'breaker.max_probe_interval'
 
 # event listener
 CONF_EVENTS_LISTENER_ENABLED = 'events.listener.enabled'
 CONF_EVENTS_LISTENER_MAX_BACKOFF = 'events.listener.max_backoff'
+CONF_EVENTS_CATCHUP_WINDOW = 'events.catchup.window'
+CONF_EVENTS_CATCHUP_BATCH = 'events.catchup.batch'
+
+# entity updates
+CONF_PUBLISH_WINDOW = 'publish.window'
 
 # events opt-out
 CONF_EVENTS_CARDS_ENABLED = 'events.card.enabled'
@@ -151,9 +198,52 @@ DEFAULT_CACHE_EXPIRY_STATUS = 120  # 2 minutes
 DEFAULT_CACHE_EXPIRY_INTERLOCK = None  # NEVER
 DEFAULT_CACHE_EXPIRY_ANTIPASSBACK = 900  # 15 minutes
 DEFAULT_CACHE_EXPIRY_EVENT = 1800  # 30 minutes
+DEFAULT_CACHE_BUDGET_CONTROLLER = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_LISTENER = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_DATETIME = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_DOOR = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_CARD = {'entries': None, 'bytes': 16777216}  # 16MiB
+DEFAULT_CACHE_BUDGET_STATUS = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_INTERLOCK = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_ANTIPASSBACK = {'entries': None, 'bytes': None}
+DEFAULT_CACHE_BUDGET_EVENT = {'entries': 1024, 'bytes': None}
+DEFAULT_CACHE_ADAPTIVE_ENABLED = True
+DEFAULT_CACHE_ADAPTIVE_MIN = 0.5  # x cache.expiry
+DEFAULT_CACHE_ADAPTIVE_MAX = 4.0  # x cache.expiry
+DEFAULT_CACHE_SNAPSHOT_ENABLED = True
+DEFAULT_CACHE_SNAPSHOT_INTERVAL = 300  # 5 minutes
+
+DEFAULT_QUEUE_WORKERS = 1  # per controller
+DEFAULT_QUEUE_MAX_WORKERS = 16  # across all controllers
+
+DEFAULT_CARDS_WINDOW = 8  # requests in flight per controller
+DEFAULT_CARDS_MIRROR_ENABLED = True
+DEFAULT_CARDS_MIRROR_INTERVAL = 300  # 5 minutes
+DEFAULT_CARDS_MIRROR_SAMPLES = 4  # cards verified per controller
+DEFAULT_CARDS_ROTATION_SLICE = 200  # cards refreshed per poll cycle (0 for all)
+DEFAULT_CARDS_ROTATION_MAX_AGE = 300  # 5 minutes
+
+DEFAULT_PACING_ENABLED = True
+DEFAULT_PACING_CONTROLLER_RATE = 20  # requests/second i.e. 50ms between requests (a 200 card slice takes 10s)
+DEFAULT_PACING_CONTROLLER_BURST = 4
+DEFAULT_PACING_NETWORK_RATE = 100  # requests/second
+DEFAULT_PACING_NETWORK_BURST = 20
+
+DEFAULT_ADAPTIVE_TIMEOUT_ENABLED = True
+DEFAULT_ADAPTIVE_TIMEOUT_MIN = 1.0  # seconds
+DEFAULT_ADAPTIVE_TIMEOUT_MAX = 5.0  # seconds
+
+DEFAULT_BREAKER_ENABLED = True
+DEFAULT_BREAKER_THRESHOLD = 3  # consecutive failed requests
+DEFAULT_BREAKER_PROBE_INTERVAL = 10  # seconds
+DEFAULT_BREAKER_MAX_PROBE_INTERVAL = 300  # 5 minutes
 
 DEFAULT_EVENTS_LISTENER_ENABLED = True
 DEFAULT_EVENTS_LISTENER_MAX_BACKOFF = 1800  # 30 minutes
+DEFAULT_EVENTS_CATCHUP_WINDOW = 8  # requests in flight per controller
+DEFAULT_EVENTS_CATCHUP_BATCH = 32  # events per update
+
+DEFAULT_PUBLISH_WINDOW = 0.1  # seconds
 
 DEFAULT_EVENTS_CARDS_ENABLED = True
 DEFAULT_EVENTS_DOORS_ENABLED = True
@@ -164,6 +254,8 @@ DEFAULT_PERSISTED_ENTITIES = []
 # storage keys
 STORAGE_VERSION = 1
 STORAGE_KEY_INTERLOCK = "uhppoted.controller.interlock"
+STORAGE_KEY_CACHE = "uhppoted.driver.cache"
+STORAGE_KEY_EVENTS = "uhppoted.events.index"
 
 # error messages
 ERR_INVALID_CONTROLLER_ID = 'invalid_controller_id'
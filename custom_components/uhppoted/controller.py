@@ -55,6 +55,7 @@ ANTIPASSBACK = {
 class ControllerInfo(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:identifier'
     _attr_has_entity_name = True
+    _revision = None
     _attr_translation_key = 'controller_id'
 
     def __init__(self, coordinator, unique_id, controller, serial_no):
@@ -104,8 +105,10 @@ class ControllerInfo(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._serial_no)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -136,6 +139,7 @@ class ControllerInfo(CoordinatorEntity, SensorEntity):
 class ControllerDateTime(CoordinatorEntity, DateTimeEntity):
     _attr_icon = 'mdi:calendar-clock-outline'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no):
         super().__init__(coordinator, context=int(f'{serial_no}'))
@@ -166,6 +170,8 @@ class ControllerDateTime(CoordinatorEntity, DateTimeEntity):
         return self._datetime
 
     async def async_set_value(self, utc: datetime) -> None:
+        self._revision = None
+
         try:
             controller = self._serial_no
             tz = datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo
@@ -181,8 +187,10 @@ class ControllerDateTime(CoordinatorEntity, DateTimeEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._serial_no)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -316,7 +324,7 @@ class Interlock(CoordinatorEntity, SelectEntity, RestoreEntity):
     _attr_has_entity_name: True
 
     def __init__(self, coordinator, unique_id, controller, serial_no, store, persist):
-        super().__init__(coordinator, context=unique_id)
+        super().__init__(coordinator, context=int(f'{serial_no}'))
 
         _LOGGER.debug(f'interlock {controller}')
 
@@ -496,9 +504,10 @@ class Interlock(CoordinatorEntity, SelectEntity, RestoreEntity):
 class AntiPassback(CoordinatorEntity, SelectEntity):
     _attr_icon = 'mdi:lock-plus'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no):
-        super().__init__(coordinator, context=unique_id)
+        super().__init__(coordinator, context=int(f'{serial_no}'))
 
         _LOGGER.debug(f'antipassback {controller}')
 
@@ -535,6 +544,8 @@ class AntiPassback(CoordinatorEntity, SelectEntity):
         return None
 
     async def async_select_option(self, option):
+        self._revision = None
+
         _LOGGER.debug(f'controller:{self._controller}  set card anti-passback {option}')
 
         try:
@@ -557,8 +568,10 @@ class AntiPassback(CoordinatorEntity, SelectEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._serial_no)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -7,6 +7,7 @@ import datetime
 import logging
 import async_timeout
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.const import __version__ as HAVERSION
@@ -15,11 +16,18 @@ from uhppoted import uhppote
 
 _LOGGER = logging.getLogger(__name__)
 _INTERVAL = datetime.timedelta(seconds=30)
+_FANOUT = 16  # max. concurrent card writes
 
 from ..const import DOMAIN
 from ..const import CONF_RETRY_DELAY
+from ..const import CONF_PUBLISH_WINDOW
+from ..const import DEFAULT_PUBLISH_WINDOW
 from ..const import CONF_CONTROLLER_SERIAL_NUMBER
 from ..const import CONF_DOOR_NUMBER
+from ..const import CONF_CARDS_ROTATION_SLICE
+from ..const import CONF_CARDS_ROTATION_MAX_AGE
+from ..const import DEFAULT_CARDS_ROTATION_SLICE
+from ..const import DEFAULT_CARDS_ROTATION_MAX_AGE
 
 from ..const import ATTR_AVAILABLE
 from ..const import ATTR_CARD_STARTDATE
@@ -38,8 +46,11 @@ from ..config import default_card_end_date
 
 from ..uhppoted import Controller
 
+from .keyed import KeyedCoordinator
+from .rotation import Rotation
 
-class CardsCoordinator(DataUpdateCoordinator):
+
+class CardsCoordinator(KeyedCoordinator):
     _state: Dict[int, Dict]
 
     def __init__(self, hass, options, poll, driver, db):
@@ -51,9 +62,14 @@ class CardsCoordinator(DataUpdateCoordinator):
         self._controllers = get_configured_controllers_ext(options)
         self._uhppote = driver
         self._retry_delay = hass.data[DOMAIN].get(CONF_RETRY_DELAY, 300)
+        self.publish_window = hass.data[DOMAIN].get(CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW)
         self._db = db
         self._state = {}
         self._initialised = False
+        self._rotation = Rotation()
+        self._rotation.slice = hass.data[DOMAIN].get(CONF_CARDS_ROTATION_SLICE, DEFAULT_CARDS_ROTATION_SLICE)
+        self._rotation.max_age = hass.data[DOMAIN].get(CONF_CARDS_ROTATION_MAX_AGE, DEFAULT_CARDS_ROTATION_MAX_AGE)
+        self._unsubscribe = hass.bus.async_listen('uhppoted.card.swipe.decorated', self._on_swipe)
 
         _LOGGER.info(f'cards coordinator initialised ({interval.total_seconds():.0f}s)')
 
@@ -61,41 +77,52 @@ class CardsCoordinator(DataUpdateCoordinator):
         self.unload()
 
     def unload(self):
-        pass
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+        self.async_discard()
+        self._rotation.clear()
 
     async def add_card(self, card):
-        controllers = self._controllers
         cardno = int(f'{card}')
-        errors = []
+        self._rotation.touch(cardno)
+
+        async def add(controller):
+            response = await self._uhppote.get_card(controller.id, cardno)
+            if response.controller == controller.id and response.card_number == cardno:
+                _LOGGER.info(f'card {card} already exists on controller {controller.id}')
+                return True
+            elif response.controller == controller.id and response.card_number == 0:
+                start_date = default_card_start_date()
+                end_date = default_card_end_date()
+                door1 = 0
+                door2 = 0
+                door3 = 0
+                door4 = 0
+                PIN = 0
 
-        for controller in controllers:
-            try:
-                response = await self._uhppote.get_card(controller.id, cardno)
-                if response.controller == controller.id and response.card_number == cardno:
-                    _LOGGER.info(f'card {card} already exists on controller {controller.id}')
-                elif response.controller == controller.id and response.card_number == 0:
-                    start_date = default_card_start_date()
-                    end_date = default_card_end_date()
-                    door1 = 0
-                    door2 = 0
-                    door3 = 0
-                    door4 = 0
-                    PIN = 0
-
-                    response = await self._uhppote.put_card(controller.id, card, start_date, end_date, door1, door2,
-                                                            door3, door4, PIN)
-                    if response.stored:
-                        _LOGGER.info(f'card {card} added to controller {controller.id}')
-                    else:
-                        errors.append(f'{controller.id}')
-                        _LOGGER.warning(f'card {card} not added to controller {controller.id}')
+                response = await self._uhppote.put_card(controller.id, card, start_date, end_date, door1, door2, door3,
+                                                        door4, PIN)
+                if response.stored:
+                    _LOGGER.info(f'card {card} added to controller {controller.id}')
+                    return True
                 else:
-                    errors.append(f'{controller.id}')
-                    _LOGGER.error(f'invalid get-card response for {card} from {controller.id} ({response})')
+                    _LOGGER.warning(f'card {card} not added to controller {controller.id}')
+                    return False
+            else:
+                _LOGGER.error(f'invalid get-card response for {card} from {controller.id} ({response})')
+                return False
 
-            except Exception as e:
-                errors.append(f'{controller.id}')
-                _LOGGER.exception(f'error adding card {card} to controller {controller.id} ({e})')
+        results = await self._fan_out(add)
+        errors = []
+
+        for controller, result in results.items():
+            if isinstance(result, Exception):
+                _LOGGER.error(f'error adding card {card} to controller {controller} ({result})')
+                errors.append(f'{controller}')
+            elif not result:
+                errors.append(f'{controller}')
 
         if errors and len(errors) > 1:
             raise ValueError(f'error adding card {card} to controllers {",".join(errors)}')
@@ -106,22 +133,26 @@ class CardsCoordinator(DataUpdateCoordinator):
         return True
 
     async def delete_card(self, card):
-        controllers = self._controllers
         cardno = int(f'{card}')
-        errors = []
+        self._rotation.touch(cardno)
 
-        for controller in controllers:
-            try:
-                response = await self._uhppote.delete_card(controller.id, cardno)
-                if response.controller == controller.id:
-                    if response.deleted:
-                        _LOGGER.info(f'card {card} deleted from controller {controller.id}')
-                    else:
-                        _LOGGER.warning(f'card {card} not deleted from controller {controller.id}')
+        async def delete(controller):
+            response = await self._uhppote.delete_card(controller.id, cardno)
+            if response.controller == controller.id:
+                if response.deleted:
+                    _LOGGER.info(f'card {card} deleted from controller {controller.id}')
+                else:
+                    _LOGGER.warning(f'card {card} not deleted from controller {controller.id}')
+
+            return True
 
-            except Exception as e:
-                errors.append(f'{controller.id}')
-                _LOGGER.exception(f'error deleting card {card} from controller {controller.id} ({e})')
+        results = await self._fan_out(delete)
+        errors = []
+
+        for controller, result in results.items():
+            if isinstance(result, Exception):
+                _LOGGER.error(f'error deleting card {card} from controller {controller} ({result})')
+                errors.append(f'{controller}')
 
         if errors and len(errors) > 1:
             raise ValueError(f'error deleting card {card} from controllers {",".join(errors)}')
@@ -131,6 +162,23 @@ class CardsCoordinator(DataUpdateCoordinator):
 
         return True
 
+    # NTS: runs f concurrently for all the controllers (at most _FANOUT at a time) and returns the result (or the
+    #      exception) for each controller, so that a failed or offline controller doesn't hold up the others
+    async def _fan_out(self, f):
+        semaphore = asyncio.Semaphore(_FANOUT)
+        controllers = self._controllers
+
+        async def g(controller):
+            async with semaphore:
+                try:
+                    return await f(controller)
+                except Exception as exc:
+                    return exc
+
+        results = await asyncio.gather(*[g(controller) for controller in controllers])
+
+        return {controller.id: result for controller, result in zip(controllers, results)}
+
     async def set_card_start_date(self, card, date):
         return await self._put_card(card, start_date=date)
 
@@ -146,9 +194,10 @@ class CardsCoordinator(DataUpdateCoordinator):
         return await self._put_card(card, door=door, permission=permission)
 
     async def _put_card(self, card, **kwargs):
-        errors = []
         doors = []
 
+        self._rotation.touch(card)
+
         record = self._state.get(card)
         if record is not None:
             for p in record.get('permissions', []):
@@ -156,95 +205,103 @@ class CardsCoordinator(DataUpdateCoordinator):
                 if door is not None:
                     doors.append(door)
 
-        controllers = self._controllers
-        for controller in controllers:
-            try:
-                start_date = default_card_start_date()
-                end_date = default_card_end_date()
-                door1 = 0
-                door2 = 0
-                door3 = 0
-                door4 = 0
-                PIN = 0
-
-                if record is not None:
-                    if date := record.get('start_date'):
-                        start_date = date
-
-                    if date := record.get('end_date'):
-                        end_date = date
-
-                    if pin := record.get('PIN'):
-                        PIN = pin
-
-                    for door in doors:
-                        if door.get(CONF_CONTROLLER_SERIAL_NUMBER) == controller.id:
-                            if door.get(CONF_DOOR_NUMBER) == 1:
-                                door1 = 1
-                            elif door.get(CONF_DOOR_NUMBER) == 2:
-                                door2 = 1
-                            elif door.get(CONF_DOOR_NUMBER) == 3:
-                                door3 = 1
-                            elif door.get(CONF_DOOR_NUMBER) == 4:
-                                door4 = 1
-
-                for k, v in kwargs.items():
-                    if k == 'start_date':
-                        start_date = v
-                    elif k == 'end_date':
-                        end_date = v
-                    elif k == 'PIN':
-                        PIN = v
-                    elif k == 'door':
-                        if f'{v.get(CONF_CONTROLLER_SERIAL_NUMBER)}' == str(controller.id):
-                            d = f'{v.get(CONF_DOOR_NUMBER)}'
-                            if d == str(1):
-                                door1 = kwargs.get('permission', door1)
-                            elif d == str(2):
-                                door2 = kwargs.get('permission', door2)
-                            elif d == str(3):
-                                door3 = kwargs.get('permission', door3)
-                            elif d == str(4):
-                                door4 = kwargs.get('permission', door4)
-
-                if response := await self._uhppote.put_card(controller.id, card, start_date, end_date, door1, door2,
-                                                            door3, door4, PIN):
-                    if response.stored:
-                        permissions = []
-                        if door1 > 0: permissions.append(1)
-                        if door2 > 0: permissions.append(2)
-                        if door3 > 0: permissions.append(3)
-                        if door4 > 0: permissions.append(4)
-
-                        self._state[card].update({
-                            ATTR_CARD_STARTDATE:
-                            start_date,
-                            ATTR_CARD_ENDDATE:
-                            end_date,
-                            ATTR_CARD_PERMISSIONS:
-                            resolve_permissions(self._options, {controller.id: permissions}),
-                            ATTR_CARD_PIN:
-                            PIN,
-                            ATTR_AVAILABLE:
-                            True,
-                        })
-
-                        self.async_set_updated_data(self._state)
-                    else:
-                        errors.append(f'{controller.id}')
-                else:
-                    errors.append(f'{controller.id}')
+        async def put(controller):
+            start_date = default_card_start_date()
+            end_date = default_card_end_date()
+            door1 = 0
+            door2 = 0
+            door3 = 0
+            door4 = 0
+            PIN = 0
+
+            if record is not None:
+                if date := record.get('start_date'):
+                    start_date = date
+
+                if date := record.get('end_date'):
+                    end_date = date
+
+                if pin := record.get('PIN'):
+                    PIN = pin
+
+                for door in doors:
+                    if door.get(CONF_CONTROLLER_SERIAL_NUMBER) == controller.id:
+                        if door.get(CONF_DOOR_NUMBER) == 1:
+                            door1 = 1
+                        elif door.get(CONF_DOOR_NUMBER) == 2:
+                            door2 = 1
+                        elif door.get(CONF_DOOR_NUMBER) == 3:
+                            door3 = 1
+                        elif door.get(CONF_DOOR_NUMBER) == 4:
+                            door4 = 1
+
+            for k, v in kwargs.items():
+                if k == 'start_date':
+                    start_date = v
+                elif k == 'end_date':
+                    end_date = v
+                elif k == 'PIN':
+                    PIN = v
+                elif k == 'door':
+                    if f'{v.get(CONF_CONTROLLER_SERIAL_NUMBER)}' == str(controller.id):
+                        d = f'{v.get(CONF_DOOR_NUMBER)}'
+                        if d == str(1):
+                            door1 = kwargs.get('permission', door1)
+                        elif d == str(2):
+                            door2 = kwargs.get('permission', door2)
+                        elif d == str(3):
+                            door3 = kwargs.get('permission', door3)
+                        elif d == str(4):
+                            door4 = kwargs.get('permission', door4)
+
+            if response := await self._uhppote.put_card(controller.id, card, start_date, end_date, door1, door2, door3,
+                                                        door4, PIN):
+                if response.stored:
+                    permissions = []
+                    if door1 > 0: permissions.append(1)
+                    if door2 > 0: permissions.append(2)
+                    if door3 > 0: permissions.append(3)
+                    if door4 > 0: permissions.append(4)
+
+                    return (start_date, end_date, permissions, PIN)
+
+            return None
+
+        results = await self._fan_out(put)
+        errors = []
+        permissions = {}
+        stored = None
+
+        for controller, result in results.items():
+            if isinstance(result, Exception):
+                _LOGGER.error(f'error updating card {card} on controller {controller} ({result})')
+                errors.append(f'{controller}')
+            elif result is None:
+                errors.append(f'{controller}')
+            else:
+                stored = result
+                permissions[controller] = result[2]
+
+        # NTS: the permissions are aggregated across all the controllers that stored the card
+        if stored is not None:
+            (start_date, end_date, _, PIN) = stored
+
+            self._state[card].update({
+                ATTR_CARD_STARTDATE: start_date,
+                ATTR_CARD_ENDDATE: end_date,
+                ATTR_CARD_PERMISSIONS: resolve_permissions(self._options, permissions),
+                ATTR_CARD_PIN: PIN,
+                ATTR_AVAILABLE: True,
+            })
 
-            except Exception as e:
-                errors.append(f'{controller.id}')
-                _LOGGER.exception(f'error updating card {card} on controller {controller.id} ({e})')
+            self.async_set_updated_keys(self._commit([card]), [card])
 
         if errors and len(errors) > 1:
-            _LOGGER.exception(f'error updating card {card} on controllers {",".join(errors)}')
+            _LOGGER.error(f'error updating card {card} on controllers {",".join(errors)}')
             return False
 
         if errors and len(errors) > 0:
-            _LOGGER.exception(f'error updating card {card} on controller {errors[0]}')
+            _LOGGER.error(f'error updating card {card} on controller {errors[0]}')
             return False
 
         return True
@@ -264,7 +321,10 @@ class CardsCoordinator(DataUpdateCoordinator):
                         ATTR_AVAILABLE: False,
                     }
 
-            return await self._get_cards(contexts)
+            # NTS: only a slice of the cards is refreshed on each poll (see Rotation)
+            interval = self.update_interval.total_seconds() if self.update_interval else 0
+
+            return await self._get_cards(self._rotation.select(contexts, interval))
         except Exception as exc:
             try:
                 raise UpdateFailed(retry_after=self._retry_delay) from exc  # HA 2025.12+
@@ -273,117 +333,85 @@ class CardsCoordinator(DataUpdateCoordinator):
 
     async def _get_cards(self, contexts):
         controllers = self._controllers
-        lock = asyncio.Lock()
-        tasks = []
-        gathered = []
+        cards = list(contexts)
+        responses = {card: {} for card in cards}
+        refreshed = {card: 0 for card in cards}
+        max_age = self._rotation.max_age
 
-        try:
-            tasks += [self._get_card(controllers, lock, card) for card in contexts]
-            gathered = await asyncio.gather(*tasks, return_exceptions=True)
-        except Exception as err:
-            _LOGGER.error(f'error retrieving card information ({err})')
-            for task in tasks:
-                task.close()
-
-        if all(r is not None for r in gathered):
+        async def get_cards(controller):
+            async for (card, response, ok) in self._uhppote.get_cards_bulk(controller.id, cards, max_age):
+                responses[card][controller.id] = response
+                if ok:
+                    refreshed[card] += 1
+
+        gathered = await asyncio.gather(*[get_cards(controller) for controller in controllers], return_exceptions=True)
+
+        for controller, result in zip(controllers, gathered):
+            if isinstance(result, Exception):
+                _LOGGER.error(f'error retrieving card information from controller {controller.id} ({result})')
+
+        if gathered and all(isinstance(result, Exception) for result in gathered):
             raise UpdateFailed(f"general failure retrieving cards")
 
+        for card in cards:
+            self._state[card].update(self._get_card(controllers, card, responses[card]))
+
+            # ... a card that was not refreshed by every controller keeps its place in the rotation
+            if refreshed[card] == len(controllers):
+                self._rotation.refreshed(card)
+
         self._db.cards = self._state
 
         return self._db.cards
 
-    async def _get_card(self, controllers, lock, card):
-        _LOGGER.debug(f'fetch card {card} information')
+    def _get_card(self, controllers, card, responses):
+        start_date = None
+        end_date = None
+        permissions = {}
+        PIN = None
 
-        async def callback(response):
-            try:
-                if response and response.card_number == card:
-                    async with lock:
-                        record = self._state.setdefault(
-                            card, {
-                                ATTR_AVAILABLE: False,
-                                ATTR_CARD_STARTDATE: None,
-                                ATTR_CARD_ENDDATE: None,
-                                ATTR_CARD_PERMISSIONS: None,
-                            })
-
-                        start_date = record.get(ATTR_CARD_STARTDATE)
-                        end_date = record.get(ATTR_CARD_ENDDATE)
-                        permissions = permissions = record.get(ATTR_CARD_PERMISSIONS) or []
-
-                        # ... recalculate dates
-                        if response.start_date is not None and (not start_date or response.start_date < start_date):
-                            start_date = response.start_date
-
-                        if response.end_date is not None and (not end_date or response.end_date > end_date):
-                            end_date = response.end_date
-
-                        # ... recalculate permissions
-                        _allowed = []
-                        if response.door_1 > 0: _allowed.append(1)
-                        if response.door_2 > 0: _allowed.append(2)
-                        if response.door_3 > 0: _allowed.append(3)
-                        if response.door_4 > 0: _allowed.append(4)
-
-                        doors = resolve_permissions(self._options, {response.controller: [1, 2, 3, 4]})
-                        allowed = resolve_permissions(self._options, {response.controller: _allowed})
-                        updated = list((set(permissions) - set(doors)) | (set(doors) & set(allowed)))
-
-                        self._state[card].update({
-                            ATTR_CARD_STARTDATE: start_date,
-                            ATTR_CARD_ENDDATE: end_date,
-                            ATTR_CARD_PERMISSIONS: updated,
-                            ATTR_AVAILABLE: True,
-                        })
-
-                    self.async_set_updated_data(self._state)
-            except Exception as exc:
-                _LOGGER.error(f'error updating internal controller {controller.id} information ({exc})')
-
-        info = {
-            ATTR_AVAILABLE: False,
-            ATTR_CARD_STARTDATE: None,
-            ATTR_CARD_ENDDATE: None,
-            ATTR_CARD_PERMISSIONS: None,
+        for controller in controllers:
+            response = responses.get(controller.id)
+            if response is None:
+                _LOGGER.debug(f'no card {card} information from controller {controller.id}')
+                return {
+                    ATTR_AVAILABLE: False,
+                    ATTR_CARD_STARTDATE: None,
+                    ATTR_CARD_ENDDATE: None,
+                    ATTR_CARD_PERMISSIONS: None,
+                }
+
+            if response.controller == controller.id and response.card_number == card:
+                if response.start_date is not None and (not start_date or response.start_date < start_date):
+                    start_date = response.start_date
+
+                if response.end_date is not None and (not end_date or response.end_date > end_date):
+                    end_date = response.end_date
+
+                permissions[controller.id] = []
+                if response.door_1 > 0: permissions[controller.id].append(1)
+                if response.door_2 > 0: permissions[controller.id].append(2)
+                if response.door_3 > 0: permissions[controller.id].append(3)
+                if response.door_4 > 0: permissions[controller.id].append(4)
+
+                if response.pin > 0:
+                    PIN = response.pin
+
+        return {
+            ATTR_CARD_STARTDATE: start_date,
+            ATTR_CARD_ENDDATE: end_date,
+            ATTR_CARD_PERMISSIONS: resolve_permissions(self._options, permissions),
+            ATTR_CARD_PIN: PIN,
+            ATTR_AVAILABLE: all(self._uhppote.available(controller.id) for controller in controllers),
         }
 
-        try:
-            start_date = None
-            end_date = None
-            permissions = {}
-            PIN = None
-
-            for controller in controllers:
-                response = await self._uhppote.get_card(controller.id, card, callback)
-                if response and response.controller == controller.id and response.card_number == card:
-                    if response.start_date is not None and (not start_date or response.start_date < start_date):
-                        start_date = response.start_date
-
-                    if response.end_date is not None and (not end_date or response.end_date > end_date):
-                        end_date = response.end_date
-
-                    permissions[controller.id] = []
-                    if response.door_1 > 0: permissions[controller.id].append(1)
-                    if response.door_2 > 0: permissions[controller.id].append(2)
-                    if response.door_3 > 0: permissions[controller.id].append(3)
-                    if response.door_4 > 0: permissions[controller.id].append(4)
-
-                    if response.pin > 0:
-                        PIN = response.pin
-
-            info = {
-                ATTR_CARD_STARTDATE: start_date,
-                ATTR_CARD_ENDDATE: end_date,
-                ATTR_CARD_PERMISSIONS: resolve_permissions(self._options, permissions),
-                ATTR_CARD_PIN: PIN,
-                ATTR_AVAILABLE: True,
-            }
-
-        except Exception as exc:
-            _LOGGER.error(f'error retrieving card {card} information ({exc})')
+    @callback
+    def _on_swipe(self, event):
+        if card := event.data.get('card', {}).get('card'):
+            self._rotation.touch(int(f'{card}'))
 
-        async with lock:
-            self._state[card].update(info)
+    def _commit(self, keys):
+        return self._db.commit('cards', self._state, keys)
 
     def _resolve(self, controller_id):
         for controller in self._controllers:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from collections import namedtuple
+from collections.abc import Mapping
 
 import concurrent.futures
 import asyncio
@@ -18,6 +19,8 @@ _INTERVAL = datetime.timedelta(seconds=30)
 
 from ..const import DOMAIN
 from ..const import CONF_RETRY_DELAY
+from ..const import CONF_PUBLISH_WINDOW
+from ..const import DEFAULT_PUBLISH_WINDOW
 from ..const import CONF_CONTROLLERS
 from ..const import CONF_CONTROLLER_SERIAL_NUMBER
 from ..const import CONF_CONTROLLER_PROTOCOL
@@ -42,9 +45,70 @@ from ..config import get_configured_cards
 
 from ..uhppoted import Controller
 
+from .keyed import KeyedCoordinator
 
-class ControllersCoordinator(DataUpdateCoordinator):
-    _state: Dict[int, Dict]
+_UNSET = object()
+
+# NTS: maps the entity attribute keys to the ControllerState fields
+_FIELDS = {
+    ATTR_AVAILABLE: 'available',
+    ATTR_CONTROLLER_ADDRESS: 'address',
+    ATTR_CONTROLLER_PROTOCOL: 'protocol',
+    ATTR_NETMASK: 'netmask',
+    ATTR_GATEWAY: 'gateway',
+    ATTR_FIRMWARE: 'firmware',
+    ATTR_CONTROLLER_LISTENER: 'listener',
+    ATTR_CONTROLLER_DATETIME: 'datetime',
+    ATTR_CONTROLLER_INTERLOCK: 'interlock',
+    ATTR_CONTROLLER_ANTIPASSBACK: 'antipassback',
+}
+
+
+# NTS: compact per-controller state record. The field setters compare the new value with the current value and report
+#      whether it changed, so the callbacks don't need to copy and compare the record to detect a change. Reads as a
+#      (read-only) mapping of the entity attributes that have been set.
+class ControllerState(Mapping):
+    __slots__ = tuple(_FIELDS.values())
+
+    def __init__(self, available=False):
+        for field in self.__slots__:
+            setattr(self, field, _UNSET)
+
+        self.available = available
+
+    def set(self, key, value):
+        field = _FIELDS[key]
+        current = getattr(self, field)
+        if current is not _UNSET and current == value:
+            return False
+
+        setattr(self, field, value)
+
+        return True
+
+    def update(self, values):
+        changed = False
+        for k, v in values.items():
+            if self.set(k, v):
+                changed = True
+
+        return changed
+
+    def __getitem__(self, key):
+        if (field := _FIELDS.get(key)) is None or (value := getattr(self, field)) is _UNSET:
+            raise KeyError(key)
+
+        return value
+
+    def __iter__(self):
+        return (k for k, field in _FIELDS.items() if getattr(self, field) is not _UNSET)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class ControllersCoordinator(KeyedCoordinator):
+    _state: Dict[int, ControllerState]
 
     def __init__(self, hass, options, poll, driver, db):
         interval = _INTERVAL if poll == None else poll
@@ -55,6 +119,7 @@ class ControllersCoordinator(DataUpdateCoordinator):
         self._controllers = get_configured_controllers_ext(options)
         self._uhppote = driver
         self._retry_delay = hass.data[DOMAIN].get(CONF_RETRY_DELAY, 300)
+        self.publish_window = hass.data[DOMAIN].get(CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW)
         self._db = db
         self._lock = asyncio.Lock()
         self._state = {}
@@ -66,7 +131,7 @@ class ControllersCoordinator(DataUpdateCoordinator):
         self.unload()
 
     def unload(self):
-        pass
+        self.async_discard()
 
     async def set_datetime(self, controller_id, time):
         controller = self._resolve(controller_id)
@@ -120,9 +185,7 @@ class ControllersCoordinator(DataUpdateCoordinator):
         try:
             for v in contexts:
                 if not v in self._state:
-                    self._state[v] = {
-                        ATTR_AVAILABLE: False,
-                    }
+                    self._state[v] = ControllerState()
 
             for controller in self._controllers:
                 if controller.id in contexts:
@@ -161,11 +224,8 @@ class ControllersCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug(f'get-controller::callback {controller.id} {response}')
                 if response and response.controller == controller.id:
-                    keys = [ATTR_CONTROLLER_ADDRESS, ATTR_NETMASK, ATTR_GATEWAY, ATTR_FIRMWARE, ATTR_AVAILABLE]
-                    old = self._state[controller.id].copy()
-
                     async with lock:
-                        self._state[controller.id].update({
+                        changed = self._state[controller.id].update({
                             ATTR_CONTROLLER_ADDRESS: f'{response.ip_address}',
                             ATTR_NETMASK: f'{response.subnet_mask}',
                             ATTR_GATEWAY: f'{response.gateway}',
@@ -173,11 +233,9 @@ class ControllersCoordinator(DataUpdateCoordinator):
                             ATTR_AVAILABLE: True,
                         })
 
-                    updated = self._state[controller.id].copy()
-
-                    if self._changed(keys, old, updated):
+                    if changed:
                         _LOGGER.info(f'{controller} controller information updated')
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([controller.id])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller.id} information ({err})')
@@ -189,7 +247,7 @@ class ControllersCoordinator(DataUpdateCoordinator):
                 netmask = f'{response.subnet_mask}'
                 gateway = f'{response.gateway}'
                 firmware = f'{response.version} {response.date:%Y-%m-%d}'
-                available = True
+                available = self._uhppote.available(controller.id)
 
         except Exception as err:
             _LOGGER.error(f'error retrieving controller {controller.id} information ({err})')
@@ -213,19 +271,13 @@ class ControllersCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug(f'get-listener::callback {controller.id} {response}')
                 if response and response.controller == controller.id:
-                    keys = [ATTR_CONTROLLER_LISTENER]
-                    old = self._state[controller.id].copy()
-
                     async with lock:
-                        self._state[controller.id].update({
-                            ATTR_CONTROLLER_LISTENER:
-                            f'{response.address}:{response.port}',
-                        })
+                        changed = self._state[controller.id].set(ATTR_CONTROLLER_LISTENER,
+                                                                 f'{response.address}:{response.port}')
 
-                    updated = self._state[controller.id].copy()
-                    if self._changed(keys, old, updated):
+                    if changed:
                         _LOGGER.info(f'{controller} controller event listener updated')
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([controller.id])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller.id} event listener ({err})')
@@ -250,23 +302,17 @@ class ControllersCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug(f'get-listener::callback {controller.id} {response}')
                 if response and response.controller == controller.id:
-                    keys = [ATTR_CONTROLLER_DATETIME]
-                    old = self._state[controller.id].copy()
+                    sysdatetime = datetime.datetime(response.datetime.year, response.datetime.month,
+                                                    response.datetime.day, response.datetime.hour,
+                                                    response.datetime.minute, response.datetime.second, 0,
+                                                    datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo)
 
                     async with lock:
-                        self._state[controller.id].update({
-                            ATTR_CONTROLLER_DATETIME:
-                            datetime.datetime(response.datetime.year, response.datetime.month, response.datetime.day,
-                                              response.datetime.hour, response.datetime.minute,
-                                              response.datetime.second, 0,
-                                              datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo),
-                        })
-
-                    updated = self._state[controller.id].copy()
+                        changed = self._state[controller.id].set(ATTR_CONTROLLER_DATETIME, sysdatetime)
 
-                    if self._changed(keys, old, updated):
+                    if changed:
                         _LOGGER.debug(f'{controller} controller date/time updated')
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([controller.id])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller.id} date/time ({err})')
@@ -296,19 +342,12 @@ class ControllersCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug(f'get-interlock::callback {controller} {response}')
                 if response and response.controller == controller.id:
-                    keys = [ATTR_CONTROLLER_INTERLOCK]
-                    old = self._state[controller.id].copy()
-
                     async with lock:
-                        self._state[controller.id].update({
-                            ATTR_CONTROLLER_INTERLOCK: response.interlock,
-                        })
+                        changed = self._state[controller.id].set(ATTR_CONTROLLER_INTERLOCK, response.interlock)
 
-                    updated = self._state[controller.id].copy()
-
-                    if self._changed(keys, old, updated):
+                    if changed:
                         _LOGGER.info(f'{controller} controller door interlock mode updated')
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([controller.id])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller.id} door interlock mode ({err})')
@@ -335,19 +374,12 @@ class ControllersCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug(f'get-antipassback {controller} {response}')
                 if response and response.controller == controller.id:
-                    keys = [ATTR_CONTROLLER_ANTIPASSBACK]
-                    old = self._state[controller.id].copy()
-
                     async with lock:
-                        self._state[controller.id].update({
-                            ATTR_CONTROLLER_ANTIPASSBACK: response.antipassback,
-                        })
-
-                    updated = self._state[controller.id].copy()
+                        changed = self._state[controller.id].set(ATTR_CONTROLLER_ANTIPASSBACK, response.antipassback)
 
-                    if self._changed(keys, old, updated):
+                    if changed:
                         _LOGGER.info(f'{controller} controller anti-passback updated')
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([controller.id])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller} anti-passback ({err})')
@@ -367,15 +399,12 @@ class ControllersCoordinator(DataUpdateCoordinator):
                 ATTR_CONTROLLER_ANTIPASSBACK: antipassback,
             })
 
+    def _commit(self, keys):
+        return self._db.commit('controllers', self._state, keys)
+
     def _resolve(self, controller_id):
         for controller in self._controllers:
             if controller.id == controller_id:
                 return controller
 
         return Controller(int(f'{controller_id}'), None, None)
-
-    def _changed(self, keys, old, updated):
-        _old = {k: old.get(k) for k in keys}
-        _updated = {k: updated.get(k) for k in keys}
-
-        return _old != _updated
@@ -1,4 +1,3 @@
-import asyncio
 import datetime
 import logging
 
@@ -14,6 +13,7 @@ from .controllers import ControllersCoordinator
 from .doors import DoorsCoordinator
 from .cards import CardsCoordinator
 from .events import EventsCoordinator
+from .status import StatusBus
 from .db import DB
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,6 +64,14 @@ class Coordinators():
 
         return None
 
+    @classmethod
+    def driver(clazz, id):
+        coordinators = Coordinators.COORDINATORS.get(id)
+        if coordinators:
+            return coordinators._driver
+
+        return None
+
     @classmethod
     async def unlock_door(clazz, door):
         unlocked = False
@@ -121,10 +129,14 @@ class Coordinators():
         self._db = DB()
         self._driver = configure_driver(options, defaults)
         self._controllers = ControllersCoordinator(hass, options, poll_controllers, self._driver, self._db)
-        self._doors = DoorsCoordinator(hass, options, poll_doors, self._driver, self._db)
+        self._status = StatusBus(self._driver)
+        self._doors = DoorsCoordinator(hass, options, poll_doors, self._driver, self._db, self._status)
         self._cards = CardsCoordinator(hass, options, poll_cards, self._driver, self._db)
-        self._events = EventsCoordinator(hass, options, poll_events, self._driver, self._db,
-                                         lambda evt: self._on_event(hass, evt))
+        self._events = EventsCoordinator(hass, options, poll_events, self._driver, self._db, self._status)
+
+        # NTS: a status snapshot is shared by the doors and events coordinators for (just under) one poll cycle
+        interval = min(self._doors.update_interval, self._events.update_interval)
+        self._status.max_age = 0.9 * interval.total_seconds()
 
         self._driver.start(hass)
 
@@ -137,9 +149,4 @@ class Coordinators():
         self._doors.unload()
         self._cards.unload()
         self._events.unload()
-
-    def _on_event(self, hass, event):
-        asyncio.run_coroutine_threadsafe(self._async_on_event(event), hass.loop)
-
-    async def _async_on_event(self, event):
-        await self._doors.async_request_refresh()
+        self._status.clear()
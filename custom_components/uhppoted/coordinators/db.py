@@ -1,55 +1,139 @@
-import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 
-from typing import Dict
 
+# NTS: immutable, versioned snapshot of a coordinator state table. The records are read-only copies of the coordinator
+#      state and each record carries the version of the table at which it last changed, so that an entity can skip
+#      an update if the record it last rendered is unchanged.
+class Snapshot(Mapping):
 
-class DB:
-    _lock: threading.Lock
-    _controllers: Dict[int, Dict]
-    _doors: Dict[str, Dict]
-    _cards: Dict[int, Dict]
-    _events: Dict[int, Dict]
+    def __init__(self, records, revisions, version):
+        self._records = records
+        self._revisions = revisions
+        self._version = version
+
+    @property
+    def version(self):
+        return self._version
+
+    def revision(self, key):
+        return self._revisions.get(key)
+
+    def __getitem__(self, key):
+        return self._records[key]
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+
+# NTS: copy-on-write table. A commit builds a new snapshot that references the unchanged records of the previous
+#      snapshot and replaces only the changed records, so readers always see a consistent snapshot without locking
+#      (everything runs on the event loop). A commit for a set of keys only compares (and freezes) the records for
+#      those keys - the record index itself is still copied (O(N) references) but only if something changed.
+#
+#      Records are frozen recursively (dicts as read-only mappings, lists as tuples and sets as frozensets, named tuples
+#      are left as is) so that a snapshot does not share any mutable state with the coordinator and a nested change
+#      made in place is detected by the comparison with the frozen record.
+class Table:
 
     def __init__(self):
-        self._lock = threading.Lock()
+        self._snapshot = Snapshot({}, {}, 0)
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    def commit(self, state, keys=None):
+        current = self._snapshot
+        version = current.version + 1
+        updated = {}
+        deleted = []
+
+        if keys is None:
+            keys = set(state) | set(current._records)
+
+        for k in keys:
+            if k in state:
+                record = freeze(state[k])
+                if k not in current._records or current._records[k] != record:
+                    updated[k] = record
+            elif k in current._records:
+                deleted.append(k)
 
-        self._controllers = {}
-        self._doors = {}
-        self._cards = {}
-        self._events = {}
+        if updated or deleted:
+            records = dict(current._records)
+            revisions = dict(current._revisions)
+
+            for k, record in updated.items():
+                records[k] = record
+                revisions[k] = version
+
+            for k in deleted:
+                del records[k]
+                del revisions[k]
+
+            self._snapshot = Snapshot(records, revisions, version)
+
+        return self._snapshot
+
+
+def freeze(v):
+    if isinstance(v, Mapping):
+        return MappingProxyType({k: freeze(u) for k, u in v.items()})
+    elif type(v) in (list, tuple):
+        return tuple(freeze(u) for u in v)
+    elif isinstance(v, (set, frozenset)):
+        return frozenset(v)
+
+    return v
+
+
+class DB:
+    _controllers: Table
+    _doors: Table
+    _cards: Table
+    _events: Table
+
+    def __init__(self):
+        self._controllers = Table()
+        self._doors = Table()
+        self._cards = Table()
+        self._events = Table()
 
     @property
     def controllers(self):
-        return self._controllers
+        return self._controllers.snapshot
 
     @controllers.setter
     def controllers(self, controllers):
-        with self._lock:
-            self._controllers = controllers
+        self._controllers.commit(controllers)
 
     @property
     def doors(self):
-        return self._doors
+        return self._doors.snapshot
 
     @doors.setter
     def doors(self, doors):
-        with self._lock:
-            self._doors = doors
+        self._doors.commit(doors)
 
     @property
     def cards(self):
-        return self._cards
+        return self._cards.snapshot
 
     @cards.setter
     def cards(self, cards):
-        with self._lock:
-            self._cards = cards
+        self._cards.commit(cards)
 
     @property
     def events(self):
-        return self._events
+        return self._events.snapshot
 
     @events.setter
     def events(self, events):
-        with self._lock:
-            self._events = events
+        self._events.commit(events)
+
+    def commit(self, table, state, keys):
+        return getattr(self, f'_{table}').commit(state, keys)
@@ -18,6 +18,8 @@ _INTERVAL = datetime.timedelta(seconds=30)
 
 from ..const import DOMAIN
 from ..const import CONF_RETRY_DELAY
+from ..const import CONF_PUBLISH_WINDOW
+from ..const import DEFAULT_PUBLISH_WINDOW
 from ..const import CONF_DOOR_ID
 from ..const import CONF_CONTROLLER_SERIAL_NUMBER
 from ..const import CONF_DOOR_NUMBER
@@ -36,22 +38,38 @@ from ..config import resolve_door_by_name
 
 from ..uhppoted import Controller
 
+from .keyed import KeyedCoordinator
 
-class DoorsCoordinator(DataUpdateCoordinator):
+
+def resolve_doors(options):
+    doors = {}
+    for idx in get_configured_doors(options):
+        if door := resolve_door(options, idx):
+            if controller := door.get(CONF_CONTROLLER_SERIAL_NUMBER):
+                doors.setdefault(controller, []).append((idx, door))
+
+    return doors
+
+
+class DoorsCoordinator(KeyedCoordinator):
     _state: Dict[str, Dict]
 
-    def __init__(self, hass, options, poll, driver, db):
+    def __init__(self, hass, options, poll, driver, db, status):
         interval = _INTERVAL if poll == None else poll
 
         super().__init__(hass, _LOGGER, name="doors", update_interval=interval)
 
         self._options = options
         self._controllers = get_configured_controllers_ext(options)
+        self._doors = resolve_doors(options)
         self._uhppote = driver
         self._retry_delay = hass.data[DOMAIN].get(CONF_RETRY_DELAY, 300)
+        self.publish_window = hass.data[DOMAIN].get(CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW)
         self._db = db
+        self._status = status
         self._state = {}
         self._initialised = False
+        self._unsubscribe = status.subscribe(self._on_status)
 
         _LOGGER.info(f'doors coordinator initialised ({interval.total_seconds():.0f}s)')
 
@@ -59,7 +77,8 @@ class DoorsCoordinator(DataUpdateCoordinator):
         self.unload()
 
     def unload(self):
-        pass
+        self._unsubscribe()
+        self.async_discard()
 
     async def set_door_mode(self, controller_id, door, mode):
         controller = self._resolve(controller_id)
@@ -179,44 +198,9 @@ class DoorsCoordinator(DataUpdateCoordinator):
                 ATTR_DOOR_LOCK: None,
             }
 
-        def g(idx, open, button, relay):
-            state[idx].update({
-                ATTR_DOOR_OPEN: open == True,
-                ATTR_DOOR_BUTTON: button == True,
-                ATTR_DOOR_LOCK: relay == 0x00,
-            })
-
-        def h(idx, door, response):
-            if door == 1:
-                g(idx, response.door_1_open, response.door_1_button, response.relays & 0x01)
-            elif door == 2:
-                g(idx, response.door_2_open, response.door_2_button, response.relays & 0x02)
-            elif door == 3:
-                g(idx, response.door_3_open, response.door_3_button, response.relays & 0x04)
-            elif door == 4:
-                g(idx, response.door_4_open, response.door_4_button, response.relays & 0x08)
-
-        async def callback(response):
-            try:
-                _LOGGER.debug(f'get-controller {controller.id} {response}')
-                if response and response.controller == controller.id:
-                    for (idx, door) in doors:
-                        if door_number := door.get('door_number'):
-                            h(idx, door_number, response)
-
-                    async with lock:
-                        for (idx, door) in doors:
-                            self._state[idx].update(state.get(idx, {}))
-
-            except Exception as err:
-                _LOGGER.error(f'error updating controller {controller.id} door state ({err})')
-
         try:
-            response = await self._uhppote.get_status(controller.id, callback)
-            if response and response.controller == controller.id:
-                for (idx, door) in doors:
-                    if door_number := door.get('door_number'):
-                        h(idx, door_number, response)
+            if status := await self._status.get(controller.id):
+                state.update(self._door_state(status, doors))
         except Exception as err:
             _LOGGER.error(f'error retrieving controller {controller.id} door state ({err})')
 
@@ -224,6 +208,34 @@ class DoorsCoordinator(DataUpdateCoordinator):
             for (idx, door) in doors:
                 self._state[idx].update(state.get(idx, {}))
 
+    # NTS: updates the door state from controller status published by the status bus in between polls
+    #      (e.g. from a background cache refresh). The doors for the controller are looked up in the controller
+    #      door map built on setup (an options change reloads the integration and so rebuilds the map).
+    def _on_status(self, status):
+        doors = [(idx, door) for (idx, door) in self._doors.get(status.controller, []) if idx in self._state]
+
+        changed = []
+        for idx, v in self._door_state(status, doors).items():
+            if any(self._state[idx].get(k) != u for k, u in v.items()):
+                self._state[idx].update(v)
+                changed.append(idx)
+
+        if changed:
+            self.async_publish(changed)
+
+    def _door_state(self, status, doors):
+        state = {}
+        for (idx, door) in doors:
+            if door_number := door.get('door_number'):
+                if v := status.doors.get(door_number):
+                    state[idx] = {
+                        ATTR_DOOR_OPEN: v.open,
+                        ATTR_DOOR_BUTTON: v.button,
+                        ATTR_DOOR_LOCK: v.locked,
+                    }
+
+        return state
+
     async def _get_door(self, lock, idx, door):
         _LOGGER.debug(f'fetch door info {door}')
 
@@ -259,7 +271,7 @@ class DoorsCoordinator(DataUpdateCoordinator):
                         self._state[idx].update(updated)
 
                     if changed:
-                        self.async_set_updated_data(self._state)
+                        self.async_publish([idx])
 
             except Exception as err:
                 _LOGGER.error(f'error updating internal controller {controller.id} information ({err})')
@@ -276,7 +288,7 @@ class DoorsCoordinator(DataUpdateCoordinator):
             if response and response.controller == controller.id and response.door == door_id:
                 mode = response.mode
                 delay = response.delay
-                available = True
+                available = self._uhppote.available(controller.id)
 
         except Exception as err:
             _LOGGER.error(f'error retrieving door {door["door_id"]} information ({err})')
@@ -288,6 +300,9 @@ class DoorsCoordinator(DataUpdateCoordinator):
                 ATTR_AVAILABLE: available,
             })
 
+    def _commit(self, keys):
+        return self._db.commit('doors', self._state, keys)
+
     def _resolve(self, controller_id):
         for controller in self._controllers:
             if controller.id == controller_id:
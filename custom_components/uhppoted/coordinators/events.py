@@ -16,6 +16,7 @@ import asyncio
 _LOGGER = logging.getLogger(__name__)
 _INTERVAL = datetime.timedelta(seconds=30)
 _MAX_EVENTS = 16
+_SAVE_DELAY = 15  # seconds
 _MASK = {
     1: 0x01,
     2: 0x02,
@@ -34,6 +35,8 @@ from ..const import DOMAIN
 from ..const import CONF_RETRY_DELAY
 from ..const import CONF_EVENTS_LISTENER_ENABLED
 from ..const import CONF_EVENTS_LISTENER_MAX_BACKOFF
+from ..const import CONF_EVENTS_CATCHUP_BATCH
+from ..const import DEFAULT_EVENTS_CATCHUP_BATCH
 from ..const import CONF_LISTEN_ADDR
 from ..const import CONF_EVENTS_DEST_ADDR
 from ..const import ATTR_AVAILABLE
@@ -95,7 +98,7 @@ class Event:
 
 class EventsCoordinator(DataUpdateCoordinator):
 
-    def __init__(self, hass, options, poll, driver, db, notify):
+    def __init__(self, hass, options, poll, driver, db, status):
         interval = _INTERVAL if poll == None else poll
 
         super().__init__(hass, _LOGGER, name='events', update_interval=interval)
@@ -105,10 +108,14 @@ class EventsCoordinator(DataUpdateCoordinator):
         self._retry_delay = hass.data[DOMAIN].get(CONF_RETRY_DELAY, 300)
         self._controllers = get_configured_controllers_ext(options)
         self._db = db
-        self._notify = notify
+        self._status = status
         self._listener_addr = options.get(CONF_EVENTS_DEST_ADDR, None)
         self._listener_enabled = hass.data[DOMAIN].get(CONF_EVENTS_LISTENER_ENABLED, True)
         self._stop = asyncio.Event()
+        self._catchup = {}
+        self._deferred = {}
+        self._store = None
+        self._catchup_batch = hass.data[DOMAIN].get(CONF_EVENTS_CATCHUP_BATCH, DEFAULT_EVENTS_CATCHUP_BATCH)
         self._initialised = False
         self._state = {
             'events': {},
@@ -133,9 +140,35 @@ class EventsCoordinator(DataUpdateCoordinator):
     def unload(self):
         try:
             self._stop.set()
+            for task in list(self._catchup.values()):
+                task.cancel()
         except Exception as err:
             _LOGGER.warning(f'error unloading events-coordinator ({err})')
 
+    # NTS: the event index for each controller is persisted so that a restart resumes from the last retrieved
+    #      event rather than skipping the events that happened while Home Assistant was not running
+    def restore(self, store, data):
+        self._store = store
+
+        if data:
+            for k, v in data.get('index', {}).items():
+                self._state['index'][int(k)] = int(v)
+
+    def _set_index(self, controller, index):
+        if self._state['index'].get(controller) != index:
+            self._state['index'][controller] = index
+
+            if self._store:
+                self._store.async_delay_save(self._persisted, _SAVE_DELAY)
+
+    def _persisted(self):
+        return {
+            'index': {
+                f'{k}': v
+                for k, v in self._state['index'].items()
+            },
+        }
+
     def _onEvent(self, evt):
         # yapf: disable
         event = Event(evt.controller,
@@ -149,14 +182,11 @@ class EventsCoordinator(DataUpdateCoordinator):
                       evt.event_reason)
         # yapf: enable
 
-        relays = evt.relays
-
-        buttons = {
-            1: evt.door_1_button,
-            2: evt.door_2_button,
-            3: evt.door_3_button,
-            4: evt.door_4_button,
-        }
+        # NTS: the event carries the controller status, which is published to the status bus so that the door state
+        #      is updated directly from the event (rather than by refreshing all the doors)
+        status = self._status.publish(evt)
+        relays = status.relays
+        buttons = status.buttons
 
         contexts = set(self.async_contexts())
         controller = event.controller
@@ -166,8 +196,11 @@ class EventsCoordinator(DataUpdateCoordinator):
             events.extend(self.doorLocks(controller, relays))
             events.extend(self.doorButtons(controller, buttons))
 
-            if not controller in self._state['index'] or self._state['index'][controller] < event.index:
-                self._state['index'][controller] = event.index
+            # ... the index is only advanced once the backlog has been retrieved (see _get_backlog)
+            if controller in self._catchup:
+                self._deferred[controller] = max(event.index, self._deferred.get(controller, event.index))
+            elif not controller in self._state['index'] or self._state['index'][controller] < event.index:
+                self._set_index(controller, event.index)
 
             self._state['events'][controller] = {
                 ATTR_AVAILABLE: True,
@@ -186,9 +219,6 @@ class EventsCoordinator(DataUpdateCoordinator):
             if event.reason in CONTROLLER_EVENTS:
                 self._on_controller_event(event)
 
-            if self._notify:
-                self._notify(event)
-
     async def _async_update_data(self):
         try:
             contexts = set(self.async_contexts())
@@ -282,46 +312,27 @@ class EventsCoordinator(DataUpdateCoordinator):
         _LOGGER.debug(f'fetch controller {controller.id} events')
 
         err = None
-
-        def g(response):
-            if response and response.controller == controller.id:
-                status = response
-                index = response.event_index
-                relays = response.relays
-                buttons = {
-                    1: response.door_1_button,
-                    2: response.door_2_button,
-                    3: response.door_3_button,
-                    4: response.door_4_button,
-                }
-
-                return namedtuple('reply', ['status', 'index', 'relays', 'buttons'])(status, index, relays, buttons)
-
-            return None
-
         info = {
             ATTR_AVAILABLE: False,
             ATTR_EVENTS: [],
         }
 
         try:
-            response = await self._uhppote.get_status(controller.id)
-            if response and response.controller == controller.id:
-                info[ATTR_STATUS] = response
-                index = response.event_index
-                relays = response.relays
-                buttons = {
-                    1: response.door_1_button,
-                    2: response.door_2_button,
-                    3: response.door_3_button,
-                    4: response.door_4_button,
-                }
+            if status := await self._status.get(controller.id):
+                info[ATTR_STATUS] = status.response
+                index = status.event_index
+                relays = status.relays
+                buttons = status.buttons
                 events = []
 
                 if not controller.id in self._state['index']:
-                    self._state['index'][controller.id] = index
+                    self._set_index(controller.id, index)
                 elif self._state['index'][controller.id] >= index:
-                    self._state['index'][controller.id] = index
+                    self._set_index(controller.id, index)
+                elif controller.id in self._catchup:
+                    pass  # NTS: backlog is being retrieved in the background
+                elif index - self._state['index'][controller.id] > _MAX_EVENTS:
+                    self._catch_up(controller.id, self._state['index'][controller.id] + 1, index, relays)
                 else:
                     count = 0
                     ix = self._state['index'][controller.id]
@@ -340,7 +351,7 @@ class EventsCoordinator(DataUpdateCoordinator):
                             if event.reason in DOOR_EVENTS:
                                 self._on_door_event(event)
 
-                    self._state['index'][controller.id] = ix
+                    self._set_index(controller.id, ix)
 
                 events.extend(self.doorLocks(controller.id, relays))
                 events.extend(self.doorButtons(controller.id, buttons))
@@ -358,6 +369,77 @@ class EventsCoordinator(DataUpdateCoordinator):
         if err is not None:
             raise err
 
+    # NTS: retrieves a large event backlog (e.g. after a network outage) in the background rather than _MAX_EVENTS
+    #      per poll. The events are fetched by the driver with a bounded window of concurrent (paced) requests and
+    #      published in order as they are received, in batches.
+    #
+    #      The event index is only advanced to the last event actually retrieved, so that if the catch-up stops
+    #      partway (e.g. on a timeout) the rest of the backlog is retrieved on the next poll. Listener events received
+    #      in the meantime are only applied to the index if the whole backlog was retrieved.
+    def _catch_up(self, controller, first, last, relays):
+        _LOGGER.info(f'controller {controller} retrieving {last - first + 1} missed events')
+
+        task = asyncio.create_task(self._get_backlog(controller, first, last, relays))
+        task.add_done_callback(lambda t: self._catchup.pop(controller, None))
+
+        self._catchup[controller] = task
+
+    async def _get_backlog(self, controller, first, last, relays):
+        ix = first - 1
+        backlog = self._uhppote.get_events(controller, first, last, self._catchup_batch)
+
+        try:
+            async for batch in backlog:
+                events = []
+                mismatch = False
+                for response in batch:
+                    if response.controller != controller or response.index != ix + 1:
+                        _LOGGER.warning(
+                            f'controller {controller} unexpected event {response.index} (expected {ix + 1})')
+                        mismatch = True
+                        break
+
+                    ix = response.index
+                    event = self.decode(response, relays)
+                    events.append(event)
+
+                    if event.reason in CARD_EVENTS:
+                        self._on_card_swipe(event)
+
+                    if event.reason in DOOR_EVENTS:
+                        self._on_door_event(event)
+
+                self._set_index(controller, ix)
+
+                # NTS: updates the listeners without rescheduling the coordinator refresh (async_set_updated_data) so
+                #      that a long backlog doesn't postpone the events poll for the other controllers
+                if len(events) > 0:
+                    self._state['events'][controller] = {
+                        ATTR_AVAILABLE: True,
+                        ATTR_EVENTS: events,
+                    }
+
+                    self._db.events = self._state['events']
+                    self.data = self._db.events
+                    self.async_update_listeners()
+
+                if mismatch:
+                    break
+
+        except Exception as exc:
+            _LOGGER.error(f'error retrieving controller {controller} missed events ({exc})')
+
+        finally:
+            await backlog.aclose()
+
+        deferred = self._deferred.pop(controller, None)
+        if ix >= last and deferred is not None:
+            self._set_index(controller, max(ix, deferred))
+        else:
+            self._set_index(controller, ix)
+
+        _LOGGER.info(f'controller {controller} retrieved missed events {first}-{ix} of {first}-{last}')
+
     def decode(self, evt, relays):
         # yapf: disable
         return Event(evt.controller,
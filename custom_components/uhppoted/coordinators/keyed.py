@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .db import Snapshot
+
+
+# NTS: DataUpdateCoordinator that indexes the entity listeners by context (door unique ID, card number, controller
+#      serial number) so that an update for a set of keys only invokes the _handle_coordinator_update_ for the
+#      entities registered for those keys (plus any entities registered without a context). A full refresh (or any
+#      update while the coordinator is in a failed state) still updates all the listeners. Unlike
+#      async_set_updated_data, a keyed update doesn't reschedule the coordinator refresh, so a steady stream of
+#      background updates can't postpone the next poll indefinitely.
+#
+#      async_publish accumulates the changed keys from background callbacks and flushes them as a single keyed update
+#      at the end of the publish window, so a burst of background refresh responses is collapsed into a handful of
+#      entity update passes rather than one pass per response. The changed keys are committed to the coordinator
+#      data (see _commit) when they are flushed.
+class KeyedCoordinator(DataUpdateCoordinator):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._keyed = {}
+        self._updated = None
+        self._window = 0
+        self._pending = set()
+        self._flush = None
+
+    @property
+    def publish_window(self):
+        return self._window
+
+    @publish_window.setter
+    def publish_window(self, window):
+        self._window = max(0, window or 0)
+
+    @callback
+    def async_add_listener(self, update_callback, context=None):
+        remove = super().async_add_listener(update_callback, context)
+        listeners = self._keyed.setdefault(context, {})
+        listeners[remove] = update_callback
+
+        @callback
+        def remove_listener():
+            remove()
+            listeners.pop(remove, None)
+            if not listeners and self._keyed.get(context) is listeners:
+                del self._keyed[context]
+
+        return remove_listener
+
+    @callback
+    def async_set_updated_keys(self, data, keys):
+        self._updated = set(keys) if self.last_update_success else None
+        try:
+            self.data = data
+            self.async_update_listeners()
+        finally:
+            self._updated = None
+
+    def revision(self, key):
+        if isinstance(self.data, Snapshot):
+            return self.data.revision(key)
+
+        return None
+
+    @callback
+    def async_publish(self, keys):
+        if not self._window:
+            self.async_set_updated_keys(self._commit(keys), keys)
+        else:
+            self._pending.update(keys)
+            if self._flush is None:
+                self._flush = self.hass.loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def async_discard(self):
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+        self._pending.clear()
+
+    @callback
+    def _async_flush(self):
+        self._flush = None
+        keys = self._pending
+        self._pending = set()
+
+        if keys:
+            self.async_set_updated_keys(self._commit(keys), keys)
+
+    def _commit(self, keys):
+        return self.data
+
+    @callback
+    def async_update_listeners(self):
+        if (keys := self._updated) is None:
+            self._pending.clear()
+            super().async_update_listeners()
+        else:
+            for key in [*keys, None]:
+                if listeners := self._keyed.get(key):
+                    for update_callback in list(listeners.values()):
+                        update_callback()
@@ -0,0 +1,77 @@
+import math
+import time
+
+_SLICE = 200  # cards per poll cycle
+_MAX_AGE = 300  # seconds
+
+
+# NTS: selects the cards to be refreshed on a poll cycle. Recently touched cards (swiped, added, deleted or updated)
+#      are refreshed first, followed by any card that would otherwise exceed max_age before the next poll and then
+#      the least recently refreshed cards up to the slice size. The slice is increased if necessary to cover all the
+#      cards within max_age, i.e. every card is refreshed at least once every max_age seconds.
+class Rotation:
+
+    def __init__(self, slice=_SLICE, max_age=_MAX_AGE, clock=time.monotonic):
+        self._slice = slice
+        self._max_age = max_age
+        self._clock = clock
+        self._refreshed = {}
+        self._touched = set()
+
+    @property
+    def slice(self):
+        return self._slice
+
+    @slice.setter
+    def slice(self, slice):
+        self._slice = max(0, int(slice or 0))
+
+    @property
+    def max_age(self):
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, max_age):
+        self._max_age = max(0, max_age or 0)
+
+    def touch(self, card):
+        self._touched.add(card)
+
+    def refreshed(self, card):
+        self._refreshed[card] = self._clock()
+
+    def select(self, cards, interval):
+        cards = list(cards)
+        touched = self._touched
+        self._touched = set()
+
+        if not self._slice or len(cards) <= self._slice:
+            return cards
+
+        now = self._clock()
+        budget = self._slice
+        if self._max_age > 0:
+            budget = max(budget, math.ceil(len(cards) * interval / self._max_age))
+
+        selected = []
+        remaining = []
+        for card in cards:
+            if card in touched:
+                selected.append(card)
+            elif (t := self._refreshed.get(card)) is not None and now - t + interval > self._max_age > 0:
+                selected.append(card)
+            else:
+                remaining.append(card)
+
+        remaining.sort(key=lambda card: self._refreshed.get(card, -math.inf))
+        selected.extend(remaining[:max(0, budget - len(selected))])
+
+        # ... discard cards that are no longer polled
+        if len(self._refreshed) > len(cards):
+            self._refreshed = {card: self._refreshed[card] for card in cards if card in self._refreshed}
+
+        return selected
+
+    def clear(self):
+        self._refreshed.clear()
+        self._touched.clear()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from contextlib import suppress
+from dataclasses import dataclass
+from dataclasses import fields
+from typing import Any
+from typing import Dict
+
+from uhppoted.structs import GetStatusResponse
+from uhppoted.structs import Event
+
+_LOGGER = logging.getLogger(__name__)
+_MAX_AGE = 27  # seconds i.e. just under the default poll interval
+_RELAYS = {
+    1: 0x01,
+    2: 0x02,
+    3: 0x04,
+    4: 0x08,
+}
+
+
+@dataclass(frozen=True)
+class DoorStatus:
+    open: bool
+    button: bool
+    locked: bool
+
+
+@dataclass(frozen=True)
+class Status:
+    controller: int
+    timestamp: float
+    event_index: int
+    relays: int
+    buttons: Dict[int, Any]
+    doors: Dict[int, DoorStatus]
+    response: Any
+
+
+# NTS: a listener event is converted to the equivalent get-status response so that the snapshot response is always
+#      a GetStatusResponse
+def decode(response, timestamp):
+    if isinstance(response, Event):
+        response = GetStatusResponse(*[getattr(response, f.name) for f in fields(GetStatusResponse)])
+
+    buttons = {
+        1: response.door_1_button,
+        2: response.door_2_button,
+        3: response.door_3_button,
+        4: response.door_4_button,
+    }
+
+    opened = {
+        1: response.door_1_open,
+        2: response.door_2_open,
+        3: response.door_3_open,
+        4: response.door_4_open,
+    }
+
+    doors = {}
+    for door, mask in _RELAYS.items():
+        doors[door] = DoorStatus(opened[door] == True, buttons[door] == True, response.relays & mask == 0x00)
+
+    return Status(response.controller, timestamp, response.event_index, response.relays, buttons, doors, response)
+
+
+# NTS: per-controller controller status shared by the doors and events coordinators (and anything else that needs
+#      it). A get-status request is only issued if the last snapshot is older than max_age (i.e. at most once per
+#      poll cycle) and concurrent requests for the same controller share a single fetch. Every new snapshot (polled
+#      or from a background cache refresh) is decoded once and published to all the subscribers. The status is
+#      fetched in the foreground if the driver has no cached record for the controller.
+class StatusBus:
+
+    def __init__(self, driver, max_age=_MAX_AGE, clock=time.monotonic):
+        self._driver = driver
+        self._max_age = max_age
+        self._clock = clock
+        self._snapshots = {}
+        self._inflight = {}
+        self._subscribers = []
+
+    @property
+    def max_age(self):
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, max_age):
+        self._max_age = max_age
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+        def unsubscribe():
+            with suppress(ValueError):
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def snapshot(self, controller):
+        return self._snapshots.get(controller)
+
+    async def get(self, controller):
+        if snapshot := self._snapshots.get(controller):
+            if self._clock() - snapshot.timestamp < self._max_age:
+                return snapshot
+
+        if (task := self._inflight.get(controller)) is None:
+            task = asyncio.ensure_future(self._fetch(controller))
+            task.add_done_callback(lambda t: self._inflight.pop(controller, None))
+            self._inflight[controller] = task
+
+        return await asyncio.shield(task)
+
+    def publish(self, response):
+        status = decode(response, self._clock())
+        self._snapshots[status.controller] = status
+
+        for callback in list(self._subscribers):
+            try:
+                callback(status)
+            except Exception as err:
+                _LOGGER.error(f'error publishing controller {status.controller} status ({err})')
+
+        return status
+
+    def clear(self):
+        self._snapshots.clear()
+
+    async def _fetch(self, controller):
+
+        async def callback(response):
+            if response and response.controller == controller:
+                self.publish(response)
+
+        # ... foreground fetch on a cold cache (the background refresh would only return None)
+        if self._driver.status_cached(controller):
+            response = await self._driver.get_status(controller, callback)
+        else:
+            response = await self._driver.get_status(controller)
+
+        if response and response.controller == controller:
+            return self.publish(response)
+
+        return None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import DOMAIN
+from .const import CONF_POLL_CONTROLLERS
+from .const import CONF_POLL_DOORS
+from .const import CONF_POLL_CARDS
+from .const import CONF_POLL_EVENTS
+
+from .coordinators.coordinators import Coordinators
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    defaults = hass.data.get(DOMAIN, {})
+    driver = Coordinators.driver(entry.entry_id)
+
+    diagnostics = {
+        'poll': {
+            'controllers': defaults.get(CONF_POLL_CONTROLLERS),
+            'doors': defaults.get(CONF_POLL_DOORS),
+            'cards': defaults.get(CONF_POLL_CARDS),
+            'events': defaults.get(CONF_POLL_EVENTS),
+        },
+    }
+
+    if driver:
+        diagnostics['cache'] = {
+            'enabled': driver.cache_enabled,
+            'expiry': driver.cache_expiry,
+            'budget': driver.cache_budget,
+            'adaptive': {
+                'enabled': driver.cache_adaptive,
+                'bounds': driver.cache_adaptive_bounds,
+                'factors': driver.cache_adaptive_factors,
+            },
+        }
+
+        diagnostics['queue'] = {
+            'workers': driver.queue_workers,
+            'max_workers': driver.queue_max_workers,
+        }
+
+        diagnostics['pacing'] = {
+            'enabled': driver.pacing_enabled,
+            'controller': driver.pacing_controller,
+            'network': driver.pacing_network,
+        }
+
+        diagnostics['cards'] = {
+            'window': driver.card_window,
+            'mirror': {
+                'enabled': driver.card_mirror,
+                'interval': driver.card_mirror_interval,
+                'samples': driver.card_mirror_samples,
+                'controllers': driver.card_mirror_status,
+            },
+        }
+
+        diagnostics['timeout'] = {
+            'adaptive': driver.adaptive_timeout,
+            'bounds': driver.adaptive_timeout_bounds,
+            'rtt': driver.rtt,
+        }
+
+        diagnostics['breaker'] = {
+            'enabled': driver.breaker_enabled,
+            'threshold': driver.breaker_threshold,
+            'probe_intervals': driver.breaker_probe_intervals,
+            'controllers': driver.breakers,
+        }
+
+        diagnostics['metrics'] = driver.metrics
+
+    return diagnostics
@@ -41,6 +41,7 @@ _REASON_BUTTON_RELEASED = EVENT_REASON_BUTTON_RELEASED
 class DoorInfo(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no, door, door_id):
         super().__init__(coordinator, context=unique_id)
@@ -102,8 +103,10 @@ class DoorInfo(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -134,6 +137,7 @@ class DoorInfo(CoordinatorEntity, SensorEntity):
 class DoorOpen(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no, door, door_id):
         super().__init__(coordinator, context=unique_id)
@@ -173,8 +177,10 @@ class DoorOpen(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -204,6 +210,7 @@ class DoorOpen(CoordinatorEntity, SensorEntity):
 class DoorLock(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no, door, door_id):
         super().__init__(coordinator, context=unique_id)
@@ -243,8 +250,10 @@ class DoorLock(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -274,6 +283,7 @@ class DoorLock(CoordinatorEntity, SensorEntity):
 class DoorButton(CoordinatorEntity, SensorEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no, door, door_id):
         super().__init__(coordinator, context=unique_id)
@@ -314,8 +324,10 @@ class DoorButton(CoordinatorEntity, SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -560,6 +572,7 @@ class DoorUnlocked(CoordinatorEntity, EventEntity):
 class DoorMode(CoordinatorEntity, SelectEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     def __init__(self, coordinator, unique_id, controller, serial_no, door, door_id):
         super().__init__(coordinator, context=unique_id)
@@ -607,6 +620,8 @@ class DoorMode(CoordinatorEntity, SelectEntity):
         return None
 
     async def async_select_option(self, option):
+        self._revision = None
+
         if option == 'UNLOCKED':
             self._mode = 1
         elif option == 'LOCKED':
@@ -629,8 +644,10 @@ class DoorMode(CoordinatorEntity, SelectEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -657,6 +674,7 @@ class DoorMode(CoordinatorEntity, SelectEntity):
 class DoorDelay(CoordinatorEntity, NumberEntity):
     _attr_icon = 'mdi:door'
     _attr_has_entity_name: True
+    _revision = None
 
     _attr_mode = 'auto'
     _attr_native_max_value = 60
@@ -696,6 +714,8 @@ class DoorDelay(CoordinatorEntity, NumberEntity):
         return self._delay
 
     async def async_set_native_value(self, value):
+        self._revision = None
+
         try:
             controller = self._serial_no
             door = self._door_id
@@ -711,8 +731,10 @@ class DoorDelay(CoordinatorEntity, NumberEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        self._update()
-        self.async_write_ha_state()
+        if (revision := self.coordinator.revision(self._unique_id)) is None or revision != self._revision:
+            self._revision = revision
+            self._update()
+            self.async_write_ha_state()
 
     async def async_update(self):
         self._update()
@@ -0,0 +1,140 @@
+import time
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitOpen(Exception):
+
+    def __init__(self, controller):
+        super().__init__(f'controller {controller} unreachable')
+        self.controller = controller
+
+
+class Circuit:
+
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.interval = None
+        self.retry = None
+        self.rejected = 0
+        self.trips = 0
+
+
+# NTS: per-controller circuit breaker. A circuit is opened after 'threshold' consecutive failed requests and
+#      requests to the controller then fail immediately until the probe interval has elapsed, after which a single
+#      request is let through as a probe (half-open). A successful probe closes the circuit and a failed probe
+#      reopens it with the probe interval doubled (up to the max. probe interval).
+class Breaker:
+
+    def __init__(self, threshold=3, interval=10, max_interval=300, clock=time.monotonic):
+        self._clock = clock
+        self._enabled = True
+        self._threshold = threshold
+        self._interval = interval
+        self._max_interval = max_interval
+        self._circuits = {}
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = enabled
+        if not enabled:
+            self._circuits.clear()
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    @threshold.setter
+    def threshold(self, threshold):
+        self._threshold = max(1, int(threshold))
+
+    @property
+    def intervals(self):
+        return (self._interval, self._max_interval)
+
+    @intervals.setter
+    def intervals(self, intervals):
+        (interval, max_interval) = intervals
+        self._interval = max(1, interval)
+        self._max_interval = max(self._interval, max_interval)
+
+    def state(self, controller):
+        if circuit := self._circuits.get(controller):
+            return circuit.state
+
+        return CLOSED
+
+    def allow(self, controller):
+        if not self._enabled or (circuit := self._circuits.get(controller)) is None:
+            return True
+
+        # NTS: a probe that never completes (e.g. cancelled) is replaced by another probe after the probe interval
+        if circuit.state in (OPEN, HALF_OPEN) and (now := self._clock()) >= circuit.retry:
+            circuit.state = HALF_OPEN
+            circuit.retry = now + circuit.interval
+            return True
+
+        if circuit.state == CLOSED:
+            return True
+
+        circuit.rejected += 1
+
+        return False
+
+    # NTS: returns True if the circuit was closed
+    def succeeded(self, controller):
+        if circuit := self._circuits.get(controller):
+            closed = circuit.state != CLOSED
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.interval = None
+            circuit.retry = None
+
+            return closed
+
+        return False
+
+    # NTS: returns the probe interval if the circuit was opened (or reopened)
+    def failed(self, controller):
+        if not self._enabled:
+            return None
+
+        circuit = self._circuits.setdefault(controller, Circuit())
+        circuit.failures += 1
+
+        if circuit.state == HALF_OPEN:
+            circuit.interval = min(2 * circuit.interval, self._max_interval)
+        elif circuit.state == CLOSED and circuit.failures >= self._threshold:
+            circuit.interval = self._interval
+            circuit.trips += 1
+        else:
+            return None
+
+        circuit.state = OPEN
+        circuit.retry = self._clock() + circuit.interval
+
+        return circuit.interval
+
+    def clear(self):
+        self._circuits.clear()
+
+    def snapshot(self):
+        now = self._clock()
+
+        return {
+            f'{k}': {
+                'state': v.state,
+                'failures': v.failures,
+                'trips': v.trips,
+                'rejected': v.rejected,
+                'probe': round(max(0.0, v.retry - now), 1) if v.state == OPEN else None,
+            }
+            for k, v in self._circuits.items()
+        }
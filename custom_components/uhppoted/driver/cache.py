@@ -0,0 +1,205 @@
+import heapq
+import logging
+import sys
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    response: Any
+    expires: float
+    category: str
+    size: int
+    stale: bool = False
+
+
+_COUNTERS = ('hits', 'misses', 'stale', 'expired', 'evicted')
+
+
+# NTS: expiry times are tracked in a min-heap on the monotonic clock so that evicting expired entries only costs
+#      O(expired * log N) rather than a scan of the whole cache. Replacing an entry leaves its previous expiry
+#      in the heap - stale heap entries are discarded when popped and the heap is rebuilt if they accumulate.
+#
+#      Entries are also kept in least-recently-used order per category (the driver uses the expiry class as the
+#      category) and the least recently used entries are evicted when a category exceeds its entry or byte budget.
+class Cache:
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._entries = {}
+        self._lru = {}
+        self._bytes = {}
+        self._budget = {}
+        self._expiry = []
+        self._stats = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def budget(self):
+        return self._budget
+
+    @budget.setter
+    def budget(self, budget):
+        self._budget = {k: _budget(v) for k, v in budget.items()}
+        for category in list(self._lru.keys()):
+            self._trim(category)
+
+    def entries(self, category):
+        return len(self._lru.get(category, {}))
+
+    def bytes(self, category):
+        return self._bytes.get(category, 0)
+
+    # NTS: a lookup that finds an entry past its expiry time is counted as a miss. 'stale' counts the lookups
+    #      served from a stale entry i.e. an entry restored from a snapshot that hasn't been refreshed yet.
+    @property
+    def stats(self):
+        return {k: dict(v) for k, v in self._stats.items()}
+
+    def get(self, key, category=None):
+        record = self._entries.get(key)
+
+        if record is None:
+            self._count(category, 'misses')
+        elif record.expires is None or self._clock() < record.expires:
+            self._lru[record.category].move_to_end(key)
+            self._count(record.category, 'stale' if record.stale else 'hits')
+            return record.response
+        else:
+            self._count(record.category, 'misses')
+
+        return None
+
+    def peek(self, key):
+        if record := self._entries.get(key):
+            return record.response
+
+        return None
+
+    def remaining(self, key):
+        if record := self._entries.get(key):
+            if record.expires is not None:
+                return record.expires - self._clock()
+
+        return None
+
+    def items(self):
+        now = self._clock()
+        for key, record in self._entries.items():
+            yield (key, record.response, record.category, None if record.expires is None else record.expires - now)
+
+    def put(self, key, response, lifetime, category=None, stale=False):
+        expires = self._clock() + lifetime if lifetime else None
+        size = _sizeof(key, response)
+
+        self._remove(key)
+        self._entries[key] = CacheEntry(response, expires, category, size, stale)
+        self._lru.setdefault(category, OrderedDict())[key] = None
+        self._bytes[category] = self._bytes.get(category, 0) + size
+
+        if expires is not None:
+            heapq.heappush(self._expiry, (expires, key))
+
+            if len(self._expiry) > 2 * len(self._entries) + 64:
+                self._compact()
+
+        return self._trim(category)
+
+    def delete(self, key):
+        self._remove(key)
+
+    def clear(self):
+        self._entries.clear()
+        self._lru.clear()
+        self._bytes.clear()
+        self._expiry.clear()
+        self._stats.clear()
+
+    def evict(self):
+        now = self._clock()
+        expired = 0
+
+        while self._expiry and self._expiry[0][0] <= now:
+            (expires, key) = heapq.heappop(self._expiry)
+            record = self._entries.get(key)
+            if record is not None and record.expires == expires:
+                self._remove(key)
+                self._count(record.category, 'expired')
+                expired += 1
+
+        return expired
+
+    def _remove(self, key):
+        if record := self._entries.pop(key, None):
+            del self._lru[record.category][key]
+            self._bytes[record.category] -= record.size
+
+    def _trim(self, category):
+        (max_entries, max_bytes) = self._budget.get(category, (None, None))
+        lru = self._lru.get(category)
+        evicted = 0
+
+        def exceeded():
+            if max_entries is not None and len(lru) > max_entries:
+                return True
+
+            if max_bytes is not None and self._bytes[category] > max_bytes:
+                return True
+
+            return False
+
+        while lru and exceeded():
+            self._remove(next(iter(lru)))
+            self._count(category, 'evicted')
+            evicted += 1
+
+        return evicted
+
+    def _count(self, category, counter):
+        stats = self._stats.setdefault(category, dict.fromkeys(_COUNTERS, 0))
+        stats[counter] += 1
+
+    def _compact(self):
+        self._expiry = [(v.expires, k) for k, v in self._entries.items() if v.expires is not None]
+        heapq.heapify(self._expiry)
+
+
+# NTS: a budget is either a dict with optional 'entries' and 'bytes' limits, an (entries, bytes) tuple or an integer
+#      entry budget. Anything else is ignored (with a warning) i.e. no budget for the category.
+def _budget(v):
+    if isinstance(v, dict):
+        return (v.get('entries', None), v.get('bytes', None))
+
+    if v is None:
+        return (None, None)
+
+    if isinstance(v, int) and not isinstance(v, bool):
+        return (v, None)
+
+    if isinstance(v, (list, tuple)) and len(v) == 2:
+        return tuple(v)
+
+    _LOGGER.warning(f'invalid cache budget ({v}) - ignored')
+
+    return (None, None)
+
+
+# NTS: approximate size of a cached response i.e. the response object, its (top level) fields and the key
+def _sizeof(key, response):
+    size = sys.getsizeof(key) + sys.getsizeof(response)
+
+    if hasattr(response, '__dict__'):
+        size += sum(sys.getsizeof(v) for v in vars(response).values())
+
+    return size
@@ -0,0 +1,64 @@
+import asyncio
+
+from uhppoted import encode
+from uhppoted import decode
+from uhppoted import net
+
+
+class DiscoveryProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, queue):
+        self._queue = queue
+
+    def datagram_received(self, packet, _addr):
+        if len(packet) == 64:
+            self._queue.put_nowait(packet)
+
+    def error_received(self, exc):
+        self._queue.put_nowait(exc)
+
+
+# NTS: broadcasts a get-controller request and yields the get-controller responses as they are received (rather
+#      than after the timeout, as for get-all-controllers). Duplicate replies (e.g. a controller reachable on more
+#      than one interface) are only yielded once.
+async def discover(bind, broadcast, timeout=2.5):
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    request = encode.get_controller_request(0)
+    dest = net.resolve(broadcast)
+    transports = []
+    seen = set()
+
+    try:
+        # NTS: avoid broadcast-to-self if the OS happens to bind the socket to the broadcast port
+        for _ in range(5):
+            transport, _ = await loop.create_datagram_endpoint(lambda: DiscoveryProtocol(queue),
+                                                               local_addr=(bind, 0),
+                                                               allow_broadcast=True)
+            transports.append(transport)
+
+            (_, port) = transport.get_extra_info('sockname')
+            if port != dest[1]:
+                break
+        else:
+            raise RuntimeError(f'OS bound UDP socket to port {dest[1]} reserved for broadcast')
+
+        transport.sendto(request, dest)
+
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                packet = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+
+            if isinstance(packet, Exception):
+                raise packet
+
+            response = decode.get_controller_response(packet)
+            if response.controller not in seen:
+                seen.add(response.controller)
+                yield response
+    finally:
+        for transport in transports:
+            transport.close()
@@ -0,0 +1,148 @@
+import bisect
+import time
+
+# NTS: latency histogram bucket upper bounds (seconds) - the last bucket counts everything slower than 5s
+_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+
+    def __init__(self):
+        self._counts = [0] * (len(_BUCKETS) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, dt):
+        self._counts[bisect.bisect_left(_BUCKETS, dt)] += 1
+        self._count += 1
+        self._sum += dt
+        self._max = max(self._max, dt)
+
+    def snapshot(self):
+        buckets = {f'le {v}s': n for v, n in zip(_BUCKETS, self._counts)}
+        buckets['+Inf'] = self._counts[-1]
+
+        return {
+            'count': self._count,
+            'mean': round(self._sum / self._count, 6) if self._count > 0 else None,
+            'max': round(self._max, 6),
+            'buckets': buckets,
+        }
+
+
+class Operation:
+
+    def __init__(self):
+        self.requests = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.latency = Histogram()
+
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'latency': self.latency.snapshot(),
+        }
+
+
+class Lane:
+
+    def __init__(self, workers, created):
+        self.workers = workers
+        self.created = created
+        self.active = 0
+        self.busy = 0.0
+        self.enqueued = 0
+        self.merged = 0
+        self.completed = 0
+
+
+# NTS: request metrics are keyed by (controller, operation). Worker utilisation is the time spent processing
+#      background requests as a fraction of the time available to the lane's workers since the lane was created.
+class Metrics:
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._started = clock()
+        self._operations = {}
+        self._lanes = {}
+        self._peak_depth = 0
+
+    async def call(self, controller, op, f):
+        operation = self._operations.setdefault((controller, op), Operation())
+        operation.requests += 1
+        start = self._clock()
+
+        try:
+            return await f()
+        except TimeoutError:
+            operation.timeouts += 1
+            raise
+        except Exception:
+            operation.errors += 1
+            raise
+        finally:
+            operation.latency.observe(self._clock() - start)
+
+    def lane(self, controller, workers):
+        self._lanes[controller] = Lane(workers, self._clock())
+
+    def enqueued(self, controller, depth, merged=False):
+        if lane := self._lanes.get(controller):
+            if merged:
+                lane.merged += 1
+            else:
+                lane.enqueued += 1
+
+        self._peak_depth = max(self._peak_depth, depth)
+
+    def started(self, controller):
+        if lane := self._lanes.get(controller):
+            lane.active += 1
+
+        return self._clock()
+
+    def finished(self, controller, start):
+        if lane := self._lanes.get(controller):
+            lane.active -= 1
+            lane.completed += 1
+            lane.busy += self._clock() - start
+
+    def clear(self):
+        self._started = self._clock()
+        self._operations.clear()
+        self._lanes.clear()
+        self._peak_depth = 0
+
+    def snapshot(self, cache, depth):
+        now = self._clock()
+        requests = {}
+        lanes = {}
+
+        for (controller, op), v in sorted(self._operations.items(), key=lambda item: (str(item[0][0]), item[0][1])):
+            requests.setdefault(f'{controller}', {})[op] = v.snapshot()
+
+        for controller, lane in self._lanes.items():
+            elapsed = (now - lane.created) * lane.workers
+            lanes[f'{controller}'] = {
+                'workers': lane.workers,
+                'active': lane.active,
+                'enqueued': lane.enqueued,
+                'merged': lane.merged,
+                'completed': lane.completed,
+                'utilisation': round(lane.busy / elapsed, 4) if elapsed > 0 else 0.0,
+            }
+
+        return {
+            'uptime': round(now - self._started, 3),
+            'cache': cache,
+            'requests': requests,
+            'queue': {
+                'depth': depth,
+                'peak': self._peak_depth,
+                'lanes': lanes,
+            },
+        }
@@ -0,0 +1,139 @@
+import random
+import time
+
+from types import MappingProxyType
+
+_FIELDS = ('card_number', 'start_date', 'end_date', 'door_1', 'door_2', 'door_3', 'door_4', 'pin')
+
+
+class Table:
+
+    def __init__(self, cards, swept):
+        self.cards = cards
+        self.swept = swept
+        self.updated = {}
+        self.sweeps = 1
+
+
+# NTS: a local copy of the card table for each controller, built by a get-cards/get-card-by-index sweep. A table
+#      is replaced as a whole after a sweep and is only updated in place by a card write (write-through) or a card
+#      refreshed from the controller.
+#
+#      The card writes made while a sweep is in progress are journalled and replayed after the swept table has
+#      replaced the mirror, since the sweep may have read the card before it was written. The age of a card is the
+#      time since it was last swept, written or refreshed.
+class CardMirror:
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._tables = {}
+        self._journals = {}
+
+    @property
+    def controllers(self):
+        return list(self._tables.keys())
+
+    def ready(self, controller):
+        return controller in self._tables
+
+    def get(self, controller, card):
+        if table := self._tables.get(controller):
+            return table.cards.get(card)
+
+        return None
+
+    def count(self, controller):
+        if table := self._tables.get(controller):
+            return len(table.cards)
+
+        return None
+
+    def cards(self, controller):
+        if table := self._tables.get(controller):
+            return MappingProxyType(table.cards)
+
+        return None
+
+    def sample(self, controller, N):
+        if table := self._tables.get(controller):
+            records = list(table.cards.values())
+            return random.sample(records, min(N, len(records)))
+
+        return []
+
+    def age(self, controller, card):
+        if table := self._tables.get(controller):
+            return self._clock() - table.updated.get(card, table.swept)
+
+        return None
+
+    def begin(self, controller):
+        self._journals[controller] = {}
+
+    def abort(self, controller):
+        self._journals.pop(controller, None)
+
+    def replace(self, controller, cards):
+        sweeps = self._tables[controller].sweeps + 1 if controller in self._tables else 1
+
+        self._tables[controller] = Table(dict(cards), self._clock())
+        self._tables[controller].sweeps = sweeps
+
+        for card, record in self._journals.pop(controller, {}).items():
+            if record is None:
+                self._delete(controller, card)
+            else:
+                self._put(controller, record)
+
+    def put(self, controller, record):
+        if (journal := self._journals.get(controller)) is not None:
+            journal[record.card_number] = record
+
+        self._put(controller, record)
+
+    def delete(self, controller, card):
+        if (journal := self._journals.get(controller)) is not None:
+            journal[card] = None
+
+        self._delete(controller, card)
+
+    def refreshed(self, controller, card, record):
+        if record is not None and record.card_number == card:
+            self._put(controller, record)
+        elif record is not None and record.card_number == 0:
+            self._delete(controller, card)
+
+    def invalidate(self, controller):
+        self._tables.pop(controller, None)
+
+    def clear(self):
+        self._tables.clear()
+        self._journals.clear()
+
+    def _put(self, controller, record):
+        if table := self._tables.get(controller):
+            table.cards[record.card_number] = record
+            table.updated[record.card_number] = self._clock()
+
+    def _delete(self, controller, card):
+        if table := self._tables.get(controller):
+            table.cards.pop(card, None)
+            table.updated[card] = self._clock()
+
+    def status(self):
+        now = self._clock()
+
+        return {
+            f'{k}': {
+                'cards': len(v.cards),
+                'age': round(now - v.swept, 1),
+                'sweeps': v.sweeps,
+            }
+            for k, v in self._tables.items()
+        }
+
+
+# NTS: compares the card fields that are written by put-card i.e. ignores the first-card settings and the
+#      response type (get-card vs. get-card-by-index)
+def same(p, q):
+    return all(getattr(p, f, None) == getattr(q, f, None) for f in _FIELDS)
@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self._clock = clock
+        self._rate = None
+        self._burst = 1
+        self._tokens = 1.0
+        self._updated = clock()
+        self.configure(rate, burst)
+        self._tokens = float(self._burst)
+
+    @property
+    def rate(self):
+        return self._rate
+
+    @property
+    def burst(self):
+        return self._burst
+
+    def configure(self, rate, burst):
+        self._rate = float(rate) if rate else None
+        self._burst = max(1, int(burst or 1))
+        self._tokens = min(self._tokens, float(self._burst))
+
+    # NTS: a token is reserved immediately, even if the bucket is empty, and the caller then waits until the
+    #      deficit has been refilled. Requests are therefore released in the order they arrived without needing
+    #      a lock (which would tie the bucket to a single event loop).
+    async def acquire(self):
+        if self._rate is None:
+            return
+
+        now = self._clock()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated) * self._rate) - 1.0
+        self._updated = now
+
+        if self._tokens < 0.0:
+            await asyncio.sleep(-self._tokens / self._rate)
+
+
+# NTS: the network buckets are shared by all the drivers using the same bind address i.e. all the config entries
+#      sending requests from the same interface. A shared bucket is reconfigured with the rate and burst of the
+#      most recently configured driver and is discarded when the last driver using it is stopped.
+_NETWORKS = {}
+_USERS = {}
+
+
+# NTS: requests are paced by a token bucket per controller and a token bucket per bind address. A request first
+#      waits for the controller bucket so that a backlog for one controller doesn't hold up the network bucket for
+#      everybody else. A rate of 0 (or None) disables the bucket.
+class Pacer:
+
+    def __init__(self, bind, controller, network, clock=time.monotonic):
+        self._clock = clock
+        self._enabled = True
+        self._controller = controller
+        self._controllers = {}
+        self._bind = bind
+
+        (rate, burst) = network
+        if (bucket := _NETWORKS.get(bind)) is None:
+            bucket = _NETWORKS.setdefault(bind, TokenBucket(rate, burst, clock))
+        else:
+            bucket.configure(rate, burst)
+
+        _USERS[bind] = _USERS.get(bind, 0) + 1
+
+        self._network = bucket
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = enabled
+
+    @property
+    def controller(self):
+        return self._controller
+
+    @controller.setter
+    def controller(self, bucket):
+        (rate, burst) = bucket
+        self._controller = (rate, burst)
+        for v in self._controllers.values():
+            v.configure(rate, burst)
+
+    @property
+    def network(self):
+        return (self._network.rate, self._network.burst)
+
+    @network.setter
+    def network(self, bucket):
+        (rate, burst) = bucket
+        self._network.configure(rate, burst)
+
+    async def acquire(self, controller):
+        if self._enabled:
+            if (bucket := self._controllers.get(controller)) is None:
+                (rate, burst) = self._controller
+                bucket = self._controllers.setdefault(controller, TokenBucket(rate, burst, self._clock))
+
+            await bucket.acquire()
+            await self._network.acquire()
+
+    def clear(self):
+        self._controllers.clear()
+
+        if self._bind is not None and _NETWORKS.get(self._bind) is self._network:
+            _USERS[self._bind] -= 1
+            if _USERS[self._bind] <= 0:
+                del _NETWORKS[self._bind]
+                del _USERS[self._bind]
+
+        self._bind = None
@@ -0,0 +1,90 @@
+_ALPHA = 1 / 8
+_BETA = 1 / 4
+_K = 4
+_GRANULARITY = 0.010  # seconds
+
+
+class Estimate:
+
+    def __init__(self, rtt):
+        self.srtt = rtt
+        self.rttvar = rtt / 2
+        self.backoff = 1
+        self.samples = 1
+
+    def update(self, rtt):
+        self.rttvar = (1 - _BETA) * self.rttvar + _BETA * abs(self.srtt - rtt)
+        self.srtt = (1 - _ALPHA) * self.srtt + _ALPHA * rtt
+        self.backoff = 1
+        self.samples += 1
+
+    def rto(self):
+        return self.srtt + max(_GRANULARITY, _K * self.rttvar)
+
+
+# NTS: per-controller smoothed RTT and RTT variance (Jacobson/Karels, as for TCP - RFC 6298). The request timeout
+#      is srtt + 4*rttvar, bounded by [min,max], and falls back to the configured timeout for a controller until
+#      there is at least one sample.
+#
+#      Every request is a new request (there are no retransmits at this level) so every response is an unambiguous
+#      RTT sample. A timeout doubles the timeout for the controller (Karn's algorithm) which is then kept until the
+#      next successful response.
+class RTT:
+
+    def __init__(self, min=1.0, max=5.0):
+        self._enabled = True
+        self._min = min
+        self._max = max
+        self._estimates = {}
+
+    @property
+    def enabled(self):
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled):
+        self._enabled = enabled
+
+    @property
+    def bounds(self):
+        return (self._min, self._max)
+
+    @bounds.setter
+    def bounds(self, bounds):
+        (lower, upper) = bounds
+        self._min = float(lower)
+        self._max = max(float(upper), self._min)
+
+    def timeout(self, controller, default):
+        if not self._enabled or (estimate := self._estimates.get(controller)) is None:
+            return default
+
+        rto = min(max(self._min, estimate.rto()), self._max)
+
+        return min(rto * estimate.backoff, self._max)
+
+    def sample(self, controller, rtt):
+        if (estimate := self._estimates.get(controller)) is None:
+            self._estimates[controller] = Estimate(rtt)
+        else:
+            estimate.update(rtt)
+
+    def expired(self, controller):
+        if estimate := self._estimates.get(controller):
+            if self.timeout(controller, self._max) < self._max:
+                estimate.backoff *= 2
+
+    def clear(self):
+        self._estimates.clear()
+
+    def snapshot(self):
+        return {
+            f'{k}': {
+                'srtt': round(v.srtt, 6),
+                'rttvar': round(v.rttvar, 6),
+                'backoff': v.backoff,
+                'samples': v.samples,
+                'timeout': round(self.timeout(k, None), 6) if self._enabled else None,
+            }
+            for k, v in self._estimates.items()
+        }
@@ -0,0 +1,78 @@
+import dataclasses
+import datetime
+import ipaddress
+
+from collections.abc import Mapping
+
+# NTS: cached responses are (nested) dataclasses with date/time and IPv4 address fields, which are encoded as
+#      JSON compatible values with a type tag. Dataclasses are decoded by class name and only if the class is in
+#      the list of known types, so a snapshot can't be used to instantiate arbitrary classes.
+
+
+def encode(v):
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return v
+
+    if dataclasses.is_dataclass(v) and not isinstance(v, type):
+        fields = {f.name: encode(getattr(v, f.name)) for f in dataclasses.fields(v)}
+
+        return {'__type__': 'dataclass', 'class': type(v).__name__, 'fields': fields}
+
+    if isinstance(v, datetime.datetime):
+        return {'__type__': 'datetime', 'value': v.isoformat()}
+
+    if isinstance(v, datetime.date):
+        return {'__type__': 'date', 'value': v.isoformat()}
+
+    if isinstance(v, datetime.time):
+        return {'__type__': 'time', 'value': v.isoformat()}
+
+    if isinstance(v, ipaddress.IPv4Address):
+        return {'__type__': 'ipv4', 'value': f'{v}'}
+
+    if isinstance(v, Mapping):
+        return {'__type__': 'mapping', 'items': [[encode(k), encode(u)] for k, u in v.items()]}
+
+    if isinstance(v, tuple):
+        return {'__type__': 'tuple', 'items': [encode(u) for u in v]}
+
+    if isinstance(v, list):
+        return [encode(u) for u in v]
+
+    raise ValueError(f'unsupported type {type(v).__name__}')
+
+
+def decode(v, types):
+    if isinstance(v, list):
+        return [decode(u, types) for u in v]
+
+    if not isinstance(v, dict):
+        return v
+
+    tag = v.get('__type__')
+
+    if tag == 'dataclass':
+        if (clazz := types.get(v['class'])) is None:
+            raise ValueError(f"unknown type {v['class']}")
+
+        return clazz(**{k: decode(u, types) for k, u in v['fields'].items()})
+
+    if tag == 'datetime':
+        return datetime.datetime.fromisoformat(v['value'])
+
+    if tag == 'date':
+        return datetime.date.fromisoformat(v['value'])
+
+    if tag == 'time':
+        return datetime.time.fromisoformat(v['value'])
+
+    if tag == 'ipv4':
+        return ipaddress.IPv4Address(v['value'])
+
+    if tag == 'mapping':
+        return {decode(k, types): decode(u, types) for (k, u) in v['items']}
+
+    if tag == 'tuple':
+        return tuple(decode(u, types) for u in v['items'])
+
+    raise ValueError(f'unknown type tag {tag}')
@@ -0,0 +1,63 @@
+_GROW = 2.0
+_SHRINK = 0.5
+
+
+# NTS: the cache lifetime for a key is the configured expiry for the category scaled by a per-key factor that is
+#      doubled every time a background refresh returns an unchanged value and reset (and then halved) every time
+#      it returns a changed value, bounded by [min,max]. The factor starts at 1 i.e. the configured expiry.
+class AdaptiveTTL:
+
+    def __init__(self, min=0.5, max=4.0):
+        self._min = min
+        self._max = max
+        self._factors = {}
+
+    @property
+    def bounds(self):
+        return (self._min, self._max)
+
+    @bounds.setter
+    def bounds(self, bounds):
+        (lower, upper) = bounds
+        self._min = min(float(lower), 1.0)
+        self._max = max(float(upper), 1.0)
+        self._factors = {k: min(max(v, self._min), self._max) for k, v in self._factors.items()}
+
+    def factor(self, key):
+        return self._factors.get(key, 1.0)
+
+    def lifetime(self, key, lifetime):
+        if lifetime is None:
+            return None
+
+        return lifetime * self._factors.get(key, 1.0)
+
+    def observe(self, key, changed):
+        factor = self._factors.get(key, 1.0)
+
+        if changed and factor > 1.0:
+            factor = 1.0
+        elif changed:
+            factor = max(self._min, factor * _SHRINK)
+        else:
+            factor = min(self._max, factor * _GROW)
+
+        if factor == 1.0:
+            self._factors.pop(key, None)
+        else:
+            self._factors[key] = factor
+
+        return factor
+
+    def forget(self, key):
+        self._factors.pop(key, None)
+
+    def clear(self):
+        self._factors.clear()
+
+    def histogram(self):
+        histogram = {}
+        for v in self._factors.values():
+            histogram[f'{v:g}'] = histogram.get(f'{v:g}', 0) + 1
+
+        return dict(sorted(histogram.items(), key=lambda kv: float(kv[0])))
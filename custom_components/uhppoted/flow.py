@@ -39,15 +39,19 @@ class UhppotedFlow:
         self._timezone = DEFAULT_CONTROLLER_TIMEZONE
         self._interlocks = DEFAULT_INTERLOCKS
         self._antipassback = DEFAULT_ANTIPASSBACK
+        self._discovered = None
 
     def initialise(self, defaults):
         self._defaults = self.hass.data.get(DOMAIN, {})
         self._timezone = defaults.get(CONF_TIMEZONE, DEFAULT_CONTROLLER_TIMEZONE)
 
-    def _get_all_controllers(self, options):
-        preconfigured = self._defaults.get(CONF_CONTROLLERS, [])
+    # NTS: the controller list is only discovered once for the lifetime of the flow
+    async def _get_all_controllers(self, options):
+        if self._discovered is None:
+            preconfigured = self._defaults.get(CONF_CONTROLLERS, [])
+            self._discovered = await get_all_controllers(preconfigured, options)
 
-        return get_all_controllers(preconfigured, options)
+        return copy.deepcopy(self._discovered)
 
     def step_controllers(self, controllers, selected, options, user_input, cache):
         errors: Dict[str, str] = {}
@@ -215,7 +215,7 @@ class UhppotedOptionsFlow(UhppotedFlow, OptionsFlow):
         return self.async_show_form(step_id="events", data_schema=schema, errors=errors)
 
     async def async_step_controllers(self, user_input: Optional[Dict[str, Any]] = None):
-        controllers = self._get_all_controllers(self.options)
+        controllers = await self._get_all_controllers(self.options)
         if len(controllers) < 1:
             return await self.async_step_door()
 
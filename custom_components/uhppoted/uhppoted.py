@@ -1,15 +1,21 @@
 import asyncio
+import dataclasses
+import itertools
 import logging
+import time
 
 from collections import namedtuple
+from types import MappingProxyType
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from asyncio import Queue
+from asyncio import PriorityQueue
+from asyncio import Semaphore
 from typing import Any
+from typing import Callable
 from contextlib import suppress
 
 from uhppoted import uhppote
 from uhppoted import uhppote_async
+from uhppoted import structs
 from uhppoted.structs import GetTimeResponse
 from uhppoted.structs import GetListenerResponse
 from uhppoted.structs import GetDoorControlResponse
@@ -27,6 +33,20 @@ from .const import CONF_CACHE_EXPIRY_INTERLOCK
 from .const import CONF_CACHE_EXPIRY_ANTIPASSBACK
 from .const import CONF_CACHE_EXPIRY_EVENT
 
+from .driver.cache import Cache
+from .driver.metrics import Metrics
+from .driver.ttl import AdaptiveTTL
+from .driver.pacing import Pacer
+from .driver.rtt import RTT
+from .driver.breaker import Breaker
+from .driver.breaker import CircuitOpen
+from .driver.breaker import CLOSED
+from .driver.discovery import discover
+from .driver.mirror import CardMirror
+from .driver import mirror
+from .driver.snapshot import encode
+from .driver.snapshot import decode
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -66,13 +86,50 @@ class GetInterlockResponse:
     interlock: int
 
 
-@dataclass
-class CacheEntry:
-    response: Any
-    expires: datetime
+# NTS: response types that can be restored from a cache snapshot
+_TYPES = {k: v for k, v in vars(structs).items() if isinstance(v, type) and dataclasses.is_dataclass(v)}
+_TYPES['GetInterlockResponse'] = GetInterlockResponse
+
 
+@dataclass
+class Request:
+    key: str
+    expiry: str
+    priority: int
+    enqueued: float
+    message: str
+    f: Callable
+    callbacks: list
+
+    # NTS: a callback from the same call site supersedes the pending callback rather than being added to the list
+    #      (the coordinators create a new callback closure on every poll)
+    def merge(self, callback):
+        if callback is not None:
+            qualname = getattr(callback, '__qualname__', None)
+            callbacks = [cb for cb in self.callbacks if getattr(cb, '__qualname__', None) != qualname]
+            self.callbacks = callbacks + [callback]
+
+
+# NTS: controller status, date/time and events are excluded from adaptive expiry - status and date/time change on
+#      every refresh and events never change. The interlock mode is never refreshed from the controller.
+_ADAPTIVE = {
+    CONF_CACHE_EXPIRY_CONTROLLER,
+    CONF_CACHE_EXPIRY_LISTENER,
+    CONF_CACHE_EXPIRY_DOOR,
+    CONF_CACHE_EXPIRY_CARD,
+    CONF_CACHE_EXPIRY_ANTIPASSBACK,
+}
 
-_CACHE = {}
+# NTS: controller status, date/time and the interlock mode are not included in the cache snapshot - status and
+#      date/time are out of date by the time they're restored and the interlock mode is persisted separately
+_SNAPSHOT = {
+    CONF_CACHE_EXPIRY_CONTROLLER,
+    CONF_CACHE_EXPIRY_LISTENER,
+    CONF_CACHE_EXPIRY_DOOR,
+    CONF_CACHE_EXPIRY_CARD,
+    CONF_CACHE_EXPIRY_ANTIPASSBACK,
+    CONF_CACHE_EXPIRY_EVENT,
+}
 
 _DEFAULT_CACHE_EXPIRY = {
     CONF_CACHE_EXPIRY_CONTROLLER: const.DEFAULT_CACHE_EXPIRY_CONTROLLER,
@@ -86,6 +143,42 @@ _DEFAULT_CACHE_EXPIRY = {
     CONF_CACHE_EXPIRY_EVENT: const.DEFAULT_CACHE_EXPIRY_EVENT,
 }
 
+# NTS: lower values are refreshed first - controller status drives the door state and events, cards are the most
+#      numerous and least time sensitive
+_PRIORITY = {
+    CONF_CACHE_EXPIRY_STATUS: 0,
+    CONF_CACHE_EXPIRY_DOOR: 1,
+    CONF_CACHE_EXPIRY_CONTROLLER: 2,
+    CONF_CACHE_EXPIRY_LISTENER: 2,
+    CONF_CACHE_EXPIRY_DATETIME: 2,
+    CONF_CACHE_EXPIRY_INTERLOCK: 2,
+    CONF_CACHE_EXPIRY_ANTIPASSBACK: 2,
+    CONF_CACHE_EXPIRY_EVENT: 3,
+    CONF_CACHE_EXPIRY_CARD: 4,
+}
+
+
+# NTS: maps controller serial number to the prebuilt ((controller, dest, protocol), timeout) used for every request
+def _routing_table(controllers, broadcast, timeout):
+    routes = {}
+
+    for v in controllers:
+        controller = v['controller']
+        addr = v.get('address', None)
+        port = v.get('port', 60000)
+        protocol = v.get('protocol', 'udp')
+
+        if addr is None:
+            dest = (controller, None, 'udp')
+        elif f'{addr}:{port}' == broadcast:
+            dest = (controller, None, 'udp')
+        else:
+            dest = (controller, f'{addr}:{port}', protocol)
+
+        routes.setdefault(controller, (dest, v.get('timeout', timeout)))
+
+    return MappingProxyType(routes)
+
 
 class uhppoted:
 
@@ -95,12 +188,36 @@ class uhppoted:
         self._asio = uhppote_async.UhppoteAsync(bind, broadcast, listen, debug)
         self._timeout = timeout
         self._controllers = controllers
+        self._routes = _routing_table(controllers, broadcast, timeout)
         self._listen_addr = listen
-        self.queue = Queue()
+        self._lanes = {}
+        self._pending = {}
+        self._sequence = itertools.count()
+        self._queue_workers = const.DEFAULT_QUEUE_WORKERS
+        self._queue_max_workers = const.DEFAULT_QUEUE_MAX_WORKERS
+        self._card_window = const.DEFAULT_CARDS_WINDOW
+        self._event_window = const.DEFAULT_EVENTS_CATCHUP_WINDOW
+        self._mirror = CardMirror()
+        self._mirror_enabled = const.DEFAULT_CARDS_MIRROR_ENABLED
+        self._mirror_interval = const.DEFAULT_CARDS_MIRROR_INTERVAL
+        self._mirror_samples = const.DEFAULT_CARDS_MIRROR_SAMPLES
+        self._sweeps = {}
+        self._concurrency = Semaphore(self._queue_max_workers)
+        self._tasks = set()
+        self._cache = Cache()
         self._cache_enabled = True
         self._cache_expiry = {}
+        self._cache_adaptive = const.DEFAULT_CACHE_ADAPTIVE_ENABLED
+        self._ttl = AdaptiveTTL(const.DEFAULT_CACHE_ADAPTIVE_MIN, const.DEFAULT_CACHE_ADAPTIVE_MAX)
         self._debug = debug
         self._warnings = set()
+        self._inflight = {}
+        self._metrics = Metrics()
+        self._pacer = Pacer(bind, (const.DEFAULT_PACING_CONTROLLER_RATE, const.DEFAULT_PACING_CONTROLLER_BURST),
+                            (const.DEFAULT_PACING_NETWORK_RATE, const.DEFAULT_PACING_NETWORK_BURST))
+        self._rtt = RTT(const.DEFAULT_ADAPTIVE_TIMEOUT_MIN, const.DEFAULT_ADAPTIVE_TIMEOUT_MAX)
+        self._breaker = Breaker(const.DEFAULT_BREAKER_THRESHOLD, const.DEFAULT_BREAKER_PROBE_INTERVAL,
+                                const.DEFAULT_BREAKER_MAX_PROBE_INTERVAL)
 
     @property
     def api(self):
@@ -114,6 +231,15 @@ class uhppoted:
     def controllers(self):
         return [v['controller'] for v in self._controllers]
 
+    # NTS: the routing table is rebuilt and then swapped in as a whole so that a concurrent lookup sees either
+    #      the old or the new table, never a partially updated one
+    @controllers.setter
+    def controllers(self, controllers):
+        routes = _routing_table(controllers, self._broadcast, self._timeout)
+
+        self._controllers = controllers
+        self._routes = routes
+
     @property
     def listen_addr(self):
         return self._listen_addr
@@ -134,38 +260,415 @@ class uhppoted:
     def cache_expiry(self, expiry: {}) -> None:
         self._cache_expiry |= expiry
 
+    @property
+    def cache_adaptive(self) -> bool:
+        return self._cache_adaptive
+
+    @cache_adaptive.setter
+    def cache_adaptive(self, enabled: bool) -> None:
+        self._cache_adaptive = enabled
+        if not enabled:
+            self._ttl.clear()
+
+    @property
+    def cache_adaptive_bounds(self) -> tuple:
+        return self._ttl.bounds
+
+    @cache_adaptive_bounds.setter
+    def cache_adaptive_bounds(self, bounds: tuple) -> None:
+        self._ttl.bounds = bounds
+
+    @property
+    def cache_adaptive_factors(self) -> dict:
+        return self._ttl.histogram()
+
+    @property
+    def queue_workers(self) -> int:
+        return self._queue_workers
+
+    @queue_workers.setter
+    def queue_workers(self, workers: int) -> None:
+        self._queue_workers = max(1, int(workers))
+
+    @property
+    def queue_max_workers(self) -> int:
+        return self._queue_max_workers
+
+    @queue_max_workers.setter
+    def queue_max_workers(self, workers: int) -> None:
+        self._queue_max_workers = max(1, int(workers))
+        self._concurrency = Semaphore(self._queue_max_workers)
+
+    @property
+    def pacing_enabled(self) -> bool:
+        return self._pacer.enabled
+
+    @pacing_enabled.setter
+    def pacing_enabled(self, enabled: bool) -> None:
+        self._pacer.enabled = enabled
+
+    @property
+    def pacing_controller(self) -> tuple:
+        return self._pacer.controller
+
+    @pacing_controller.setter
+    def pacing_controller(self, bucket: tuple) -> None:
+        self._pacer.controller = bucket
+
+    @property
+    def pacing_network(self) -> tuple:
+        return self._pacer.network
+
+    @pacing_network.setter
+    def pacing_network(self, bucket: tuple) -> None:
+        self._pacer.network = bucket
+
+    @property
+    def adaptive_timeout(self) -> bool:
+        return self._rtt.enabled
+
+    @adaptive_timeout.setter
+    def adaptive_timeout(self, enabled: bool) -> None:
+        self._rtt.enabled = enabled
+
+    @property
+    def adaptive_timeout_bounds(self) -> tuple:
+        return self._rtt.bounds
+
+    @adaptive_timeout_bounds.setter
+    def adaptive_timeout_bounds(self, bounds: tuple) -> None:
+        self._rtt.bounds = bounds
+
+    @property
+    def rtt(self) -> dict:
+        return self._rtt.snapshot()
+
+    @property
+    def breaker_enabled(self) -> bool:
+        return self._breaker.enabled
+
+    @breaker_enabled.setter
+    def breaker_enabled(self, enabled: bool) -> None:
+        self._breaker.enabled = enabled
+
+    @property
+    def breaker_threshold(self) -> int:
+        return self._breaker.threshold
+
+    @breaker_threshold.setter
+    def breaker_threshold(self, threshold: int) -> None:
+        self._breaker.threshold = threshold
+
+    @property
+    def breaker_probe_intervals(self) -> tuple:
+        return self._breaker.intervals
+
+    @breaker_probe_intervals.setter
+    def breaker_probe_intervals(self, intervals: tuple) -> None:
+        self._breaker.intervals = intervals
+
+    @property
+    def breakers(self) -> dict:
+        return self._breaker.snapshot()
+
+    # NTS: a controller is unavailable while the circuit breaker for the controller is open (or half-open) i.e.
+    #      any cached information returned by the driver for the controller is likely to be out of date
+    def available(self, controller) -> bool:
+        return self._breaker.state(controller) == CLOSED
+
+    @property
+    def card_window(self) -> int:
+        return self._card_window
+
+    @card_window.setter
+    def card_window(self, window: int) -> None:
+        self._card_window = max(1, int(window))
+
+    @property
+    def event_window(self) -> int:
+        return self._event_window
+
+    @event_window.setter
+    def event_window(self, window: int) -> None:
+        self._event_window = max(1, int(window))
+
+    @property
+    def card_mirror(self) -> bool:
+        return self._mirror_enabled
+
+    @card_mirror.setter
+    def card_mirror(self, enabled: bool) -> None:
+        self._mirror_enabled = enabled
+        if not enabled:
+            self._mirror.clear()
+
+    @property
+    def card_mirror_interval(self) -> int:
+        return self._mirror_interval
+
+    @card_mirror_interval.setter
+    def card_mirror_interval(self, interval: int) -> None:
+        self._mirror_interval = max(1, int(interval))
+
+    @property
+    def card_mirror_samples(self) -> int:
+        return self._mirror_samples
+
+    @card_mirror_samples.setter
+    def card_mirror_samples(self, samples: int) -> None:
+        self._mirror_samples = max(0, int(samples))
+
+    @property
+    def card_mirror_status(self) -> dict:
+        return self._mirror.status()
+
+    @property
+    def pending(self) -> list:
+        return sorted(self._pending.values(), key=lambda r: (r.priority, r.enqueued))
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def cache_budget(self) -> dict:
+        return self._cache.budget
+
+    @cache_budget.setter
+    def cache_budget(self, budget: {}) -> None:
+        self._cache.budget = budget
+
+    @property
+    def metrics(self) -> dict:
+        return self._metrics.snapshot(self._cache.stats, self.queue_depth)
+
     @staticmethod
-    def get_all_controllers(bind, broadcast, listen, debug):
-        return uhppote.Uhppote(bind, broadcast, listen, debug).get_all_controllers()
+    def get_all_controllers(bind, broadcast, timeout=2.5):
+        return discover(bind, broadcast, timeout)
 
     def start(self, hass):
-        self._thread = hass.loop.create_task(self._worker())
-        self._thread = hass.loop.create_task(self._tick())
+        self._spawn(hass.loop.create_task(self._tick()))
+
+        if self._mirror_enabled:
+            self._spawn(hass.loop.create_task(self._check_mirror()))
 
     def stop(self, hass):
-        if self._thread:
-            self._thread.cancel()
+        for task in list(self._tasks):
+            task.cancel()
+
+        for task in list(self._inflight.values()):
+            task.cancel()
+
+        self._inflight.clear()
+
+        self._lanes.clear()
+        self._pending.clear()
+        self._sweeps.clear()
+        self._mirror.clear()
+        self._cache.clear()
+        self._ttl.clear()
+        self._metrics.clear()
+        self._rtt.clear()
+        self._breaker.clear()
+        self._pacer.clear()
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        entries = []
+
+        for (key, response, category, remaining) in self._cache.items():
+            if category in _SNAPSHOT:
+                try:
+                    entries.append({
+                        'key': key,
+                        'category': category,
+                        'expires': None if remaining is None else now + remaining,
+                        'response': encode(response),
+                    })
+                except Exception as exc:
+                    _LOGGER.debug(f'cache snapshot: skipping {key} ({exc})')
+
+        return {
+            'saved': now,
+            'entries': entries,
+        }
+
+    # NTS: restored entries that have expired in the meantime are restored as 'stale' with a full lifetime, i.e.
+    #      they're served as is until they're replaced by the background refresh (stale-while-revalidate)
+    def restore(self, data) -> int:
+        now = time.time()
+        restored = 0
+
+        for v in (data or {}).get('entries', []):
+            key = v.get('key')
+            category = v.get('category')
+            expires = v.get('expires')
+
+            if category in _SNAPSHOT and key not in self._cache:
+                try:
+                    response = decode(v.get('response'), _TYPES)
+                except Exception as exc:
+                    _LOGGER.debug(f'cache snapshot: skipping {key} ({exc})')
+                    continue
+
+                if expires is not None and expires <= now:
+                    self._cache.put(key, response, self._lifetime(category), category, stale=True)
+                else:
+                    self._cache.put(key, response, None if expires is None else expires - now, category)
+
+                restored += 1
+
+        self._infof(f'restored {restored} cached entries')
 
-    async def _worker(self):
+        return restored
+
+    def _spawn(self, task):
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # NTS: background tasks are queued on a per-controller 'lane' so that an unreachable controller only delays
+    #      its own refreshes. Each lane has its own workers (queue.workers) and the total number of tasks in progress
+    #      across all the lanes is limited by queue.max_workers.
+    #
+    #      A refresh for a key that is already pending is merged into the pending request rather than queued again,
+    #      so the queue depth is bounded by the number of distinct keys.
+    #
+    #      Refreshes for adaptive cache entries are skipped while the entry has more than the configured expiry
+    #      time left i.e. until a stable value has been cached for (factor - 1) x cache.expiry.
+    def _enqueue(self, controller, key, expiry, f, message, callback=None):
+        if self._settled(key, expiry):
+            return
+
+        if request := self._pending.get(key):
+            request.merge(callback)
+            self._metrics.enqueued(controller, len(self._pending), merged=True)
+            return
+
+        priority = _PRIORITY.get(expiry, len(_PRIORITY))
+        request = Request(key, expiry, priority, time.monotonic(), message, f, [])
+        request.merge(callback)
+
+        if (lane := self._lanes.get(controller)) is None:
+            lane = self._lanes.setdefault(controller, PriorityQueue())
+            loop = asyncio.get_running_loop()
+            for _ in range(self._queue_workers):
+                self._spawn(loop.create_task(self._worker(controller, lane)))
+
+            self._metrics.lane(controller, self._queue_workers)
+
+        self._pending[key] = request
+        self._metrics.enqueued(controller, len(self._pending))
+        lane.put_nowait((request.priority, next(self._sequence), request))
+
+    async def _worker(self, controller, lane):
         while True:
-            task = await self.queue.get()
+            (_, _, request) = await lane.get()
             try:
-                await task()
+                if self._pending.get(request.key) is request:
+                    del self._pending[request.key]
+
+                async with self._concurrency:
+                    start = self._metrics.started(controller)
+                    try:
+                        await self.ye_async_taskke(request)
+                    finally:
+                        self._metrics.finished(controller, start)
             except Exception as exc:
                 self._warnf(f"{exc}")
             finally:
-                self.queue.task_done()
+                lane.task_done()
 
     async def _tick(self):
         while True:
             await asyncio.sleep(60)
-            self.queue.put_nowait(self._flush)
+            try:
+                await self._flush()
+            except Exception as exc:
+                self._warnf(f"{exc}")
+
+    # NTS: periodically verifies the card table mirror for each controller against the controller card count and
+    #      a random sample of cards, and re-sweeps the controller if either has drifted
+    async def _check_mirror(self):
+        while True:
+            await asyncio.sleep(self._mirror_interval)
+            for controller in self._mirror.controllers:
+                try:
+                    if not await self._verify_mirror(controller):
+                        self._resweep(controller)
+                except Exception as exc:
+                    self._warnf(f"{'verify-mirror':<16} {controller} ({exc})")
+
+    async def _verify_mirror(self, controller):
+        (c, timeout) = self._lookup(controller)
+
+        response = await self._call(controller, self._asio.get_cards, c, timeout=timeout)
+        if response is None or response.cards != self._mirror.count(controller):
+            self._infof(f"{'verify-mirror':<16} {controller} card count changed")
+            return False
+
+        for record in self._mirror.sample(controller, self._mirror_samples):
+            response = await self._call(controller, self._asio.get_card, c, record.card_number, timeout=timeout)
+            if response is None or not mirror.same(response, record):
+                self._infof(f"{'verify-mirror':<16} {controller} card {record.card_number} changed")
+                return False
+
+        return True
+
+    def _resweep(self, controller):
+        if controller not in self._sweeps:
+            task = asyncio.get_running_loop().create_task(self._sweep(controller))
+            task.add_done_callback(lambda t: self._sweeps.pop(controller, None))
+
+            self._sweeps[controller] = task
+            self._spawn(task)
+
+    # NTS: builds a new copy of the controller card table (get-cards + get-card-by-index) and only replaces the
+    #      mirror if the sweep completed. Deleted (and empty) card records are skipped and not counted. Card writes
+    #      made during the sweep are replayed by the mirror after the swept table replaces it.
+    async def _sweep(self, controller):
+        (c, timeout) = self._lookup(controller)
+        start = time.monotonic()
+        cards = {}
+
+        self._mirror.begin(controller)
+
+        try:
+            response = await self._call(controller, self._asio.get_cards, c, timeout=timeout)
+            N = response.cards
+            index = 1
+            errors = 0
+
+            while len(cards) < N and index <= const.DEFAULT_MAX_CARD_INDEX:
+                try:
+                    response = await self._call(controller, self._asio.get_card_by_index, c, index, timeout=timeout)
+                    if response is not None and response.card_number not in (0, 0xffffffff):
+                        r = response
+                        cards[r.card_number] = GetCardResponse(controller, r.card_number, r.start_date, r.end_date,
+                                                               r.door_1, r.door_2, r.door_3, r.door_4, r.pin)
+                    index += 1
+                except Exception:
+                    errors += 1
+                    if errors >= const.DEFAULT_MAX_CARD_ERRORS:
+                        raise
+
+            self._mirror.replace(controller, cards)
+            self._infof(f"{'sweep-cards':<16} {controller} {len(cards)} cards ({time.monotonic() - start:.1f}s)")
+
+        except Exception as exc:
+            self._warnf(f"{'sweep-cards':<16} {controller} ({exc})")
+
+        finally:
+            self._mirror.abort(controller)
+
+    async def ye_async_taskke(self, request):
+        key = request.key
+        message = request.message
 
-    async def ye_async_taskke(self, g, key, expiry, message, callback=None):
         try:
-            if response := await g():
-                self._put(response, key, expiry)
-                if callback:
+            if response := await self._singleflight(key, request.f):
+                self._observe(key, request.expiry, response)
+                self._put(response, key, request.expiry)
+                for callback in request.callbacks:
                     if asyncio.iscoroutinefunction(callback):
                         await callback(response)
                     else:
@@ -179,59 +682,134 @@ class uhppoted:
                 self._warnf(f'{message} ({exc})')
                 self._warnings.add(key)
 
+        except CircuitOpen:
+            pass
+
         except Exception as exc:
             self._warnf(f'{message} ({exc})')
 
+    # NTS: coalesces concurrent requests for the same key into a single request i.e. callers that arrive while
+    #      a request is in flight await the pending response rather than sending a duplicate request. The request
+    #      is shielded so that cancelling one caller doesn't cancel the request for everybody else.
+    async def _singleflight(self, key, f):
+        if task := self._inflight.get(key):
+            return await asyncio.shield(task)
+
+        def done(t):
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+
+            if not t.cancelled():
+                t.exception()  # NTS: marks the exception as retrieved if all the callers have been cancelled
+
+        task = asyncio.ensure_future(f())
+        task.add_done_callback(done)
+        self._inflight[key] = task
+
+        return await asyncio.shield(task)
+
+    # NTS: all requests to the controllers go through here so that the request count, timeouts and latency are
+    #      recorded per controller and operation, so that requests are paced (per controller and per network) and
+    #      so that the request timeout can be derived from the measured round trip time to the controller.
+    #
+    #      Requests to a controller fail immediately with CircuitOpen while the controller circuit breaker is open.
+    #      A timeout is only counted as a circuit breaker failure if the request timeout was not shortened by the
+    #      adaptive timeout, so that a single slow reply from a controller with a low RTT doesn't open the circuit
+    #      (the adaptive timeout backs off on each timeout, so an unreachable controller is still detected).
+    async def _call(self, controller, f, *args, **kwargs):
+        op = getattr(f, '__name__', 'unknown').replace('_', '-')
+        shortened = False
+
+        if not self._breaker.allow(controller):
+            raise CircuitOpen(controller)
+
+        await self._pacer.acquire(controller)
+
+        if 'timeout' in kwargs:
+            timeout = self._rtt.timeout(controller, kwargs['timeout'])
+            shortened = timeout < kwargs['timeout']
+            kwargs['timeout'] = timeout
+
+        start = time.monotonic()
+
+        try:
+            response = await self._metrics.call(controller, op, lambda: f(*args, **kwargs))
+            self._rtt.sample(controller, time.monotonic() - start)
+            if self._breaker.succeeded(controller):
+                self._infof(f"{'circuit-closed':<16} {controller}")
+
+            return response
+        except OSError as exc:  # NTS: includes TimeoutError
+            if isinstance(exc, TimeoutError):
+                self._rtt.expired(controller)
+                if shortened:
+                    raise
+
+            if interval := self._breaker.failed(controller):
+                self._warnf(f"{'circuit-open':<16} {controller} unreachable (retry in {interval}s)")
+            raise
+
     async def _flush(self):
-        now = datetime.now()
-        expired = [key for key, record in _CACHE.items() if record.expires is not None and record.expires < now]
+        cached = len(self._cache)
+        expired = self._cache.evict()
 
-        if len(expired) > 0:
-            self._infof(f'flushing cache - cached:{len(_CACHE)} expired:{len(expired)}')
-            for key in expired:
-                del _CACHE[key]
+        if expired > 0:
+            self._infof(f'flushing cache - cached:{cached} expired:{expired}')
 
     def _put(self, response, key, expiry):
-        lifetime = self.cache_expiry.get(expiry, _DEFAULT_CACHE_EXPIRY.get(expiry, 60))
-        now = datetime.now()
-        expires = now + timedelta(seconds=lifetime) if lifetime else None
+        lifetime = self._lifetime(expiry)
 
-        _CACHE[key] = CacheEntry(response, expires)
+        if self._cache_adaptive and expiry in _ADAPTIVE:
+            lifetime = self._ttl.lifetime(key, lifetime)
 
-    def _get(self, key):
-        if record := _CACHE.get(key, None):
-            if record.expires is None:
-                return record.response
+        self._cache.put(key, response, lifetime, expiry)
 
-            if datetime.now() < record.expires:
-                return record.response
-
-        return None
+    def _get(self, key, expiry):
+        return self._cache.get(key, expiry)
 
     def _delete(self, key):
-        _CACHE.pop(key, None)
+        self._cache.delete(key)
+        self._ttl.forget(key)
+
+    def _lifetime(self, expiry):
+        return self.cache_expiry.get(expiry, _DEFAULT_CACHE_EXPIRY.get(expiry, 60))
+
+    def _observe(self, key, expiry, response):
+        if self._cache_adaptive and expiry in _ADAPTIVE:
+            if (previous := self._cache.peek(key)) is not None:
+                self._ttl.observe(key, response != previous)
+
+    def _settled(self, key, expiry):
+        if self._cache_adaptive and expiry in _ADAPTIVE and self._ttl.factor(key) > 1.0:
+            remaining = self._cache.remaining(key)
+            lifetime = self._lifetime(expiry)
+
+            return remaining is not None and lifetime is not None and remaining > lifetime
+
+        return False
 
     async def get_controller(self, controller, callback=None):
         key = f'controller.{controller}.controller'
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_controller(c, timeout=timeout)
+            return await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_controller, c, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_CONTROLLER)
         if record is None and callback is None:
-            response = await self._asio.get_controller(c, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_controller, c, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_CONTROLLER)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_controller(c, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_CONTROLLER,
-                f"{'get-controller':<16} {controller}",
-                callback)) # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_CONTROLLER,
+                      lambda: self._call(controller, self._asio.get_controller, c, timeout=timeout),
+                      f"{'get-controller':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
@@ -240,29 +818,30 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_listener(c, timeout=timeout)
+            return await self._singleflight(key,
+                                            lambda: self._call(controller, self._asio.get_listener, c, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_LISTENER)
         if record is None and callback is None:
-            response = await self._asio.get_listener(c, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_listener, c, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_LISTENER)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_listener(c, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_LISTENER,
-                f"{'get_listener':<16} {controller}",
-                callback)) # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_LISTENER,
+                      lambda: self._call(controller, self._asio.get_listener, c, timeout=timeout),
+                      f"{'get_listener':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
     async def set_listener(self, controller, address, port):
         key = f'controller.{controller}.listener'
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.set_listener(c, address, port, interval=0, timeout=timeout)
+        response = await self._call(controller, self._asio.set_listener, c, address, port, interval=0, timeout=timeout)
 
         if self.cache_enabled:
             if response is None or not response.ok:
@@ -277,29 +856,30 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_time(c, timeout=timeout)
+            return await self._singleflight(key,
+                                            lambda: self._call(controller, self._asio.get_time, c, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_DATETIME)
         if record is None and callback is None:
-            response = await self._asio.get_time(c, timeout=timeout)
+            response = await self._singleflight(key,
+                                                lambda: self._call(controller, self._asio.get_time, c, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_DATETIME)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_time(c, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_DATETIME,
-                f"{'get-time':<16} {controller}",
-                callback))  # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_DATETIME,
+                      lambda: self._call(controller, self._asio.get_time, c, timeout=timeout),
+                      f"{'get-time':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
     async def set_time(self, controller, time):
         key = f'controller.{controller}.datetime'
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.set_time(controller, time, timeout=timeout)
+        response = await self._call(controller, self._asio.set_time, controller, time, timeout=timeout)
 
         if self.cache_enabled:
             if response is None:
@@ -314,29 +894,30 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_door_control(c, door, timeout=timeout)
+            return await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_door_control, c, door, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_DOOR)
         if record is None and callback is None:
-            response = await self._asio.get_door_control(c, door, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_door_control, c, door, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_DOOR)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_door_control(c, door, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_DOOR,
-                f"{'get_door':<16} {controller} {door}",
-                callback))  # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_DOOR,
+                      lambda: self._call(controller, self._asio.get_door_control, c, door, timeout=timeout),
+                      f"{'get_door':<16} {controller} {door}",
+                      callback)  # yapf: disable
 
         return record
 
     async def set_door(self, controller, door, mode, delay):
         key = f'controller.{controller}.door.{door}'
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.set_door_control(c, door, mode, delay, timeout=timeout)
+        response = await self._call(controller, self._asio.set_door_control, c, door, mode, delay, timeout=timeout)
 
         if self.cache_enabled:
             if response is None:
@@ -349,7 +930,7 @@ class uhppoted:
 
     async def open_door(self, controller, door):
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.open_door(c, door, timeout=timeout)
+        response = await self._call(controller, self._asio.open_door, c, door, timeout=timeout)
 
         return response
 
@@ -358,86 +939,196 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_status(c, timeout=timeout)
+            return await self._singleflight(key,
+                                            lambda: self._call(controller, self._asio.get_status, c, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_STATUS)
         if record is None and callback is None:
-            response = await self._asio.get_status(c, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_status, c, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_STATUS)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_status(c, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_STATUS,
-                f"{'get_status':<16} {controller}",
-                callback))  # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_STATUS,
+                      lambda: self._call(controller, self._asio.get_status, c, timeout=timeout),
+                      f"{'get_status':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
+    # NTS: True if get_status(controller, callback) would return a cached status record rather than None
+    def status_cached(self, controller) -> bool:
+        key = f'controller.{controller}.status'
+
+        if self.cache_enabled and key in self._cache:
+            remaining = self._cache.remaining(key)
+            return remaining is None or remaining > 0
+
+        return False
+
     async def get_cards(self, controller):
+        key = f'controller.{controller}.cards'
         (c, timeout) = self._lookup(controller)
 
-        return await self._asio.get_cards(c, timeout=timeout)
+        return await self._singleflight(key, lambda: self._call(controller, self._asio.get_cards, c, timeout=timeout))
 
     async def get_card(self, controller, card, callback=None):
         key = f'controller.{controller}.card.{card}'
         (c, timeout) = self._lookup(controller)
 
         if self.cache_enabled and callback is not None:
-            self.queue.put_nowait(lambda: self.ye_async_taskke(
-                lambda: self._asio.get_card(c, card, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_CARD,
-                f"{'get_card':<16} {controller} {card}",
-                callback))  # yapf: disable
-
-            if record := self._get(key):
+            self._enqueue(controller,
+                          key,
+                          CONF_CACHE_EXPIRY_CARD,
+                          lambda: self._call(controller, self._asio.get_card, c, card, timeout=timeout),
+                          f"{'get_card':<16} {controller} {card}",
+                          callback)  # yapf: disable
+
+            if record := self._get(key, CONF_CACHE_EXPIRY_CARD):
                 return record
 
-        return await self._asio.get_card(c, card, timeout=timeout)
+        return await self._singleflight(key,
+                                        lambda: self._call(controller, self._asio.get_card, c, card, timeout=timeout))
+
+    # NTS: fetches the cards with at most card_window requests in flight and yields the (card, response, ok) results
+    #      as they complete, i.e. not necessarily in order. Cached cards that don't need to be refreshed (adaptive
+    #      expiry) are yielded from the cache. The response for a failed request is the cached card (if any) and
+    #      'ok' is False, i.e. the card was not refreshed.
+    #
+    #      If the card table mirror for the controller is ready, cards that were swept, written or refreshed within
+    #      the last max_age seconds are read from the mirror instead (a card that is not in the mirror is returned
+    #      as 'not found'). Older cards are fetched from the controller and refreshed in the mirror, so max_age bounds
+    #      the age of a card reported as refreshed. If the mirror is not ready a sweep is started in the background.
+    async def get_cards_bulk(self, controller, cards, max_age=None):
+        (c, timeout) = self._lookup(controller)
+        window = set()
+        failed = 0
+        mirrored = False
+
+        if self._mirror_enabled:
+            if mirrored := self._mirror.ready(controller):
+                stale = []
+                for card in cards:
+                    if max_age is not None and self._mirror.age(controller, card) <= max_age:
+                        if (record := self._mirror.get(controller, card)) is not None:
+                            yield (card, record, True)
+                        else:
+                            yield (card, GetCardResponse(controller, 0, None, None, 0, 0, 0, 0, 0), True)
+                    else:
+                        stale.append(card)
+
+                cards = stale
+            else:
+                self._resweep(controller)
+
+        async def get_card(card):
+            key = f'controller.{controller}.card.{card}'
+            try:
+                response = await self._singleflight(
+                    key, lambda: self._call(controller, self._asio.get_card, c, card, timeout=timeout))
+
+                if self.cache_enabled and response is not None:
+                    self._observe(key, CONF_CACHE_EXPIRY_CARD, response)
+                    self._put(response, key, CONF_CACHE_EXPIRY_CARD)
+
+                if mirrored:
+                    self._mirror.refreshed(controller, card, response)
+
+                return (card, response, None)
+
+            except Exception as exc:
+                record = self._get(key, CONF_CACHE_EXPIRY_CARD) if self.cache_enabled else None
+                if record is None and mirrored:
+                    record = self._mirror.get(controller, card)
+
+                return (card, record, exc)
+
+        def completed(tasks):
+            nonlocal failed
+            for (card, response, err) in (t.result() for t in tasks):
+                if err is not None:
+                    _LOGGER.debug(f"{'get_card':<16} {controller} {card} ({err})")
+                    failed += 1
+
+                yield (card, response, err is None)
+
+        try:
+            for card in cards:
+                key = f'controller.{controller}.card.{card}'
+                if self.cache_enabled and self._settled(key, CONF_CACHE_EXPIRY_CARD):
+                    if (record := self._get(key, CONF_CACHE_EXPIRY_CARD)) is not None:
+                        yield (card, record, True)
+                        continue
+
+                if len(window) >= self._card_window:
+                    (done, window) = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+                    for v in completed(done):
+                        yield v
+
+                window.add(asyncio.ensure_future(get_card(card)))
+
+            while window:
+                (done, window) = await asyncio.wait(window, return_when=asyncio.FIRST_COMPLETED)
+                for v in completed(done):
+                    yield v
+
+        finally:
+            for task in window:
+                task.cancel()
+
+            if failed > 0:
+                self._warnf(f"{'get_cards_bulk':<16} {controller} {failed} of {len(cards)} requests failed")
 
     async def get_card_by_index(self, controller, index):
+        key = f'controller.{controller}.index.{index}'
         (c, timeout) = self._lookup(controller)
 
-        return await self._asio.get_card_by_index(c, index, timeout=timeout)
+        return await self._singleflight(
+            key, lambda: self._call(controller, self._asio.get_card_by_index, c, index, timeout=timeout))
 
     async def put_card(self, controller, card, start_date, end_date, door1, door2, door3, door4, PIN):
         key = f'controller.{controller}.card.{card}'
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.put_card(c,
-                                             card,
-                                             start_date,
-                                             end_date,
-                                             door1,
-                                             door2,
-                                             door3,
-                                             door4,
-                                             PIN,
-                                             timeout=timeout)
-
-        if self.cache_enabled and response is not None and response.stored:
+        response = await self._call(controller,
+                                    self._asio.put_card,
+                                    c,
+                                    card,
+                                    start_date,
+                                    end_date,
+                                    door1,
+                                    door2,
+                                    door3,
+                                    door4,
+                                    PIN,
+                                    timeout=timeout)
+
+        if response is not None and response.stored:
             record = GetCardResponse(response.controller, card, start_date, end_date, door1, door2, door3, door4, PIN)
 
-            self._put(record, key, CONF_CACHE_EXPIRY_CARD)
+            self._mirror.put(controller, record)
+            if self.cache_enabled:
+                self._put(record, key, CONF_CACHE_EXPIRY_CARD)
 
         return response
 
     async def delete_card(self, controller, card):
         key = f'controller.{controller}.card.{card}'
         (c, timeout) = self._lookup(controller)
-        response = await self.asio.delete_card(c, card, timeout=timeout)
+        response = await self._call(controller, self._asio.delete_card, c, card, timeout=timeout)
 
-        if self.cache_enabled and response is not None and response.deleted:
-            self._delete(key)
+        if response is not None and response.deleted:
+            self._mirror.delete(controller, card)
+            if self.cache_enabled:
+                self._delete(key)
 
         return response
 
     async def record_special_events(self, controller, enable):
         (c, timeout) = self._lookup(controller)
-        return await self._asio.record_special_events(c, enable, timeout=timeout)
+        return await self._call(controller, self._asio.record_special_events, c, enable, timeout=timeout)
 
     # NTS: events are never deleted
     async def get_event(self, controller, index, callback=None):
@@ -445,34 +1136,81 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_event(c, index, timeout=timeout)
+            return await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_event, c, index, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_EVENT)
         if record is None and callback is None:
-            response = await self._asio.get_event(c, index, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_event, c, index, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_EVENT)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_event(c, index, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_EVENT,
-                f"{'get_event':<16} {controller}",
-                callback)) # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_EVENT,
+                      lambda: self._call(controller, self._asio.get_event, c, index, timeout=timeout),
+                      f"{'get_event':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
+    # NTS: fetches the events [first,last] with at most event_window requests in flight and yields the responses
+    #      in index order, in batches of up to 'batch' events. Stops at the first event that could not be retrieved
+    #      so that the caller can resume from the last event received.
+    async def get_events(self, controller, first, last, batch=32):
+        (c, timeout) = self._lookup(controller)
+        window = []
+        events = []
+
+        async def get_event(index):
+            key = f'controller.{controller}.event.{index}'
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_event, c, index, timeout=timeout))
+
+            if self.cache_enabled and response is not None:
+                self._put(response, key, CONF_CACHE_EXPIRY_EVENT)
+
+            return response
+
+        try:
+            index = first
+            while index <= last or window:
+                while index <= last and len(window) < self._event_window:
+                    window.append(asyncio.ensure_future(get_event(index)))
+                    index += 1
+
+                try:
+                    response = await window.pop(0)
+                except Exception as exc:
+                    self._warnf(f"{'get_events':<16} {controller} ({exc})")
+                    break
+
+                if response is None:
+                    break
+
+                events.append(response)
+                if len(events) >= batch:
+                    yield events
+                    events = []
+
+            if events:
+                yield events
+
+        finally:
+            for task in window:
+                task.cancel()
+
     async def get_interlock(self, controller, callback=None):
         key = f'controller.{controller}.interlock'
 
-        return self._get(key)
+        return self._get(key, CONF_CACHE_EXPIRY_INTERLOCK)
 
     async def set_interlock(self, controller, interlock):
         key = f'controller.{controller}.interlock'
         (c, timeout) = self._lookup(controller)
-        response = await self._asio.set_interlock(c, interlock, timeout=timeout)
+        response = await self._call(controller, self._asio.set_interlock, c, interlock, timeout=timeout)
 
         if self.cache_enabled:
             if response is None or not response.ok:
@@ -487,22 +1225,23 @@ class uhppoted:
         (c, timeout) = self._lookup(controller)
 
         if not self.cache_enabled:
-            return await self._asio.get_antipassback(c, timeout=timeout)
+            return await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_antipassback, c, timeout=timeout))
 
-        record = self._get(key)
+        record = self._get(key, CONF_CACHE_EXPIRY_ANTIPASSBACK)
         if record is None and callback is None:
-            response = await self._asio.get_antipassback(c, timeout=timeout)
+            response = await self._singleflight(
+                key, lambda: self._call(controller, self._asio.get_antipassback, c, timeout=timeout))
             if response is not None:
                 self._put(response, key, CONF_CACHE_EXPIRY_ANTIPASSBACK)
             return response
 
-        self.queue.put_nowait(
-            lambda: self.ye_async_taskke(
-                lambda: self._asio.get_antipassback(c, timeout=timeout),
-                key,
-                CONF_CACHE_EXPIRY_ANTIPASSBACK,
-                f"{'get_antipassback':<16} {controller}",
-                callback)) # yapf: disable
+        self._enqueue(controller,
+                      key,
+                      CONF_CACHE_EXPIRY_ANTIPASSBACK,
+                      lambda: self._call(controller, self._asio.get_antipassback, c, timeout=timeout),
+                      f"{'get_antipassback':<16} {controller}",
+                      callback)  # yapf: disable
 
         return record
 
@@ -510,7 +1249,7 @@ class uhppoted:
         key = f'controller.{controller}.antipassback'
         (c, timeout) = self._lookup(controller)
 
-        response = await self._asio.set_antipassback(c, antipassback, timeout=timeout)
+        response = await self._call(controller, self._asio.set_antipassback, c, antipassback, timeout=timeout)
 
         if self.cache_enabled:
             if response is None or not response.ok:
@@ -524,19 +1263,8 @@ class uhppoted:
         await self._asio.listen(on_event, on_error=None, close=stop)
 
     def _lookup(self, controller):
-        for v in self._controllers:
-            if controller == v['controller']:
-                addr = v.get('address', None)
-                port = v.get('port', 60000)
-                timeout = v.get('timeout', self._timeout)
-                protocol = v.get('protocol', 'udp')
-
-                if addr is None:
-                    return ((controller, None, 'udp'), timeout)
-                elif f'{addr}:{port}' == self._broadcast:
-                    return ((controller, None, 'udp'), timeout)
-                else:
-                    return ((controller, f'{addr}:{port}', protocol), timeout)
+        if route := self._routes.get(controller):
+            return route
 
         return ((controller, None, 'udp'), self._timeout)
 
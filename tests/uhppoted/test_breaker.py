@@ -0,0 +1,98 @@
+'''
+UHPPOTED circuit breaker unit tests.
+
+Tests the per-controller circuit breaker state transitions.
+'''
+
+import unittest
+
+from custom_components.uhppoted.driver.breaker import Breaker
+from custom_components.uhppoted.driver.breaker import CLOSED
+from custom_components.uhppoted.driver.breaker import OPEN
+from custom_components.uhppoted.driver.breaker import HALF_OPEN
+
+CONTROLLER = 405419896
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBreaker(unittest.TestCase):
+
+    def test_open(self):
+        '''
+        Tests that the circuit is opened after 'threshold' consecutive failures and then rejects requests.
+        '''
+        breaker = Breaker(3, 10, 300, Clock())
+
+        breaker.failed(CONTROLLER)
+        breaker.failed(CONTROLLER)
+        self.assertEqual(breaker.state(CONTROLLER), CLOSED)
+        self.assertTrue(breaker.allow(CONTROLLER))
+
+        self.assertEqual(breaker.failed(CONTROLLER), 10)
+        self.assertEqual(breaker.state(CONTROLLER), OPEN)
+        self.assertFalse(breaker.allow(CONTROLLER))
+
+    def test_success_resets_failures(self):
+        '''
+        Tests that a successful request resets the consecutive failure count.
+        '''
+        breaker = Breaker(3, 10, 300, Clock())
+
+        breaker.failed(CONTROLLER)
+        breaker.failed(CONTROLLER)
+        breaker.succeeded(CONTROLLER)
+        breaker.failed(CONTROLLER)
+
+        self.assertEqual(breaker.state(CONTROLLER), CLOSED)
+
+    def test_probe(self):
+        '''
+        Tests that a single probe is let through after the probe interval and that a failed probe doubles the
+        interval up to the max. probe interval.
+        '''
+        clock = Clock()
+        breaker = Breaker(1, 10, 30, clock)
+
+        breaker.failed(CONTROLLER)
+
+        clock.now = 10.0
+        self.assertTrue(breaker.allow(CONTROLLER))
+        self.assertEqual(breaker.state(CONTROLLER), HALF_OPEN)
+        self.assertFalse(breaker.allow(CONTROLLER))
+
+        self.assertEqual(breaker.failed(CONTROLLER), 20)
+        clock.now = 29.0
+        self.assertFalse(breaker.allow(CONTROLLER))
+        clock.now = 30.0
+        self.assertTrue(breaker.allow(CONTROLLER))
+
+        self.assertEqual(breaker.failed(CONTROLLER), 30)
+        clock.now = 60.0
+        self.assertTrue(breaker.allow(CONTROLLER))
+
+        self.assertTrue(breaker.succeeded(CONTROLLER))
+        self.assertEqual(breaker.state(CONTROLLER), CLOSED)
+        self.assertTrue(breaker.allow(CONTROLLER))
+
+    def test_disabled(self):
+        '''
+        Tests that a disabled circuit breaker never rejects requests.
+        '''
+        breaker = Breaker(1, 10, 300, Clock())
+        breaker.enabled = False
+
+        breaker.failed(CONTROLLER)
+
+        self.assertTrue(breaker.allow(CONTROLLER))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+'''
+UHPPOTED driver cache unit tests.
+
+Tests the response cache expiry and eviction.
+'''
+
+import unittest
+
+from custom_components.uhppoted.driver.cache import Cache
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCache(unittest.TestCase):
+
+    def test_get(self):
+        '''
+        Tests that a cached response is returned until it expires.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+
+        cache.put('controller.405419896.status', 'status', 120)
+        self.assertEqual(cache.get('controller.405419896.status'), 'status')
+
+        clock.now += 121
+        self.assertIsNone(cache.get('controller.405419896.status'))
+
+    def test_no_expiry(self):
+        '''
+        Tests that a response cached without a lifetime never expires.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+
+        cache.put('controller.405419896.interlock', 'interlock', None)
+
+        clock.now += 86400
+        self.assertEqual(cache.evict(), 0)
+        self.assertEqual(cache.get('controller.405419896.interlock'), 'interlock')
+
+    def test_evict(self):
+        '''
+        Tests that evict only removes the expired entries.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+
+        cache.put('controller.405419896.status', 'status', 120)
+        cache.put('controller.405419896.door.1', 'door', 600)
+        cache.put('controller.405419896.card.10058400', 'card', 900)
+
+        clock.now += 601
+        self.assertEqual(cache.evict(), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('controller.405419896.card.10058400'), 'card')
+
+    def test_evict_replaced_entry(self):
+        '''
+        Tests that a refreshed entry is not evicted at the expiry time of the entry it replaced.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+
+        cache.put('controller.405419896.status', 'old', 120)
+        clock.now += 60
+        cache.put('controller.405419896.status', 'new', 120)
+
+        clock.now += 61
+        self.assertEqual(cache.evict(), 0)
+        self.assertEqual(cache.get('controller.405419896.status'), 'new')
+
+        clock.now += 60
+        self.assertEqual(cache.evict(), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_compact(self):
+        '''
+        Tests that the expiry index doesn't grow without bound when the same key is refreshed repeatedly.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+
+        for _ in range(1000):
+            cache.put('controller.405419896.card.10058400', 'card', 900)
+            clock.now += 1
+
+        self.assertLessEqual(len(cache._expiry), 2 * len(cache) + 64)
+
+
+class TestCacheBudget(unittest.TestCase):
+
+    def test_entries_budget(self):
+        '''
+        Tests that the least recently used entries are evicted when a category exceeds its entry budget.
+        '''
+        cache = Cache(Clock())
+        cache.budget = {'card': {'entries': 2}}
+
+        cache.put('card.1', 'card 1', 900, 'card')
+        cache.put('card.2', 'card 2', 900, 'card')
+        cache.get('card.1')
+        cache.put('card.3', 'card 3', 900, 'card')
+
+        self.assertEqual(cache.entries('card'), 2)
+        self.assertEqual(cache.get('card.1'), 'card 1')
+        self.assertIsNone(cache.get('card.2'))
+        self.assertEqual(cache.get('card.3'), 'card 3')
+
+    def test_bytes_budget(self):
+        '''
+        Tests that entries are evicted when a category exceeds its byte budget.
+        '''
+        cache = Cache(Clock())
+        cache.put('card.1', 'card 1', 900, 'card')
+
+        size = cache.bytes('card')
+        cache.budget = {'card': {'bytes': 3 * size}}
+
+        for card in range(2, 10):
+            cache.put(f'card.{card}', f'card {card}', 900, 'card')
+
+        self.assertLessEqual(cache.bytes('card'), 3 * size)
+        self.assertEqual(cache.entries('card'), 3)
+        self.assertEqual(cache.get('card.9'), 'card 9')
+
+    def test_budgets_are_per_category(self):
+        '''
+        Tests that exceeding the budget for one category doesn't evict entries in another category.
+        '''
+        cache = Cache(Clock())
+        cache.budget = {'event': {'entries': 1}}
+
+        cache.put('status', 'status', 120, 'status')
+        cache.put('event.1', 'event 1', 1800, 'event')
+        cache.put('event.2', 'event 2', 1800, 'event')
+
+        self.assertEqual(cache.get('status'), 'status')
+        self.assertIsNone(cache.get('event.1'))
+        self.assertEqual(cache.get('event.2'), 'event 2')
+
+    def test_budget_trims_existing_entries(self):
+        '''
+        Tests that reducing a budget trims the existing entries.
+        '''
+        cache = Cache(Clock())
+
+        for card in range(10):
+            cache.put(f'card.{card}', f'card {card}', 900, 'card')
+
+        cache.budget = {'card': {'entries': 4}}
+
+        self.assertEqual(cache.entries('card'), 4)
+        self.assertEqual(len(cache), 4)
+
+    def test_scalar_budget(self):
+        '''
+        Tests that an integer budget is an entry budget and that an invalid budget is ignored.
+        '''
+        cache = Cache(Clock())
+
+        for card in range(10):
+            cache.put(f'card.{card}', f'card {card}', 900, 'card')
+            cache.put(f'event.{card}', f'event {card}', 900, 'event')
+
+        with self.assertLogs('custom_components.uhppoted.driver.cache', 'WARNING'):
+            cache.budget = {'card': 4, 'event': 'lots'}
+
+        self.assertEqual(cache.budget, {'card': (4, None), 'event': (None, None)})
+        self.assertEqual(cache.entries('card'), 4)
+        self.assertEqual(cache.entries('event'), 10)
+
+
+class TestCacheStats(unittest.TestCase):
+
+    def test_stats(self):
+        '''
+        Tests the per-category cache hit, miss, expired and evicted counts.
+        '''
+        clock = Clock()
+        cache = Cache(clock)
+        cache.budget = {'card': {'entries': 1}}
+
+        cache.get('status', 'status')
+        cache.put('status', 'status', 120, 'status')
+        cache.get('status', 'status')
+        clock.now += 121
+        cache.get('status', 'status')
+        cache.evict()
+
+        cache.put('card.1', 'card 1', 900, 'card')
+        cache.put('card.2', 'card 2', 900, 'card')
+
+        self.assertEqual(cache.stats['status'], {'hits': 1, 'misses': 2, 'stale': 0, 'expired': 1, 'evicted': 0})
+        self.assertEqual(cache.stats['card'], {'hits': 0, 'misses': 0, 'stale': 0, 'expired': 0, 'evicted': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
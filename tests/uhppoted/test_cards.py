@@ -0,0 +1,123 @@
+'''
+UHPPOTED cards coordinator unit tests.
+
+Tests the concurrent fan-out of card requests across the controllers.
+'''
+
+import asyncio
+import tempfile
+import unittest
+
+from uhppoted.structs import DeleteCardResponse
+from uhppoted.structs import GetCardResponse
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.uhppoted.const import DOMAIN
+from custom_components.uhppoted.const import CONF_CONTROLLERS
+from custom_components.uhppoted.const import CONF_CONTROLLER_SERIAL_NUMBER
+from custom_components.uhppoted.const import ATTR_AVAILABLE
+from custom_components.uhppoted.coordinators.cards import CardsCoordinator
+from custom_components.uhppoted.coordinators.cards import _FANOUT
+from custom_components.uhppoted.coordinators.db import DB
+
+CONTROLLERS = list(range(405419800, 405419832))
+CARD = 10058400
+
+
+class Driver:
+
+    def __init__(self, offline=()):
+        self.offline = set(offline)
+        self.inflight = 0
+        self.max_inflight = 0
+
+    def available(self, controller):
+        return controller not in self.offline
+
+    async def delete_card(self, controller, card):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.inflight -= 1
+
+        return DeleteCardResponse(controller, True)
+
+    async def get_cards_bulk(self, controller, cards, max_age=None):
+        await asyncio.sleep(0.01)
+
+        if controller in self.offline:
+            raise TimeoutError('timeout')
+
+        for card in cards:
+            yield (card, GetCardResponse(controller, card, None, None, 1, 0, 0, 0, 0), True)
+
+
+class TestFanOut(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.hass.data[DOMAIN] = {}
+
+    async def asyncTearDown(self):
+        self.dir.cleanup()
+
+    def coordinator(self, driver, controllers=CONTROLLERS):
+        options = {
+            CONF_CONTROLLERS: [{
+                CONF_CONTROLLER_SERIAL_NUMBER: v
+            } for v in controllers],
+        }
+
+        coordinator = CardsCoordinator(self.hass, options, None, driver, DB())
+        coordinator._state[CARD] = {ATTR_AVAILABLE: False}
+
+        return coordinator
+
+    async def test_concurrency_limit(self):
+        '''
+        Tests that a card write is sent to all the controllers with at most _FANOUT requests in flight.
+        '''
+        driver = Driver()
+        coordinator = self.coordinator(driver)
+
+        self.assertTrue(await coordinator.delete_card(CARD))
+        self.assertEqual(driver.max_inflight, _FANOUT)
+
+        coordinator.unload()
+
+    async def test_partial_failure(self):
+        '''
+        Tests that a failed controller is logged without failing the update.
+        '''
+        driver = Driver(offline=CONTROLLERS[:1])
+        coordinator = self.coordinator(driver, CONTROLLERS[:2])
+
+        with self.assertLogs('custom_components.uhppoted.coordinators.cards', 'ERROR') as logs:
+            cards = await coordinator._get_cards([CARD])
+
+        self.assertIn(f'{CONTROLLERS[0]}', logs.output[0])
+        self.assertFalse(cards[CARD][ATTR_AVAILABLE])
+
+        coordinator.unload()
+
+    async def test_general_failure(self):
+        '''
+        Tests that the update fails if all the controllers failed.
+        '''
+        driver = Driver(offline=CONTROLLERS[:2])
+        coordinator = self.coordinator(driver, CONTROLLERS[:2])
+
+        with self.assertRaises(UpdateFailed):
+            await coordinator._get_cards([CARD])
+
+        coordinator.unload()
+
+
+if __name__ == '__main__':
+    unittest.main()
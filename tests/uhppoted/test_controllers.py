@@ -0,0 +1,78 @@
+'''
+UHPPOTED controllers coordinator unit tests.
+
+Tests the per-controller state record.
+'''
+
+import datetime
+import unittest
+
+from custom_components.uhppoted.const import ATTR_AVAILABLE
+from custom_components.uhppoted.const import ATTR_CONTROLLER_ADDRESS
+from custom_components.uhppoted.const import ATTR_CONTROLLER_DATETIME
+from custom_components.uhppoted.const import ATTR_CONTROLLER_INTERLOCK
+from custom_components.uhppoted.const import ATTR_CONTROLLER_INTERLOCK_SETTING
+from custom_components.uhppoted.coordinators.controllers import ControllerState
+from custom_components.uhppoted.coordinators.db import Table
+
+
+class TestControllerState(unittest.TestCase):
+
+    def test_set(self):
+        '''
+        Tests that the field setter reports whether the value changed.
+        '''
+        record = ControllerState()
+
+        self.assertTrue(record.set(ATTR_CONTROLLER_INTERLOCK, None))
+        self.assertFalse(record.set(ATTR_CONTROLLER_INTERLOCK, None))
+        self.assertTrue(record.set(ATTR_CONTROLLER_INTERLOCK, 3))
+        self.assertFalse(record.set(ATTR_CONTROLLER_INTERLOCK, 3))
+
+        dt = datetime.datetime(2024, 11, 5, 12, 34, 56)
+        self.assertTrue(record.set(ATTR_CONTROLLER_DATETIME, dt))
+        self.assertFalse(record.set(ATTR_CONTROLLER_DATETIME, datetime.datetime(2024, 11, 5, 12, 34, 56)))
+
+    def test_update(self):
+        '''
+        Tests that update reports a change if any of the values changed.
+        '''
+        record = ControllerState()
+        record.update({ATTR_AVAILABLE: True, ATTR_CONTROLLER_ADDRESS: '192.168.1.100'})
+
+        self.assertFalse(record.update({ATTR_AVAILABLE: True, ATTR_CONTROLLER_ADDRESS: '192.168.1.100'}))
+        self.assertTrue(record.update({ATTR_AVAILABLE: True, ATTR_CONTROLLER_ADDRESS: '192.168.1.101'}))
+
+    def test_mapping(self):
+        '''
+        Tests that the record reads as a mapping of the attributes that have been set.
+        '''
+        record = ControllerState()
+        record.set(ATTR_CONTROLLER_INTERLOCK, 4)
+
+        self.assertEqual(dict(record), {ATTR_AVAILABLE: False, ATTR_CONTROLLER_INTERLOCK: 4})
+        self.assertNotIn(ATTR_CONTROLLER_DATETIME, record)
+        self.assertIsNone(record.get(ATTR_CONTROLLER_INTERLOCK_SETTING))
+
+        with self.assertRaises(AttributeError):
+            record.other = 1
+
+    def test_commit(self):
+        '''
+        Tests that a controller record is committed to a snapshot only if it has changed.
+        '''
+        table = Table()
+        state = {405419896: ControllerState(True)}
+
+        v1 = table.commit(state)
+        v2 = table.commit(state)
+        state[405419896].set(ATTR_CONTROLLER_INTERLOCK, 1)
+        v3 = table.commit(state)
+
+        self.assertIs(v1, v2)
+        self.assertEqual(v3[405419896][ATTR_CONTROLLER_INTERLOCK], 1)
+        self.assertNotIn(ATTR_CONTROLLER_INTERLOCK, v1[405419896])
+
+
+if __name__ == '__main__':
+    unittest.main()
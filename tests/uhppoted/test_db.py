@@ -0,0 +1,128 @@
+'''
+UHPPOTED coordinator state store unit tests.
+
+Tests the versioned copy-on-write coordinator state tables.
+'''
+
+import unittest
+
+from custom_components.uhppoted.coordinators.db import Table
+from custom_components.uhppoted.coordinators.db import DB
+
+
+class TestTable(unittest.TestCase):
+
+    def test_snapshot_isolation(self):
+        '''
+        Tests that a committed snapshot is not affected by subsequent changes to the coordinator state.
+        '''
+        table = Table()
+        state = {1: {'available': True, 'open': False}}
+        snapshot = table.commit(state)
+
+        state[1]['open'] = True
+        state[2] = {'available': False}
+
+        self.assertEqual(dict(snapshot[1]), {'available': True, 'open': False})
+        self.assertNotIn(2, snapshot)
+
+        with self.assertRaises(TypeError):
+            snapshot[1]['open'] = True
+
+    def test_nested_state(self):
+        '''
+        Tests that a committed snapshot does not share nested values with the coordinator state and that a nested
+        change made in place is committed as a new revision.
+        '''
+        table = Table()
+        state = {1: {'permissions': [1, 2], 'controllers': {405419896: {'open': False}}}}
+        v1 = table.commit(state)
+
+        state[1]['permissions'].append(3)
+        state[1]['controllers'][405419896]['open'] = True
+
+        self.assertEqual(v1[1]['permissions'], (1, 2))
+        self.assertEqual(v1[1]['controllers'][405419896]['open'], False)
+
+        with self.assertRaises(TypeError):
+            v1[1]['controllers'][405419896]['open'] = True
+
+        v2 = table.commit(state)
+
+        self.assertNotEqual(v2.revision(1), v1.revision(1))
+        self.assertEqual(v2[1]['permissions'], (1, 2, 3))
+        self.assertEqual(v2[1]['controllers'][405419896]['open'], True)
+        self.assertIs(table.commit(state), v2)
+
+    def test_versions(self):
+        '''
+        Tests that only the records that have changed get a new revision.
+        '''
+        table = Table()
+        state = {1: {'open': False}, 2: {'open': False}}
+
+        v1 = table.commit(state)
+        state[2]['open'] = True
+        v2 = table.commit(state)
+
+        self.assertEqual(v2.version, v1.version + 1)
+        self.assertEqual(v2.revision(1), v1.revision(1))
+        self.assertNotEqual(v2.revision(2), v1.revision(2))
+        self.assertIs(v2[1], v1[1])
+
+    def test_unchanged(self):
+        '''
+        Tests that committing unchanged state returns the current snapshot.
+        '''
+        table = Table()
+        state = {1: {'open': False}}
+
+        v1 = table.commit(state)
+        v2 = table.commit(state)
+
+        self.assertIs(v1, v2)
+
+    def test_keyed_commit(self):
+        '''
+        Tests that a keyed commit only updates the records for the keys.
+        '''
+        table = Table()
+        state = {1: {'open': False}, 2: {'open': False}}
+
+        table.commit(state)
+        state[1]['open'] = True
+        state[2]['open'] = True
+        snapshot = table.commit(state, [2])
+
+        self.assertEqual(snapshot[1]['open'], False)
+        self.assertEqual(snapshot[2]['open'], True)
+
+    def test_deleted(self):
+        '''
+        Tests that records removed from the coordinator state are removed from the snapshot.
+        '''
+        table = Table()
+        table.commit({1: {}, 2: {}})
+        snapshot = table.commit({2: {}})
+
+        self.assertEqual(list(snapshot), [2])
+        self.assertIsNone(snapshot.revision(1))
+
+
+class TestDB(unittest.TestCase):
+
+    def test_tables(self):
+        '''
+        Tests that the DB table properties return the committed snapshots.
+        '''
+        db = DB()
+        db.doors = {'door-1': {'open': True}}
+        db.commit('doors', {'door-1': {'open': False}}, ['door-1'])
+
+        self.assertEqual(db.doors['door-1']['open'], False)
+        self.assertEqual(db.doors.version, 2)
+        self.assertEqual(len(db.cards), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
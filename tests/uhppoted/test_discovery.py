@@ -0,0 +1,97 @@
+'''
+UHPPOTED controller discovery unit tests.
+
+Tests the streaming get-controller broadcast.
+'''
+
+import asyncio
+import struct
+import time
+import unittest
+
+from custom_components.uhppoted.const import CONF_BIND_ADDR
+from custom_components.uhppoted.const import CONF_BROADCAST_ADDR
+from custom_components.uhppoted.const import CONF_TIMEOUT
+from custom_components.uhppoted.config import get_all_controllers
+from custom_components.uhppoted.driver.discovery import discover
+
+CONTROLLERS = [405419896, 303986753]
+
+
+def reply(controller):
+    packet = bytearray(64)
+    packet[0] = 0x17
+    packet[1] = 0x94
+    packet[4:8] = struct.pack('<L', controller)
+    packet[8:12] = bytes([192, 168, 1, 100])
+    packet[12:16] = bytes([255, 255, 255, 0])
+    packet[16:20] = bytes([192, 168, 1, 1])
+    packet[26:28] = bytes([0x08, 0x92])
+    packet[28:32] = bytes([0x20, 0x19, 0x08, 0x15])
+
+    return bytes(packet)
+
+
+class Controllers(asyncio.DatagramProtocol):
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, packet, addr):
+        loop = asyncio.get_running_loop()
+        for controller, delay in zip(CONTROLLERS, self.delays):
+            loop.call_later(delay, self.transport.sendto, reply(controller), addr)
+            loop.call_later(delay, self.transport.sendto, reply(controller), addr)
+
+
+class TestDiscovery(unittest.IsolatedAsyncioTestCase):
+
+    async def test_discover(self):
+        '''
+        Tests that discovered controllers are yielded as the replies are received and that duplicate replies are
+        discarded.
+        '''
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: Controllers([0.01, 0.2]), local_addr=('127.0.0.1', 0))
+        (_, port) = transport.get_extra_info('sockname')
+
+        try:
+            start = time.monotonic()
+            received = []
+            async for response in discover('127.0.0.1', f'127.0.0.1:{port}', 0.5):
+                received.append((response.controller, time.monotonic() - start))
+
+            self.assertEqual([c for (c, _) in received], CONTROLLERS)
+            self.assertLess(received[0][1], 0.15)
+        finally:
+            transport.close()
+
+    async def test_configured_timeout(self):
+        '''
+        Tests that the controller discovery uses the configured timeout.
+        '''
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(lambda: Controllers([0.01, 0.2]), local_addr=('127.0.0.1', 0))
+        (_, port) = transport.get_extra_info('sockname')
+
+        options = {
+            CONF_BIND_ADDR: '127.0.0.1',
+            CONF_BROADCAST_ADDR: f'127.0.0.1:{port}',
+            CONF_TIMEOUT: 0.1,
+        }
+
+        try:
+            start = time.monotonic()
+            controllers = await get_all_controllers([], options)
+
+            self.assertEqual([v['controller'] for v in controllers], CONTROLLERS[:1])
+            self.assertLess(time.monotonic() - start, 0.2)
+        finally:
+            transport.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
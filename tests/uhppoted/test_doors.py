@@ -0,0 +1,122 @@
+'''
+UHPPOTED doors coordinator unit tests.
+
+Tests the door state updates from the controller status published by the status bus.
+'''
+
+import datetime
+import tempfile
+import unittest
+
+from uhppoted.structs import GetStatusResponse
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.uhppoted.const import DOMAIN
+from custom_components.uhppoted.const import CONF_CONTROLLERS
+from custom_components.uhppoted.const import CONF_CONTROLLER_ID
+from custom_components.uhppoted.const import CONF_CONTROLLER_SERIAL_NUMBER
+from custom_components.uhppoted.const import CONF_DOORS
+from custom_components.uhppoted.const import CONF_DOOR_UNIQUE_ID
+from custom_components.uhppoted.const import CONF_DOOR_ID
+from custom_components.uhppoted.const import CONF_DOOR_CONTROLLER
+from custom_components.uhppoted.const import CONF_DOOR_NUMBER
+from custom_components.uhppoted.const import ATTR_AVAILABLE
+from custom_components.uhppoted.const import ATTR_DOOR_OPEN
+from custom_components.uhppoted.coordinators.doors import DoorsCoordinator
+from custom_components.uhppoted.coordinators.doors import resolve_doors
+from custom_components.uhppoted.coordinators.db import DB
+from custom_components.uhppoted.coordinators.status import decode
+
+OPTIONS = {
+    CONF_CONTROLLERS: [
+        {
+            CONF_CONTROLLER_ID: 'Alpha',
+            CONF_CONTROLLER_SERIAL_NUMBER: 405419896,
+        },
+        {
+            CONF_CONTROLLER_ID: 'Beta',
+            CONF_CONTROLLER_SERIAL_NUMBER: 303986753,
+        },
+    ],
+    CONF_DOORS: [
+        {
+            CONF_DOOR_UNIQUE_ID: 'door-1',
+            CONF_DOOR_ID: 'Gryffindor',
+            CONF_DOOR_CONTROLLER: 'Alpha',
+            CONF_DOOR_NUMBER: 1,
+        },
+        {
+            CONF_DOOR_UNIQUE_ID: 'door-2',
+            CONF_DOOR_ID: 'Slytherin',
+            CONF_DOOR_CONTROLLER: 'Alpha',
+            CONF_DOOR_NUMBER: 2,
+        },
+        {
+            CONF_DOOR_UNIQUE_ID: 'door-3',
+            CONF_DOOR_ID: 'Ravenclaw',
+            CONF_DOOR_CONTROLLER: 'Beta',
+            CONF_DOOR_NUMBER: 1,
+        },
+    ],
+}
+
+
+class Status:
+
+    def subscribe(self, callback):
+        return lambda: None
+
+
+def status(controller):
+    # yapf: disable
+    response = GetStatusResponse(controller,
+                                 datetime.date(2024, 11, 5), datetime.time(12, 34, 56),
+                                 True, True, False, False,
+                                 False, False, False, False,
+                                 0x00, 0, 0, 0,
+                                 100, 1, True, 1, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30), 6,
+                                 0)
+    # yapf: enable
+
+    return decode(response, 0)
+
+
+class TestDoorStatus(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.hass.data[DOMAIN] = {}
+
+    async def asyncTearDown(self):
+        self.dir.cleanup()
+
+    def test_resolve_doors(self):
+        '''
+        Tests that the configured doors are mapped to their controllers.
+        '''
+        doors = resolve_doors(OPTIONS)
+
+        self.assertEqual([idx for (idx, _) in doors[405419896]], ['door-1', 'door-2'])
+        self.assertEqual([idx for (idx, _) in doors[303986753]], ['door-3'])
+
+    async def test_on_status(self):
+        '''
+        Tests that the controller status only updates the state of the doors for that controller.
+        '''
+        coordinator = DoorsCoordinator(self.hass, OPTIONS, None, None, DB(), Status())
+        for idx in ['door-1', 'door-2', 'door-3']:
+            coordinator._state[idx] = {ATTR_AVAILABLE: True}
+
+        coordinator._on_status(status(405419896))
+
+        self.assertEqual(coordinator._state['door-1'][ATTR_DOOR_OPEN], True)
+        self.assertEqual(coordinator._state['door-2'][ATTR_DOOR_OPEN], True)
+        self.assertNotIn(ATTR_DOOR_OPEN, coordinator._state['door-3'])
+
+        coordinator.unload()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,237 @@
+'''
+UHPPOTED events coordinator unit tests.
+
+Tests the persisted event index and the event backlog catch-up.
+'''
+
+import asyncio
+import datetime
+import tempfile
+import unittest
+
+from uhppoted.structs import GetStatusResponse
+from uhppoted.structs import GetEventResponse
+from uhppoted.structs import Event
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.uhppoted.const import DOMAIN
+from custom_components.uhppoted.const import CONF_EVENTS_LISTENER_ENABLED
+from custom_components.uhppoted.const import CONF_EVENTS_CATCHUP_BATCH
+from custom_components.uhppoted.coordinators.events import EventsCoordinator
+from custom_components.uhppoted.coordinators.db import DB
+from custom_components.uhppoted.coordinators.status import decode
+from custom_components.uhppoted.uhppoted import Controller
+
+CONTROLLER = 405419896
+
+
+class Store:
+
+    def __init__(self):
+        self.saved = []
+
+    def async_delay_save(self, data, delay):
+        self.saved.append((data(), delay))
+
+
+class Driver:
+
+    def __init__(self, missing=None, mismatch=None):
+        self.requests = []
+        self.missing = missing
+        self.mismatch = mismatch
+        self.batches = 0
+
+    async def get_event(self, controller, index, callback=None):
+        self.requests.append(index)
+
+        return event(controller, index)
+
+    async def get_events(self, controller, first, last, batch=32):
+        for ix in range(first, last + 1, batch):
+            if self.missing is not None and self.missing < ix + batch:
+                raise TimeoutError('timeout')
+
+            self.batches += 1
+            yield [
+                event(controller, index + 1 if index == self.mismatch else index)
+                for index in range(ix, min(ix + batch, last + 1))
+            ]
+
+
+def event(controller, index):
+    return GetEventResponse(controller, index, 1, True, 1, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30), 2)
+
+
+class Status:
+
+    def __init__(self, index):
+        self.index = index
+
+    def publish(self, response):
+        return decode(response, 0)
+
+    async def get(self, controller):
+        # yapf: disable
+        response = GetStatusResponse(controller,
+                                     datetime.date(2024, 11, 5), datetime.time(12, 34, 56),
+                                     False, False, False, False,
+                                     False, False, False, False,
+                                     0x00, 0, 0, 0,
+                                     self.index, 1, True, 1, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30), 2,
+                                     0)
+        # yapf: enable
+
+        return decode(response, 0)
+
+
+class TestEventIndex(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.hass.data[DOMAIN] = {CONF_EVENTS_LISTENER_ENABLED: False}
+        self.driver = Driver()
+        self.store = Store()
+
+    async def asyncTearDown(self):
+        self.dir.cleanup()
+
+    def coordinator(self, index):
+        return EventsCoordinator(self.hass, {}, None, self.driver, DB(), Status(index))
+
+    async def test_restore(self):
+        '''
+        Tests that the events are retrieved from the restored event index.
+        '''
+        coordinator = self.coordinator(140)
+        coordinator.restore(self.store, {'index': {f'{CONTROLLER}': 137}})
+
+        await coordinator._get_controller_events(asyncio.Lock(), Controller(CONTROLLER, None, None))
+
+        self.assertEqual(self.driver.requests, [138, 139, 140])
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 140)
+
+    async def test_delayed_save(self):
+        '''
+        Tests that a changed event index schedules a delayed save.
+        '''
+        coordinator = self.coordinator(140)
+        coordinator.restore(self.store, None)
+
+        coordinator._set_index(CONTROLLER, 150)
+        coordinator._set_index(CONTROLLER, 150)
+
+        self.assertEqual(self.store.saved, [({'index': {f'{CONTROLLER}': 150}}, 15)])
+
+    async def test_reset(self):
+        '''
+        Tests that the event index is reset if the controller event index goes backwards.
+        '''
+        coordinator = self.coordinator(12)
+        coordinator.restore(self.store, {'index': {f'{CONTROLLER}': 137}})
+
+        await coordinator._get_controller_events(asyncio.Lock(), Controller(CONTROLLER, None, None))
+
+        self.assertEqual(self.driver.requests, [])
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 12)
+        self.assertEqual(self.store.saved, [({'index': {f'{CONTROLLER}': 12}}, 15)])
+
+
+class TestCatchUp(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.hass.data[DOMAIN] = {CONF_EVENTS_LISTENER_ENABLED: False, CONF_EVENTS_CATCHUP_BATCH: 16}
+
+    async def asyncTearDown(self):
+        self.dir.cleanup()
+
+    async def test_incomplete(self):
+        '''
+        Tests that the event index is only advanced to the last event retrieved if the catch-up stops partway.
+        '''
+        coordinator = EventsCoordinator(self.hass, {}, None, Driver(missing=120), DB(), Status(150))
+        coordinator.restore(Store(), {'index': {f'{CONTROLLER}': 100}})
+        coordinator._deferred[CONTROLLER] = 150
+
+        await coordinator._get_backlog(CONTROLLER, 101, 150, {})
+
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 116)
+        self.assertNotIn(CONTROLLER, coordinator._deferred)
+
+    async def test_complete(self):
+        '''
+        Tests that the event index includes the listener events received during the catch-up once the whole backlog
+        has been retrieved.
+        '''
+        coordinator = EventsCoordinator(self.hass, {}, None, Driver(), DB(), Status(150))
+        coordinator.restore(Store(), {'index': {f'{CONTROLLER}': 100}})
+        coordinator._deferred[CONTROLLER] = 153
+
+        await coordinator._get_backlog(CONTROLLER, 101, 150, {})
+
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 153)
+
+    async def test_deferred_listener_index(self):
+        '''
+        Tests that a listener event received during the catch-up only advances the event index once the whole backlog
+        has been retrieved.
+        '''
+        coordinator = EventsCoordinator(self.hass, {}, None, Driver(), DB(), Status(150))
+        coordinator.restore(Store(), {'index': {f'{CONTROLLER}': 100}})
+        coordinator.async_add_listener(lambda: None, CONTROLLER)
+        coordinator._catchup[CONTROLLER] = None
+
+        # yapf: disable
+        coordinator._onEvent(Event(CONTROLLER, 160, 1, True, 1, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30), 2,
+                                   datetime.date(2024, 11, 5), datetime.time(12, 34, 56),
+                                   False, False, False, False,
+                                   False, False, False, False,
+                                   0x00, 0, 0, 0, 0))
+        # yapf: enable
+
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 100)
+        self.assertEqual(coordinator._deferred[CONTROLLER], 160)
+
+        await coordinator._get_backlog(CONTROLLER, 101, 150, {})
+
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 160)
+
+    async def test_mismatch(self):
+        '''
+        Tests that the catch-up stops at an unexpected event rather than fetching the rest of the backlog.
+        '''
+        driver = Driver(mismatch=110)
+        coordinator = EventsCoordinator(self.hass, {}, None, driver, DB(), Status(150))
+        coordinator.restore(Store(), {'index': {f'{CONTROLLER}': 100}})
+        coordinator._deferred[CONTROLLER] = 150
+
+        await coordinator._get_backlog(CONTROLLER, 101, 150, {})
+
+        self.assertEqual(coordinator._state['index'][CONTROLLER], 109)
+        self.assertEqual(driver.batches, 1)
+
+    async def test_refresh_schedule(self):
+        '''
+        Tests that the catch-up updates the listeners without rescheduling the coordinator refresh.
+        '''
+        coordinator = EventsCoordinator(self.hass, {}, datetime.timedelta(seconds=30), Driver(), DB(), Status(150))
+        coordinator.restore(Store(), {'index': {f'{CONTROLLER}': 100}})
+        updated = []
+        unsubscribe = coordinator.async_add_listener(lambda: updated.append(True), CONTROLLER)
+        scheduled = coordinator._unsub_refresh
+
+        await coordinator._get_backlog(CONTROLLER, 101, 150, {})
+
+        self.assertIsNotNone(scheduled)
+        self.assertIs(coordinator._unsub_refresh, scheduled)
+        self.assertEqual(len(updated), 4)
+
+        unsubscribe()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+'''
+UHPPOTED keyed coordinator unit tests.
+
+Tests that keyed coordinator updates only invoke the listeners registered for the updated keys.
+'''
+
+import asyncio
+import datetime
+import logging
+import tempfile
+import unittest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.uhppoted.coordinators.keyed import KeyedCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestKeyedCoordinator(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.coordinator = KeyedCoordinator(self.hass, _LOGGER, name='test', update_interval=None)
+        self.updated = []
+
+        def listener(key):
+            return lambda: self.updated.append(key)
+
+        self.unsubscribe = {k: self.coordinator.async_add_listener(listener(k), k) for k in [1, 2, 3, 'A', 'B']}
+        self.coordinator.async_add_listener(listener(None))
+
+    async def asyncTearDown(self):
+        self.dir.cleanup()
+
+    async def test_keyed_update(self):
+        '''
+        Tests that a keyed update only invokes the listeners for the updated keys (and listeners without a context).
+        '''
+        self.coordinator.async_set_updated_keys({}, [2, 'B'])
+
+        self.assertEqual(sorted(self.updated, key=str), [2, 'B', None])
+
+    async def test_full_update(self):
+        '''
+        Tests that an unkeyed update invokes all the listeners.
+        '''
+        self.coordinator.async_set_updated_data({})
+
+        self.assertEqual(sorted(self.updated, key=str), [1, 2, 3, 'A', 'B', None])
+
+    async def test_failed_update(self):
+        '''
+        Tests that a keyed update invokes all the listeners if the coordinator was in a failed state.
+        '''
+        self.coordinator.last_update_success = False
+        self.coordinator.async_set_updated_keys({}, [2])
+
+        self.assertEqual(sorted(self.updated, key=str), [1, 2, 3, 'A', 'B', None])
+
+    async def test_remove_listener(self):
+        '''
+        Tests that a removed listener is not invoked by a keyed update.
+        '''
+        self.unsubscribe[2]()
+        self.coordinator.async_set_updated_keys({}, [2, 3])
+
+        self.assertEqual(sorted(self.updated, key=str), [3, None])
+        self.assertEqual(sorted(self.coordinator.async_contexts(), key=str), [1, 3, 'A', 'B'])
+
+    async def test_refresh_schedule(self):
+        '''
+        Tests that a keyed update doesn't reschedule the coordinator refresh.
+        '''
+        coordinator = KeyedCoordinator(self.hass, _LOGGER, name='test', update_interval=datetime.timedelta(seconds=30))
+        unsubscribe = coordinator.async_add_listener(lambda: None, 1)
+        scheduled = coordinator._unsub_refresh
+
+        coordinator.async_set_updated_keys({}, [1])
+
+        self.assertIsNotNone(scheduled)
+        self.assertIs(coordinator._unsub_refresh, scheduled)
+
+        unsubscribe()
+
+
+class TestPublish(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.hass = HomeAssistant(self.dir.name)
+        self.coordinator = KeyedCoordinator(self.hass, _LOGGER, name='test', update_interval=None)
+        self.coordinator.publish_window = 0.05
+        self.updated = []
+
+        def listener(key):
+            return lambda: self.updated.append(key)
+
+        for k in [1, 2, 3, 4]:
+            self.coordinator.async_add_listener(listener(k), k)
+
+    async def asyncTearDown(self):
+        self.coordinator.async_discard()
+        self.dir.cleanup()
+
+    async def test_batched_publish(self):
+        '''
+        Tests that the keys published within the publish window are flushed as a single keyed update.
+        '''
+        self.coordinator.async_publish([1])
+        self.coordinator.async_publish([3])
+        self.coordinator.async_publish([1])
+
+        self.assertEqual(self.updated, [])
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(sorted(self.updated), [1, 3])
+
+    async def test_immediate_publish(self):
+        '''
+        Tests that keys are published immediately if the publish window is 0.
+        '''
+        self.coordinator.publish_window = 0
+        self.coordinator.async_publish([2])
+
+        self.assertEqual(self.updated, [2])
+
+    async def test_full_update_clears_pending(self):
+        '''
+        Tests that a full update discards the pending keys (since all the listeners have been updated).
+        '''
+        self.coordinator.async_publish([1, 2])
+        self.coordinator.async_set_updated_data({})
+
+        await asyncio.sleep(0.1)
+
+        self.assertEqual(sorted(self.updated), [1, 2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+'''
+UHPPOTED request pacing unit tests.
+
+Tests the token bucket request pacing.
+'''
+
+import asyncio
+import time
+import unittest
+
+from custom_components.uhppoted.driver.pacing import TokenBucket
+from custom_components.uhppoted.driver.pacing import Pacer
+from custom_components.uhppoted.driver.pacing import _NETWORKS
+
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+
+    async def test_burst(self):
+        '''
+        Tests that a burst of requests up to the bucket size is not delayed.
+        '''
+        bucket = TokenBucket(1, 5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    async def test_rate(self):
+        '''
+        Tests that requests in excess of the burst size are paced at the bucket rate.
+        '''
+        bucket = TokenBucket(50, 1)
+
+        start = time.monotonic()
+        await asyncio.gather(*[bucket.acquire() for _ in range(6)])
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.095)
+
+    async def test_unlimited(self):
+        '''
+        Tests that a bucket with a zero rate doesn't delay requests.
+        '''
+        bucket = TokenBucket(0, 1)
+
+        start = time.monotonic()
+        for _ in range(100):
+            await bucket.acquire()
+
+        self.assertLess(time.monotonic() - start, 0.1)
+
+
+class TestPacer(unittest.IsolatedAsyncioTestCase):
+
+    async def test_controllers_are_paced_independently(self):
+        '''
+        Tests that requests to one controller don't use the tokens for another controller.
+        '''
+        pacer = Pacer('192.168.1.100', (10, 1), (None, 1))
+
+        await pacer.acquire(405419896)
+
+        start = time.monotonic()
+        await pacer.acquire(303986753)
+
+        self.assertLess(time.monotonic() - start, 0.05)
+
+    async def test_network_bucket_is_shared(self):
+        '''
+        Tests that drivers using the same bind address share the network bucket.
+        '''
+        p = Pacer('192.168.1.101', (None, 1), (10, 1))
+        q = Pacer('192.168.1.101', (None, 1), (10, 1))
+
+        await p.acquire(405419896)
+
+        start = time.monotonic()
+        await q.acquire(303986753)
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    async def test_network_bucket_is_reconfigured(self):
+        '''
+        Tests that a shared network bucket is reconfigured by a driver using the same bind address.
+        '''
+        p = Pacer('192.168.1.102', (None, 1), (10, 1))
+        q = Pacer('192.168.1.102', (None, 1), (50, 5))
+
+        self.assertEqual(p.network, (50.0, 5))
+        self.assertEqual(q.network, (50.0, 5))
+
+    async def test_clear(self):
+        '''
+        Tests that the network bucket is discarded when the last driver using it is cleared.
+        '''
+        p = Pacer('192.168.1.103', (None, 1), (10, 1))
+        q = Pacer('192.168.1.103', (None, 1), (10, 1))
+
+        p.clear()
+        p.clear()
+        self.assertIn('192.168.1.103', _NETWORKS)
+
+        q.clear()
+        self.assertNotIn('192.168.1.103', _NETWORKS)
+
+        r = Pacer('192.168.1.103', (None, 1), (20, 2))
+        self.assertEqual(r.network, (20.0, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
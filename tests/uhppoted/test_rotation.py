@@ -0,0 +1,136 @@
+'''
+UHPPOTED card polling rotation unit tests.
+
+Tests the selection of the cards refreshed on each poll cycle.
+'''
+
+import unittest
+
+from custom_components.uhppoted.coordinators.rotation import Rotation
+
+CARDS = list(range(10058400, 10058420))
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRotation(unittest.TestCase):
+
+    def poll(self, rotation, clock, interval=30):
+        selected = rotation.select(CARDS, interval)
+        for card in selected:
+            rotation.refreshed(card)
+
+        clock.now += interval
+
+        return selected
+
+    def test_all(self):
+        '''
+        Tests that all the cards are selected if the number of cards does not exceed the slice.
+        '''
+        rotation = Rotation(32, 300, Clock())
+
+        self.assertEqual(rotation.select(CARDS, 30), CARDS)
+
+    def test_disabled(self):
+        '''
+        Tests that all the cards are selected if the slice is 0.
+        '''
+        rotation = Rotation(0, 300, Clock())
+
+        self.assertEqual(rotation.select(CARDS, 30), CARDS)
+
+    def test_rotation(self):
+        '''
+        Tests that the slice rotates through all the cards.
+        '''
+        clock = Clock()
+        rotation = Rotation(5, 600, clock)
+        polled = []
+
+        for _ in range(4):
+            selected = self.poll(rotation, clock)
+            self.assertEqual(len(selected), 5)
+            polled.extend(selected)
+
+        self.assertEqual(sorted(polled), CARDS)
+
+    def test_touched(self):
+        '''
+        Tests that touched cards are refreshed first.
+        '''
+        clock = Clock()
+        rotation = Rotation(5, 600, clock)
+
+        self.poll(rotation, clock)
+        rotation.touch(CARDS[0])
+        rotation.touch(CARDS[1])
+        selected = self.poll(rotation, clock)
+
+        self.assertEqual(len(selected), 5)
+        self.assertEqual(selected[:2], CARDS[:2])
+        self.assertEqual(selected[2:], CARDS[5:8])
+
+        # ... touched only once
+        selected = self.poll(rotation, clock)
+        self.assertNotIn(CARDS[0], selected)
+
+    def test_max_age(self):
+        '''
+        Tests that the slice is increased to refresh every card within max_age.
+        '''
+        clock = Clock()
+        rotation = Rotation(2, 60, clock)
+        refreshed = {}
+
+        for _ in range(10):
+            for card in self.poll(rotation, clock):
+                refreshed[card] = clock.now
+
+            for card in CARDS:
+                self.assertLessEqual(clock.now - refreshed.get(card, 0), 60)
+
+    def test_overdue(self):
+        '''
+        Tests that cards that would exceed max_age are refreshed even if touched cards fill the slice.
+        '''
+        clock = Clock()
+        rotation = Rotation(10, 60, clock)
+
+        self.poll(rotation, clock)
+        self.poll(rotation, clock)
+
+        for card in CARDS[10:]:
+            rotation.touch(card)
+
+        selected = self.poll(rotation, clock)
+
+        self.assertEqual(sorted(selected), CARDS)
+
+    def test_not_refreshed(self):
+        '''
+        Tests that a card that was selected but not refreshed keeps its priority.
+        '''
+        clock = Clock()
+        rotation = Rotation(5, 600, clock)
+
+        selected = rotation.select(CARDS, 30)
+        for card in selected[1:]:
+            rotation.refreshed(card)
+
+        clock.now += 30
+        selected = rotation.select(CARDS, 30)
+
+        self.assertEqual(selected[0], CARDS[0])
+        self.assertEqual(selected[1:], CARDS[5:9])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+'''
+UHPPOTED adaptive timeout unit tests.
+
+Tests the per-controller RTT estimator used to derive the request timeouts.
+'''
+
+import unittest
+
+from custom_components.uhppoted.driver.rtt import RTT
+
+CONTROLLER = 405419896
+
+
+class TestRTT(unittest.TestCase):
+
+    def test_default(self):
+        '''
+        Tests that the configured timeout is used until there is an RTT sample for the controller.
+        '''
+        rtt = RTT(0.1, 5.0)
+
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 2.5)
+
+    def test_fast_controller(self):
+        '''
+        Tests that the timeout for a controller on the local LAN is the lower bound.
+        '''
+        rtt = RTT(0.1, 5.0)
+        for _ in range(10):
+            rtt.sample(CONTROLLER, 0.003)
+
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 0.1)
+
+    def test_slow_controller(self):
+        '''
+        Tests that the timeout for a controller on a slow link tracks the RTT and variance.
+        '''
+        rtt = RTT(0.1, 5.0)
+        for v in [2.0, 2.4, 1.8, 2.2, 2.0]:
+            rtt.sample(CONTROLLER, v)
+
+        timeout = rtt.timeout(CONTROLLER, 2.5)
+
+        self.assertGreater(timeout, 2.5)
+        self.assertLessEqual(timeout, 5.0)
+
+    def test_backoff(self):
+        '''
+        Tests that a timeout doubles the controller timeout up to the upper bound and that the next sample resets it.
+        '''
+        rtt = RTT(0.1, 1.0)
+        rtt.sample(CONTROLLER, 0.003)
+
+        rtt.expired(CONTROLLER)
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 0.2)
+
+        rtt.expired(CONTROLLER)
+        rtt.expired(CONTROLLER)
+        rtt.expired(CONTROLLER)
+        rtt.expired(CONTROLLER)
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 1.0)
+
+        rtt.sample(CONTROLLER, 0.003)
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 0.1)
+
+    def test_disabled(self):
+        '''
+        Tests that the configured timeout is always used if adaptive timeouts are disabled.
+        '''
+        rtt = RTT(0.1, 5.0)
+        rtt.enabled = False
+        rtt.sample(CONTROLLER, 0.003)
+
+        self.assertEqual(rtt.timeout(CONTROLLER, 2.5), 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
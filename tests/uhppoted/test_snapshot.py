@@ -0,0 +1,68 @@
+'''
+UHPPOTED driver cache snapshot unit tests.
+
+Tests the encoding and decoding of cached responses.
+'''
+
+import datetime
+import ipaddress
+import json
+import unittest
+
+from uhppoted.structs import GetControllerResponse
+from uhppoted.structs import GetCardResponse
+from uhppoted.structs import GetEventResponse
+
+from custom_components.uhppoted.driver.snapshot import encode
+from custom_components.uhppoted.driver.snapshot import decode
+
+TYPES = {
+    'GetControllerResponse': GetControllerResponse,
+    'GetCardResponse': GetCardResponse,
+}
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def test_controller(self):
+        '''
+        Tests the round trip encoding of a response with IPv4 address and date fields.
+        '''
+        response = GetControllerResponse(405419896,
+                                         ipaddress.IPv4Address('192.168.1.100'),
+                                         ipaddress.IPv4Address('255.255.255.0'),
+                                         ipaddress.IPv4Address('192.168.1.1'),
+                                         '00:12:23:34:45:56',
+                                         'v8.92',
+                                         datetime.date(2018, 11, 5))  # yapf: disable
+
+        encoded = json.loads(json.dumps(encode(response)))
+
+        self.assertEqual(decode(encoded, TYPES), response)
+
+    def test_card(self):
+        '''
+        Tests the round trip encoding of a response with a dict field.
+        '''
+        response = GetCardResponse(405419896, 10058400,
+                                   datetime.date(2025, 1, 1), datetime.date(2025, 12, 31),
+                                   1, 0, 29, 1,
+                                   7531,
+                                   {1: True, 3: False})  # yapf: disable
+
+        encoded = json.loads(json.dumps(encode(response)))
+
+        self.assertEqual(decode(encoded, TYPES), response)
+
+    def test_unknown_type(self):
+        '''
+        Tests that a response with a class that is not in the list of known types is not decoded.
+        '''
+        response = GetEventResponse(405419896, 17, 1, True, 1, 1, 10058400, datetime.datetime(2025, 1, 1, 12, 34, 56), 6)
+
+        with self.assertRaises(ValueError):
+            decode(json.loads(json.dumps(encode(response))), TYPES)
+
+
+if __name__ == '__main__':
+    unittest.main()
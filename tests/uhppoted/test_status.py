@@ -0,0 +1,167 @@
+'''
+UHPPOTED status bus unit tests.
+
+Tests the controller status snapshot shared by the doors and events coordinators.
+'''
+
+import asyncio
+import datetime
+import unittest
+
+from uhppoted.structs import GetStatusResponse
+from uhppoted.structs import Event
+
+from custom_components.uhppoted.coordinators.status import StatusBus
+
+CONTROLLER = 405419896
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Driver:
+
+    def __init__(self):
+        self.requests = 0
+        self.callbacks = []
+        self.cached = True
+
+    def status_cached(self, controller):
+        return self.cached
+
+    async def get_status(self, controller, callback=None):
+        self.requests += 1
+        self.callbacks.append(callback)
+
+        await asyncio.sleep(0.01)
+
+        # ... background refresh only (as for the driver with a cold cache)
+        if callback is not None and not self.cached:
+            return None
+
+        return status(controller, 100 + self.requests, 0x05)
+
+
+def status(controller, index, relays):
+    # yapf: disable
+    return GetStatusResponse(controller,
+                             datetime.date(2024, 11, 5), datetime.time(12, 34, 56),
+                             True, False, False, True,
+                             True, False, False, False,
+                             relays, 0, 0, 0,
+                             index, 1, True, 1, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30, 00), 6,
+                             0)
+    # yapf: enable
+
+
+class TestStatusBus(unittest.IsolatedAsyncioTestCase):
+
+    async def test_shared_snapshot(self):
+        '''
+        Tests that concurrent and subsequent requests within max_age share a single get-status request.
+        '''
+        clock = Clock()
+        driver = Driver()
+        bus = StatusBus(driver, 27, clock)
+
+        (p, q) = await asyncio.gather(bus.get(CONTROLLER), bus.get(CONTROLLER))
+        r = await bus.get(CONTROLLER)
+
+        self.assertEqual(driver.requests, 1)
+        self.assertIs(p, q)
+        self.assertIs(p, r)
+
+        clock.now = 30.0
+        s = await bus.get(CONTROLLER)
+
+        self.assertEqual(driver.requests, 2)
+        self.assertEqual(s.event_index, 102)
+
+    async def test_cold_cache(self):
+        '''
+        Tests that the status is fetched in the foreground if the driver has no cached status record.
+        '''
+        driver = Driver()
+        driver.cached = False
+        bus = StatusBus(driver, 27, Clock())
+
+        snapshot = await bus.get(CONTROLLER)
+
+        self.assertIsNotNone(snapshot)
+        self.assertEqual(snapshot.event_index, 101)
+        self.assertEqual(driver.callbacks, [None])
+
+    async def test_decode(self):
+        '''
+        Tests that the status is decoded into the door state.
+        '''
+        bus = StatusBus(Driver(), 27, Clock())
+
+        snapshot = await bus.get(CONTROLLER)
+
+        self.assertEqual(snapshot.event_index, 101)
+        self.assertEqual(snapshot.relays, 0x05)
+        self.assertTrue(snapshot.doors[1].open)
+        self.assertFalse(snapshot.doors[1].locked)
+        self.assertTrue(snapshot.doors[2].locked)
+        self.assertTrue(snapshot.doors[1].button)
+        self.assertFalse(snapshot.doors[4].button)
+        self.assertTrue(snapshot.doors[4].open)
+
+    async def test_subscribers(self):
+        '''
+        Tests that a background refresh is published to the subscribers.
+        '''
+        driver = Driver()
+        bus = StatusBus(driver, 27, Clock())
+        published = []
+
+        unsubscribe = bus.subscribe(lambda s: published.append(s.event_index))
+
+        await bus.get(CONTROLLER)
+        await driver.callbacks[0](status(CONTROLLER, 123, 0x00))
+        unsubscribe()
+        await driver.callbacks[0](status(CONTROLLER, 124, 0x00))
+
+        self.assertEqual(published, [101, 123])
+        self.assertEqual(bus.snapshot(CONTROLLER).event_index, 124)
+
+    async def test_listener_event(self):
+        '''
+        Tests that a listener event is decoded and published as a status snapshot without a get-status request.
+        '''
+        driver = Driver()
+        bus = StatusBus(driver, 27, Clock())
+        published = []
+
+        bus.subscribe(lambda s: published.append(s))
+
+        # yapf: disable
+        event = Event(CONTROLLER, 137, 1, True, 3, 1, 10058400, datetime.datetime(2024, 11, 5, 12, 30, 00), 6,
+                      datetime.date(2024, 11, 5), datetime.time(12, 34, 56),
+                      False, False, True, False,
+                      False, False, False, False,
+                      0x04, 0, 0, 0, 0)
+        # yapf: enable
+
+        bus.publish(event)
+        snapshot = await bus.get(CONTROLLER)
+
+        self.assertEqual(driver.requests, 0)
+        self.assertEqual(len(published), 1)
+        self.assertEqual(snapshot.event_index, 137)
+        self.assertIsInstance(snapshot.response, GetStatusResponse)
+        self.assertEqual(snapshot.response.event_card, 10058400)
+        self.assertTrue(snapshot.doors[3].open)
+        self.assertFalse(snapshot.doors[3].locked)
+        self.assertTrue(snapshot.doors[1].locked)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+'''
+UHPPOTED adaptive cache expiry unit tests.
+
+Tests the adjustment of the cache lifetime for stable and volatile values.
+'''
+
+import unittest
+
+from custom_components.uhppoted.driver.ttl import AdaptiveTTL
+
+
+class TestAdaptiveTTL(unittest.TestCase):
+
+    def test_stable(self):
+        '''
+        Tests that the lifetime of an unchanged value is increased up to the upper bound.
+        '''
+        ttl = AdaptiveTTL(0.5, 4.0)
+
+        self.assertEqual(ttl.lifetime('door', 600), 600)
+
+        ttl.observe('door', False)
+        self.assertEqual(ttl.lifetime('door', 600), 1200)
+
+        for _ in range(10):
+            ttl.observe('door', False)
+
+        self.assertEqual(ttl.lifetime('door', 600), 2400)
+
+    def test_volatile(self):
+        '''
+        Tests that the lifetime of a changed value is reset and then decreased down to the lower bound.
+        '''
+        ttl = AdaptiveTTL(0.5, 4.0)
+
+        ttl.observe('door', False)
+        ttl.observe('door', False)
+        ttl.observe('door', True)
+        self.assertEqual(ttl.lifetime('door', 600), 600)
+
+        for _ in range(10):
+            ttl.observe('door', True)
+
+        self.assertEqual(ttl.lifetime('door', 600), 300)
+
+    def test_no_expiry(self):
+        '''
+        Tests that a value with no expiry is not affected.
+        '''
+        ttl = AdaptiveTTL(0.5, 4.0)
+
+        ttl.observe('interlock', False)
+        self.assertIsNone(ttl.lifetime('interlock', None))
+
+    def test_bounds(self):
+        '''
+        Tests that changing the bounds clamps the existing factors.
+        '''
+        ttl = AdaptiveTTL(0.5, 4.0)
+
+        for _ in range(3):
+            ttl.observe('door', False)
+
+        ttl.bounds = (0.5, 2.0)
+        self.assertEqual(ttl.lifetime('door', 600), 1200)
+
+
+if __name__ == '__main__':
+    unittest.main()
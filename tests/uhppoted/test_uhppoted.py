@@ -0,0 +1,596 @@
+'''
+UHPPOTED driver unit tests.
+
+Tests the request handling in the uhppoted driver.
+'''
+
+import asyncio
+import unittest
+
+from dataclasses import dataclass
+
+from uhppoted.structs import GetDoorControlResponse
+from uhppoted.structs import GetCardResponse
+from uhppoted.structs import GetCardsResponse
+from uhppoted.structs import GetCardByIndexResponse
+from uhppoted.structs import GetEventResponse
+from uhppoted.structs import PutCardResponse
+from uhppoted.structs import DeleteCardResponse
+
+from custom_components.uhppoted.uhppoted import uhppoted
+from custom_components.uhppoted.const import CONF_CACHE_EXPIRY_STATUS
+from custom_components.uhppoted.const import CONF_CACHE_EXPIRY_DOOR
+
+CONTROLLER = 405419896
+OFFLINE = 303986753
+
+
+@dataclass
+class Status:
+    controller: int
+    event_index: int
+
+
+class API:
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.requests = []
+        self.inflight = 0
+        self.max_inflight = 0
+        self.cards = {}
+        self.missing = set()
+        self.failing = set()
+
+    async def get_status(self, controller, timeout=2.5):
+        self.requests.append(('get-status', controller))
+        if controller[0] == OFFLINE or self.delay > timeout:
+            await asyncio.sleep(timeout)
+            raise TimeoutError('timeout')
+
+        await asyncio.sleep(self.delay)
+
+        return Status(controller[0], len(self.requests))
+
+    async def get_door_control(self, controller, door, timeout=2.5):
+        self.requests.append(('get-door-control', controller))
+
+        await asyncio.sleep(self.delay)
+
+        return GetDoorControlResponse(controller[0], door, 3, 5)
+
+    async def get_card(self, controller, card, timeout=2.5):
+        self.requests.append(('get-card', controller))
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.inflight -= 1
+
+        if card in self.failing:
+            raise TimeoutError('timeout')
+
+        return GetCardResponse(controller[0], card, None, None, 1, 0, 0, 0, 0)
+
+    async def get_event(self, controller, index, timeout=2.5):
+        self.requests.append(('get-event', controller))
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+
+        try:
+            await asyncio.sleep(self.delay * (1 + index % 3))
+        finally:
+            self.inflight -= 1
+
+        if index in self.missing:
+            raise TimeoutError('timeout')
+
+        return GetEventResponse(controller[0], index, 1, True, 1, 1, 10058400, None, 1)
+
+    async def put_card(self, controller, card, start, end, door1, door2, door3, door4, PIN, timeout=2.5):
+        self.requests.append(('put-card', controller))
+
+        return PutCardResponse(controller[0], True)
+
+    async def delete_card(self, controller, card, timeout=2.5):
+        self.requests.append(('delete-card', controller))
+
+        return DeleteCardResponse(controller[0], True)
+
+    async def get_cards(self, controller, timeout=2.5):
+        self.requests.append(('get-cards', controller))
+
+        return GetCardsResponse(controller[0], len(self.cards))
+
+    async def get_card_by_index(self, controller, index, timeout=2.5):
+        self.requests.append(('get-card-by-index', controller))
+
+        if card := self.cards.get(index):
+            return GetCardByIndexResponse(controller[0], card, None, None, 1, 0, 0, 0, 0)
+
+        return GetCardByIndexResponse(controller[0], 0, None, None, 0, 0, 0, 0, 0)
+
+
+def driver(api):
+    u = uhppoted('0.0.0.0', '255.255.255.255:60000', '0.0.0.0:60001', [], 2.5, False)
+    u._asio = api
+
+    return u
+
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_requests_are_coalesced(self):
+        '''
+        Tests that concurrent requests for the same key are sent only once.
+        '''
+        api = API()
+        u = driver(api)
+        u.cache_enabled = False
+
+        responses = await asyncio.gather(*[u.get_status(CONTROLLER) for _ in range(5)])
+
+        self.assertEqual(len(api.requests), 1)
+        self.assertTrue(all(r == Status(CONTROLLER, 1) for r in responses))
+
+    async def test_sequential_requests_are_not_coalesced(self):
+        '''
+        Tests that a request issued after the in-flight request has completed is sent again.
+        '''
+        api = API()
+        u = driver(api)
+        u.cache_enabled = False
+
+        await u.get_status(CONTROLLER)
+        await u.get_status(CONTROLLER)
+
+        self.assertEqual(len(api.requests), 2)
+
+    async def test_cancelled_caller_does_not_cancel_request(self):
+        '''
+        Tests that cancelling one of the callers does not cancel the shared request.
+        '''
+        api = API()
+        u = driver(api)
+        u.cache_enabled = False
+
+        first = asyncio.create_task(u.get_status(CONTROLLER))
+        second = asyncio.create_task(u.get_status(CONTROLLER))
+
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        self.assertEqual(await second, Status(CONTROLLER, 1))
+        self.assertEqual(len(api.requests), 1)
+
+
+class TestQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_offline_controller_does_not_block_other_controllers(self):
+        '''
+        Tests that background refreshes for an unreachable controller don't delay refreshes for other controllers.
+        '''
+        api = API()
+        u = driver(api)
+        refreshed = asyncio.Event()
+
+        async def callback(response):
+            refreshed.set()
+
+        for _ in range(3):
+            await u.get_status(OFFLINE, callback)
+
+        await u.get_status(CONTROLLER, callback)
+
+        await asyncio.wait_for(refreshed.wait(), timeout=1.0)
+
+        u.stop(None)
+
+    async def test_pending_refreshes_are_merged(self):
+        '''
+        Tests that repeated refreshes for a pending key are merged into a single queued request.
+        '''
+        api = API()
+        u = driver(api)
+        refreshed = []
+
+        def callback(tag):
+
+            async def f(response):
+                refreshed.append(tag)
+
+            return f
+
+        async def other(response):
+            refreshed.append('other')
+
+        for tag in range(10):
+            await u.get_status(OFFLINE, callback(tag))
+
+        await u.get_status(OFFLINE, other)
+
+        self.assertEqual(u.queue_depth, 1)
+        self.assertEqual([len(r.callbacks) for r in u.pending], [2])
+
+        u.stop(None)
+
+
+class TestCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+
+    async def test_offline_controller_fails_fast(self):
+        '''
+        Tests that requests to a controller fail immediately once the controller circuit breaker is open.
+        '''
+        api = API()
+        u = driver(api)
+        u.cache_enabled = False
+        u.pacing_enabled = False
+        u.adaptive_timeout = False
+        u.breaker_threshold = 2
+        u._timeout = 0.05
+
+        for _ in range(2):
+            with self.assertRaises(TimeoutError):
+                await u.get_status(OFFLINE)
+
+        self.assertFalse(u.available(OFFLINE))
+        self.assertTrue(u.available(CONTROLLER))
+
+        api.requests.clear()
+        with self.assertRaises(Exception):
+            await u.get_status(OFFLINE)
+
+        self.assertEqual(api.requests, [])
+        self.assertEqual(u.breakers[f'{OFFLINE}']['rejected'], 1)
+
+    async def test_adaptive_timeout_does_not_open_circuit(self):
+        '''
+        Tests that timeouts shortened by the adaptive timeout don't open the controller circuit breaker.
+        '''
+        api = API(delay=0.2)
+        u = driver(api)
+        u.cache_enabled = False
+        u.pacing_enabled = False
+        u.adaptive_timeout_bounds = (0.02, 5.0)
+        u.breaker_threshold = 2
+        u._rtt.sample(CONTROLLER, 0.003)
+
+        for _ in range(3):
+            with self.assertRaises(TimeoutError):
+                await u.get_status(CONTROLLER)
+
+        self.assertTrue(u.available(CONTROLLER))
+        self.assertEqual(len(api.requests), 3)
+
+
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+
+    async def test_request_metrics(self):
+        '''
+        Tests that requests and timeouts are counted per controller and operation.
+        '''
+        api = API()
+        u = driver(api)
+        u._timeout = 0.1
+
+        await u.get_status(CONTROLLER)
+        await u.get_status(CONTROLLER)
+
+        metrics = u.metrics
+        ok = metrics['requests'][f'{CONTROLLER}']['get-status']
+
+        self.assertEqual(ok['requests'], 1)
+        self.assertEqual(ok['latency']['count'], 1)
+        self.assertEqual(metrics['cache'][CONF_CACHE_EXPIRY_STATUS]['hits'], 1)
+        self.assertEqual(metrics['cache'][CONF_CACHE_EXPIRY_STATUS]['misses'], 1)
+
+        u.stop(None)
+
+        with self.assertRaises(TimeoutError):
+            await u.get_status(OFFLINE)
+
+        metrics = u.metrics
+        offline = metrics['requests'][f'{OFFLINE}']['get-status']
+
+        self.assertEqual(offline['timeouts'], 1)
+        self.assertEqual(metrics['cache'][CONF_CACHE_EXPIRY_STATUS]['misses'], 1)
+
+        u.stop(None)
+
+    async def test_stop_clears_metrics(self):
+        '''
+        Tests that stopping the driver clears the request metrics and cancels the in-flight requests.
+        '''
+        api = API()
+        u = driver(api)
+        u.cache_enabled = False
+
+        await u.get_status(CONTROLLER)
+        pending = asyncio.create_task(u.get_status(CONTROLLER))
+        await asyncio.sleep(0.01)
+
+        u.stop(None)
+
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+
+        metrics = u.metrics
+
+        self.assertEqual(metrics['requests'], {})
+        self.assertEqual(metrics['cache'], {})
+        self.assertEqual(metrics['queue']['peak'], 0)
+        self.assertEqual(u._inflight, {})
+
+
+class TestAdaptiveExpiry(unittest.IsolatedAsyncioTestCase):
+
+    async def test_stable_value_refresh_is_skipped(self):
+        '''
+        Tests that the background refresh for a value that hasn't changed is skipped.
+        '''
+        api = API()
+        u = driver(api)
+        refreshed = asyncio.Event()
+
+        async def callback(response):
+            refreshed.set()
+
+        await u.get_door(CONTROLLER, 1)
+        await u.get_door(CONTROLLER, 1, callback)
+        await asyncio.wait_for(refreshed.wait(), timeout=1.0)
+
+        self.assertEqual(await u.get_door(CONTROLLER, 1, callback), GetDoorControlResponse(CONTROLLER, 1, 3, 5))
+        self.assertEqual(u.queue_depth, 0)
+        self.assertEqual(len(api.requests), 2)
+
+        u.stop(None)
+
+
+class TestLookup(unittest.TestCase):
+
+    def test_lookup(self):
+        '''
+        Tests the controller routing table lookup.
+        '''
+        controllers = [
+            {'controller': CONTROLLER, 'address': '192.168.1.100', 'port': 60000, 'protocol': 'TCP', 'timeout': 0.5},
+            {'controller': OFFLINE, 'address': '255.255.255.255', 'port': 60000, 'protocol': 'UDP'},
+        ]  # yapf: disable
+
+        u = uhppoted('0.0.0.0', '255.255.255.255:60000', '0.0.0.0:60001', controllers, 2.5, False)
+
+        self.assertEqual(u._lookup(CONTROLLER), ((CONTROLLER, '192.168.1.100:60000', 'TCP'), 0.5))
+        self.assertEqual(u._lookup(OFFLINE), ((OFFLINE, None, 'udp'), 2.5))
+        self.assertEqual(u._lookup(201020304), ((201020304, None, 'udp'), 2.5))
+
+    def test_update_controllers(self):
+        '''
+        Tests that updating the controllers replaces the routing table.
+        '''
+        u = uhppoted('0.0.0.0', '255.255.255.255:60000', '0.0.0.0:60001', [], 2.5, False)
+
+        u.controllers = [{'controller': CONTROLLER, 'address': '192.168.1.100', 'port': 60000, 'protocol': 'UDP'}]
+
+        self.assertEqual(u.controllers, [CONTROLLER])
+        self.assertEqual(u._lookup(CONTROLLER), ((CONTROLLER, '192.168.1.100:60000', 'UDP'), 2.5))
+
+
+class TestSnapshot(unittest.IsolatedAsyncioTestCase):
+
+    async def test_restore(self):
+        '''
+        Tests that a restored cache entry is served while it is refreshed in the background.
+        '''
+        api = API()
+        u = driver(api)
+        await u.get_door(CONTROLLER, 1)
+        snapshot = u.snapshot()
+
+        for v in snapshot['entries']:
+            v['expires'] -= 3600
+
+        api = API()
+        u = driver(api)
+        refreshed = asyncio.Event()
+
+        async def callback(response):
+            refreshed.set()
+
+        self.assertEqual(u.restore(snapshot), 1)
+        self.assertEqual(await u.get_door(CONTROLLER, 1, callback), GetDoorControlResponse(CONTROLLER, 1, 3, 5))
+        await asyncio.wait_for(refreshed.wait(), timeout=1.0)
+
+        self.assertEqual(len(api.requests), 1)
+        self.assertEqual(u.metrics['cache'][CONF_CACHE_EXPIRY_DOOR]['stale'], 1)
+
+        u.stop(None)
+
+
+class TestGetCardsBulk(unittest.IsolatedAsyncioTestCase):
+
+    async def test_window(self):
+        '''
+        Tests that the bulk card fetch keeps at most 'window' requests in flight and returns all the cards.
+        '''
+        api = API(delay=0.01)
+        u = driver(api)
+        u.pacing_enabled = False
+        u.card_window = 4
+        u.card_mirror = False
+
+        async def callback(response):
+            pass
+
+        cards = list(range(10058400, 10058420))
+        responses = {card: response async for (card, response, _) in u.get_cards_bulk(CONTROLLER, cards)}
+
+        self.assertEqual(sorted(responses.keys()), cards)
+        self.assertTrue(all(v.card_number == k for k, v in responses.items()))
+        self.assertEqual(api.max_inflight, 4)
+        self.assertEqual(len(api.requests), 20)
+        self.assertEqual(await u.get_card(CONTROLLER, 10058400, callback), responses[10058400])
+
+        u.stop(None)
+
+    async def test_failed_requests_are_reported(self):
+        '''
+        Tests that the bulk card fetch reports the cards that could not be refreshed.
+        '''
+        api = API(delay=0.01)
+        api.failing = {10058401}
+        u = driver(api)
+        u.pacing_enabled = False
+        u.breaker_enabled = False
+        u.card_mirror = False
+
+        cards = [10058400, 10058401, 10058402]
+        refreshed = {card: ok async for (card, _, ok) in u.get_cards_bulk(CONTROLLER, cards)}
+
+        self.assertEqual(refreshed, {10058400: True, 10058401: False, 10058402: True})
+
+        u.stop(None)
+
+
+class TestGetEvents(unittest.IsolatedAsyncioTestCase):
+
+    async def test_events_are_returned_in_order(self):
+        '''
+        Tests that the event backlog is fetched with at most 'window' requests in flight and returned in order,
+        in batches.
+        '''
+        api = API(delay=0.01)
+        u = driver(api)
+        u.pacing_enabled = False
+        u.event_window = 4
+
+        batches = [batch async for batch in u.get_events(CONTROLLER, 101, 150, 16)]
+
+        self.assertEqual([len(b) for b in batches], [16, 16, 16, 2])
+        self.assertEqual([e.index for b in batches for e in b], list(range(101, 151)))
+        self.assertEqual(api.max_inflight, 4)
+
+        u.stop(None)
+
+    async def test_stops_at_missing_event(self):
+        '''
+        Tests that the event backlog stops at the first event that could not be retrieved.
+        '''
+        api = API(delay=0.01)
+        api.missing = {110}
+        u = driver(api)
+        u.pacing_enabled = False
+        u.breaker_enabled = False
+
+        batches = [batch async for batch in u.get_events(CONTROLLER, 101, 150, 16)]
+
+        self.assertEqual([e.index for b in batches for e in b], list(range(101, 110)))
+
+        u.stop(None)
+
+
+class TestCardMirror(unittest.IsolatedAsyncioTestCase):
+
+    async def test_bulk_fetch_uses_mirror(self):
+        '''
+        Tests that the bulk card fetch sweeps the card table once and then reads the cards from the mirror.
+        '''
+        api = API(delay=0.01)
+        api.cards = {1: 10058400, 2: 0xffffffff, 3: 10058401, 4: 10058402}
+        u = driver(api)
+        u.pacing_enabled = False
+
+        cards = [10058400, 10058401, 10058402, 10058403]
+        responses = {card: response async for (card, response, _) in u.get_cards_bulk(CONTROLLER, cards)}
+
+        self.assertEqual(sorted(responses.keys()), cards)
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(u.card_mirror_status[f'{CONTROLLER}']['cards'], 3)
+
+        api.requests.clear()
+        responses = {card: response async for (card, response, _) in u.get_cards_bulk(CONTROLLER, cards, 300)}
+
+        self.assertEqual(api.requests, [])
+        self.assertEqual(responses[10058401].card_number, 10058401)
+        self.assertEqual(responses[10058401].door_1, 1)
+        self.assertEqual(responses[10058403].card_number, 0)
+
+        u.stop(None)
+
+    async def test_stale_cards_are_fetched(self):
+        '''
+        Tests that mirrored cards older than max_age are fetched from the controller and refreshed in the mirror.
+        '''
+        api = API(delay=0.01)
+        api.cards = {1: 10058400, 2: 10058401}
+        u = driver(api)
+        u.pacing_enabled = False
+        u.cache_enabled = False
+
+        await u._sweep(CONTROLLER)
+        await asyncio.sleep(0.02)
+
+        api.requests.clear()
+        cards = [10058400, 10058401]
+        refreshed = {card: ok async for (card, _, ok) in u.get_cards_bulk(CONTROLLER, cards, 0.01)}
+
+        self.assertEqual(refreshed, {10058400: True, 10058401: True})
+        self.assertEqual(api.requests, [('get-card', (CONTROLLER, None, 'udp'))] * 2)
+        self.assertLess(u._mirror.age(CONTROLLER, 10058400), 0.01)
+
+        api.requests.clear()
+        refreshed = {card: ok async for (card, _, ok) in u.get_cards_bulk(CONTROLLER, cards, 0.01)}
+
+        self.assertEqual(refreshed, {10058400: True, 10058401: True})
+        self.assertEqual(api.requests, [])
+
+        u.stop(None)
+
+    async def test_writes_during_sweep(self):
+        '''
+        Tests that card writes made during a sweep are applied to the swept mirror.
+        '''
+        api = API(delay=0.01)
+        api.cards = {1: 10058400, 2: 10058401, 3: 10058402}
+        u = driver(api)
+        u.pacing_enabled = False
+
+        sweep = asyncio.create_task(u._sweep(CONTROLLER))
+        await asyncio.sleep(0.001)
+
+        await u.put_card(CONTROLLER, 10058403, None, None, 0, 1, 0, 0, 0)
+        await u.delete_card(CONTROLLER, 10058402)
+
+        await sweep
+
+        self.assertEqual(u._mirror.get(CONTROLLER, 10058403).door_2, 1)
+        self.assertIsNone(u._mirror.get(CONTROLLER, 10058402))
+        self.assertEqual(u._mirror.get(CONTROLLER, 10058400).card_number, 10058400)
+
+        u.stop(None)
+
+    async def test_verify(self):
+        '''
+        Tests that the mirror verification detects a changed card count.
+        '''
+        api = API(delay=0.01)
+        api.cards = {1: 10058400, 2: 10058401}
+        u = driver(api)
+        u.pacing_enabled = False
+
+        await u._sweep(CONTROLLER)
+
+        self.assertTrue(await u._verify_mirror(CONTROLLER))
+
+        api.cards[3] = 10058402
+
+        self.assertFalse(await u._verify_mirror(CONTROLLER))
+
+        u.stop(None)
+
+
+if __name__ == '__main__':
+    unittest.main()